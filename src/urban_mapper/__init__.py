@@ -14,6 +14,10 @@ from .modules import (
     CSVLoader,
     ShapefileLoader,
     ParquetLoader,
+    GeoParquetLoader,
+    ArrowLoader,
+    OGRLoader,
+    PartitionedLoader,
     GeoImputerBase,
     SimpleGeoImputer,
     AddressGeoImputer,
@@ -41,6 +45,10 @@ __all__ = [
     "CSVLoader",
     "ShapefileLoader",
     "ParquetLoader",
+    "GeoParquetLoader",
+    "ArrowLoader",
+    "OGRLoader",
+    "PartitionedLoader",
     "GeoImputerBase",
     "SimpleGeoImputer",
     "AddressGeoImputer",
@@ -1,4 +1,13 @@
-from .loader import LoaderBase, CSVLoader, ShapefileLoader, ParquetLoader
+from .loader import (
+    LoaderBase,
+    CSVLoader,
+    ShapefileLoader,
+    ParquetLoader,
+    GeoParquetLoader,
+    ArrowLoader,
+    OGRLoader,
+    PartitionedLoader,
+)
 from .imputer import (
     GeoImputerBase,
     SimpleGeoImputer,
@@ -38,6 +47,10 @@ __all__ = [
     "CSVLoader",
     "ShapefileLoader",
     "ParquetLoader",
+    "GeoParquetLoader",
+    "ArrowLoader",
+    "OGRLoader",
+    "PartitionedLoader",
     "GeoImputerBase",
     "SimpleGeoImputer",
     "AddressGeoImputer",
@@ -4,7 +4,7 @@ from .aggregator import (
     CountAggregator,
     AGGREGATION_FUNCTIONS,
 )
-from .enrichers import SingleAggregatorEnricher
+from .enrichers import SingleAggregatorEnricher, RasterZonalStatisticsEnricher
 from .abc_enricher import EnricherBase
 from .enricher_factory import EnricherFactory
 from .factory.registries import register_enricher, register_aggregator
@@ -15,6 +15,7 @@ __all__ = [
     "SimpleAggregator",
     "CountAggregator",
     "SingleAggregatorEnricher",
+    "RasterZonalStatisticsEnricher",
     "EnricherFactory",
     "register_enricher",
     "register_aggregator",
@@ -30,12 +30,19 @@ Examples:
     >>> result = aggregator.aggregate(data)
 """
 
-from .aggregators import SimpleAggregator, CountAggregator, AGGREGATION_FUNCTIONS
-from .abc_aggregator import BaseAggregator
+from .aggregators import (
+    SimpleAggregator,
+    CountAggregator,
+    AGGREGATION_FUNCTIONS,
+    MERGE_FUNCTIONS,
+)
+from .abc_aggregator import BaseAggregator, AGGREGATION_BACKENDS
 
 __all__ = [
     "SimpleAggregator",
     "CountAggregator",
     "BaseAggregator",
     "AGGREGATION_FUNCTIONS",
+    "MERGE_FUNCTIONS",
+    "AGGREGATION_BACKENDS",
 ]
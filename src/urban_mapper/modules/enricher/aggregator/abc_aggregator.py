@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 import pandas as pd
 import numpy as np
 from beartype import beartype
-from urban_mapper.utils import require_arguments_not_none
+from urban_mapper.utils import require_arguments_not_none, import_duckdb
+
+AGGREGATION_BACKENDS = ["pandas", "duckdb"]
 
 
 @beartype
@@ -76,3 +79,54 @@ class BaseAggregator(ABC):
             input_dataframe = input_dataframe.explode(self.group_by_column)
 
         return self._aggregate(input_dataframe)
+
+    def _aggregate_with_duckdb(
+        self,
+        input_dataframe: pd.DataFrame,
+        aggregate_expression: str,
+        value_column: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Group and aggregate the input DataFrame in an in-process `DuckDB` database.
+
+        Groups are factorised in pandas first, so that `DuckDB` only groups integer codes,
+        and the groups keep their original labels and types. Rows whose group is missing
+        are dropped, as pandas does.
+
+        Args:
+            input_dataframe: DataFrame to aggregate.
+            aggregate_expression: `SQL` aggregate computing each group's value, over the
+                `value` column, e.g. `"avg(value)"`.
+            value_column: Column exposed as `value` to the aggregate expression, if any.
+
+        Returns:
+            DataFrame with 'value' (aggregated values) and 'indices' (row indices), indexed by group.
+
+        Raises:
+            ImportError: If `duckdb` is not installed.
+        """
+        duckdb = import_duckdb()
+        codes, groups = pd.factorize(input_dataframe[self.group_by_column], sort=True)
+        frame = pd.DataFrame({"code": codes, "position": np.arange(len(codes))})
+        if value_column is not None:
+            frame["value"] = input_dataframe[value_column].to_numpy()
+
+        connection = duckdb.connect()
+        try:
+            connection.register("input_data", frame)
+            result = connection.sql(
+                f"SELECT code, {aggregate_expression} AS value, list(position ORDER BY position) AS positions "
+                f"FROM input_data WHERE code >= 0 GROUP BY code ORDER BY code"
+            ).df()
+        finally:
+            connection.close()
+
+        index = pd.Index(
+            groups.take(result["code"].to_numpy()), name=self.group_by_column
+        )
+        indices = [
+            input_dataframe.index.take(positions).tolist()
+            for positions in result["positions"]
+        ]
+        return pd.DataFrame(
+            {"value": result["value"].to_numpy(), "indices": indices}, index=index
+        )
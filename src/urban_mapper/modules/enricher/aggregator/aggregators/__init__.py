@@ -8,10 +8,17 @@ class, each implementing a specific type of aggregation operation:
 - CountAggregator: Counts records within each group, optionally with conditions
 
 It also exports the AGGREGATION_FUNCTIONS dictionary, which provides convenient
-access to common aggregation functions (mean, sum, min, max, etc.).
+access to common aggregation functions (mean, sum, min, max, etc.), and the
+MERGE_FUNCTIONS dictionary, which combines previous results with those of new
+records for the aggregations that allow it (count, sum, min, max).
 """
 
-from .simple_aggregator import SimpleAggregator, AGGREGATION_FUNCTIONS
+from .simple_aggregator import SimpleAggregator, AGGREGATION_FUNCTIONS, MERGE_FUNCTIONS
 from .count_aggregator import CountAggregator
 
-__all__ = ["SimpleAggregator", "CountAggregator", "AGGREGATION_FUNCTIONS"]
+__all__ = [
+    "SimpleAggregator",
+    "CountAggregator",
+    "AGGREGATION_FUNCTIONS",
+    "MERGE_FUNCTIONS",
+]
@@ -1,7 +1,10 @@
 from typing import Callable, Any
 import pandas as pd
 from beartype import beartype
-from urban_mapper.modules.enricher.aggregator.abc_aggregator import BaseAggregator
+from urban_mapper.modules.enricher.aggregator.abc_aggregator import (
+    BaseAggregator,
+    AGGREGATION_BACKENDS,
+)
 from urban_mapper.utils.helpers import require_attribute_columns
 
 
@@ -18,9 +21,15 @@ class CountAggregator(BaseAggregator):
         - [x] Tallying incidents per junction
         - [x] Totting up points of interest per district
 
+    !!! note "DuckDB backend"
+        With `backend="duckdb"`, records are counted in an in-process `DuckDB` database,
+        which pays off on millions of records. Only the default `len` count can run there,
+        and `duckdb` must be installed.
+
     Attributes:
         group_by_column: Column to group data by.
         count_function: Function to count records in each group (defaults to len).
+        backend: Engine counting the records, one of `AGGREGATION_BACKENDS`. Default: `"pandas"`
 
     Examples:
         >>> import urban_mapper as um
@@ -40,9 +49,19 @@ class CountAggregator(BaseAggregator):
         self,
         group_by_column: str,
         count_function: Callable[[pd.DataFrame], Any] = len,
+        backend: str = "pandas",
     ) -> None:
+        if backend not in AGGREGATION_BACKENDS:
+            raise ValueError(
+                f"Unknown aggregation backend '{backend}'. Available: {AGGREGATION_BACKENDS}"
+            )
+        if backend == "duckdb" and count_function is not len:
+            raise ValueError(
+                "Custom count functions cannot run with the duckdb backend. Use the pandas backend."
+            )
         self.group_by_column = group_by_column
         self.count_function = count_function
+        self.backend = backend
 
     @require_attribute_columns("input_dataframe", ["group_by_column"])
     def _aggregate(self, input_dataframe: pd.DataFrame) -> pd.DataFrame:
@@ -60,6 +79,8 @@ class CountAggregator(BaseAggregator):
         Raises:
             ValueError: If required column is missing.
         """
+        if self.backend == "duckdb":
+            return self._aggregate_with_duckdb(input_dataframe, "count(*)")
         grouped = input_dataframe.groupby(self.group_by_column)
         values = grouped.apply(self.count_function)
         indices = grouped.apply(lambda g: list(g.index))
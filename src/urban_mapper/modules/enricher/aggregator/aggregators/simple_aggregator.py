@@ -1,7 +1,11 @@
 from typing import Callable, Dict
+import numpy as np
 import pandas as pd
 from beartype import beartype
-from urban_mapper.modules.enricher.aggregator.abc_aggregator import BaseAggregator
+from urban_mapper.modules.enricher.aggregator.abc_aggregator import (
+    BaseAggregator,
+    AGGREGATION_BACKENDS,
+)
 
 
 AGGREGATION_FUNCTIONS: Dict[str, Callable[[pd.Series], float]] = {
@@ -12,6 +16,21 @@ AGGREGATION_FUNCTIONS: Dict[str, Callable[[pd.Series], float]] = {
     "max": pd.Series.max,
 }
 
+DUCKDB_AGGREGATES: Dict[str, str] = {
+    "mean": "avg(value)",
+    "sum": "coalesce(sum(value), 0)",
+    "median": "median(value)",
+    "min": "min(value)",
+    "max": "max(value)",
+}
+
+MERGE_FUNCTIONS: Dict[str, Callable[[pd.Series, pd.Series], pd.Series]] = {
+    "count": lambda previous, new: previous.fillna(0) + new.fillna(0),
+    "sum": lambda previous, new: previous.fillna(0) + new.fillna(0),
+    "min": np.fmin,
+    "max": np.fmax,
+}
+
 
 @beartype
 class SimpleAggregator(BaseAggregator):
@@ -28,10 +47,16 @@ class SimpleAggregator(BaseAggregator):
         Simply pass you own function receiving a series as parameter per the `aggregation_function` argument.
         Within the factory it'll be throughout `aggregate_by(.)` and `method` argument.
 
+    !!! note "DuckDB backend"
+        With `backend="duckdb"`, groups are aggregated in an in-process `DuckDB` database,
+        vectorised and multi-threaded, which pays off on millions of records. Only the
+        functions of `AGGREGATION_FUNCTIONS` can run there, and `duckdb` must be installed.
+
     Attributes:
         group_by_column: Column to group by.
         value_column: Column with values to aggregate.
         aggregation_function: Function to apply to grouped values.
+        backend: Engine aggregating the groups, one of `AGGREGATION_BACKENDS`. Default: `"pandas"`
 
     Examples:
         >>> import urban_mapper as um
@@ -52,10 +77,24 @@ class SimpleAggregator(BaseAggregator):
         group_by_column: str,
         value_column: str,
         aggregation_function: Callable[[pd.Series], float],
+        backend: str = "pandas",
     ) -> None:
+        if backend not in AGGREGATION_BACKENDS:
+            raise ValueError(
+                f"Unknown aggregation backend '{backend}'. Available: {AGGREGATION_BACKENDS}"
+            )
+        if backend == "duckdb" and not any(
+            aggregation_function is function
+            for function in AGGREGATION_FUNCTIONS.values()
+        ):
+            raise ValueError(
+                f"Custom aggregation functions cannot run with the duckdb backend. "
+                f"Use one of {list(AGGREGATION_FUNCTIONS.keys())}, or the pandas backend."
+            )
         self.group_by_column = group_by_column
         self.value_column = value_column
         self.aggregation_function = aggregation_function
+        self.backend = backend
 
     def _aggregate(self, input_dataframe: pd.DataFrame) -> pd.DataFrame:
         """Aggregate data with the aggregation function.
@@ -71,6 +110,15 @@ class SimpleAggregator(BaseAggregator):
         Raises:
             KeyError: If required columns are missing.
         """
+        if self.backend == "duckdb":
+            method = next(
+                name
+                for name, function in AGGREGATION_FUNCTIONS.items()
+                if function is self.aggregation_function
+            )
+            return self._aggregate_with_duckdb(
+                input_dataframe, DUCKDB_AGGREGATES[method], self.value_column
+            )
         grouped = input_dataframe.groupby(self.group_by_column)
         aggregated = grouped[self.value_column].agg(self.aggregation_function)
         indices = grouped.apply(lambda g: list(g.index))
@@ -1,11 +1,13 @@
 from typing import Optional, Union
 from beartype import beartype
 from .abc_enricher import EnricherBase
-from .aggregator import SimpleAggregator, CountAggregator
+from .aggregator import SimpleAggregator, CountAggregator, AGGREGATION_BACKENDS
 from .factory.config import EnricherConfig
 from .factory.validation import (
     validate_group_by,
     validate_action,
+    validate_merge,
+    validate_raster,
 )
 from .factory.registries import ENRICHER_REGISTRY, register_enricher
 from urban_mapper.modules.enricher.aggregator.aggregators.simple_aggregator import (
@@ -100,6 +102,75 @@ class EnricherFactory:
         self.config.debug = debug
         return self
 
+    def with_merge(self, merge: bool = True) -> "EnricherFactory":
+        """Toggle merging of results into the existing output column.
+
+        With merge on, enriching a layer that already holds the output column combines the
+        existing values with those computed from the input data, rather than overwriting them:
+        counts and sums are added up, minimums and maximums kept. Together with incremental
+        loads (see `LoaderFactory.with_incremental()`), only the newly appended records need
+        enriching, and the layer stays up to date.
+
+        !!! note "Mergeable aggregations"
+            Only `count_by()`, and `aggregate_by()` with `sum`, `min` or `max`, can be merged.
+            With `min` and `max`, groups without any record are left empty rather than set to `0`.
+            Debug indices, if any, only refer to the latest input data.
+
+        Args:
+            merge: Whether to merge results (default: True).
+
+        Returns:
+            The EnricherFactory instance for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> enricher = mapper.enricher\
+            ...     .with_data(group_by="nearest_street")\
+            ...     .count_by(output_column="trip_count")\
+            ...     .with_merge()\
+            ...     .build()
+            >>> streets = enricher.enrich(new_trips, streets)  # Adds the new trips to the counts
+        """
+        self.config.merge = merge
+        return self
+
+    def with_backend(self, backend: str = "duckdb") -> "EnricherFactory":
+        """Choose the engine aggregating the groups.
+
+        By default, groups are aggregated by pandas. With `"duckdb"`, they are aggregated in
+        an in-process `DuckDB` database, vectorised and multi-threaded, which pays off when
+        enriching with millions of records.
+
+        !!! note "Optional dependency"
+            The `duckdb` backend requires `duckdb`, which is not installed with `UrbanMapper`.
+            Install it with `uv add duckdb`. Custom aggregation functions only run with pandas.
+
+        Args:
+            backend: One of `"pandas"` or `"duckdb"` (default: "duckdb").
+
+        Returns:
+            The EnricherFactory instance for chaining.
+
+        Raises:
+            ValueError: If the backend is unknown.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> enricher = mapper.enricher\
+            ...     .with_data(group_by="nearest_street", values_from="fare")\
+            ...     .aggregate_by(method="mean", output_column="avg_fare")\
+            ...     .with_backend("duckdb")\
+            ...     .build()
+        """
+        if backend not in AGGREGATION_BACKENDS:
+            raise ValueError(
+                f"Unknown aggregation backend '{backend}'. Available: {', '.join(AGGREGATION_BACKENDS)}."
+            )
+        self.config.aggregator_backend = backend
+        return self
+
     def aggregate_by(self, *args, **kwargs) -> "EnricherFactory":
         """Set the enricher to perform aggregation operations.
 
@@ -152,14 +223,75 @@ class EnricherFactory:
         self.config.count_by(*args, **kwargs)
         return self
 
+    def with_raster(self, *args, **kwargs) -> "EnricherFactory":
+        """Specify the raster to summarise over the urban layer's geometries.
+
+        Switches to the `RasterZonalStatisticsEnricher`, which reads the raster itself rather
+        than the loaded data. See `zonal_statistics()` for the statistics computed.
+
+        Args:
+            *args: Positional args for EnricherConfig.with_raster.
+            **kwargs: Keyword args like `file_path`, `band`, `buffer`, `all_touched` and `resolution`.
+
+        Returns:
+            The EnricherFactory instance for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> enricher = mapper.enricher.with_raster("land_surface_temperature.tif", band=1)
+        """
+        self.config.with_raster(*args, **kwargs)
+        return self
+
+    def zonal_statistics(self, *args, **kwargs) -> "EnricherFactory":
+        """Set the enricher to compute zonal statistics of the raster.
+
+        Summarises the pixels of the raster set by `with_raster()` within each geometry of
+        the urban layer, adding one column per statistic. Polygons are summarised as they
+        are, while lines and points are buffered into zones first, e.g. to get the mean
+        temperature along each street.
+
+        !!! tip "Available Statistics"
+
+            - [x] `count`
+            - [x] `sum`
+            - [x] `mean`
+            - [x] `min`
+            - [x] `max`
+            - [x] `std`
+            - [x] `median`
+            - [x] Percentiles, e.g. `p10` or `p90`
+
+        Args:
+            *args: Positional args for EnricherConfig.zonal_statistics.
+            **kwargs: Keyword args like `statistics` and `output_column`.
+
+        Returns:
+            The EnricherFactory instance for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> neighbourhoods = mapper.urban_layer.region_neighborhoods().from_place("New York, USA")
+            >>> neighbourhoods = mapper.enricher\
+            ...     .with_raster("land_surface_temperature.tif")\
+            ...     .zonal_statistics(["mean", "p90"], output_column="lst")\
+            ...     .build()\
+            ...     .enrich(None, neighbourhoods)  # Adds lst_mean and lst_p90
+        """
+        self.config.zonal_statistics(*args, **kwargs)
+        return self
+
     def with_type(self, primitive_type: str) -> "EnricherFactory":
         """Choose the enricher type to create.
 
         Sets the type of enricher, dictating the enrichment approach, from the registry.
 
-        !!! note "At the moment only one exists"
+        !!! note "Available Enrichers"
 
             - [x] `SingleAggregatorEnricher` (default)
+            - [x] `RasterZonalStatisticsEnricher`, set by `with_raster()`
 
             Hence, no need use `with_type` unless you want to use a different one in the future.
             Furthermore, we kept it for compatibility with other modules.
@@ -271,8 +403,21 @@ class EnricherFactory:
             ...     .count_by(output_column="pickup_count")\
             ...     .build()
         """
-        validate_group_by(self.config)
         validate_action(self.config)
+        if self.config.action == "zonal_statistics":
+            validate_raster(self.config)
+            enricher_class = ENRICHER_REGISTRY[self.config.enricher_type]
+            self._instance = enricher_class(config=self.config)
+            if self._preview:
+                self.preview(format=self._preview["format"])
+            return self._instance
+
+        if self.config.raster:
+            raise ValueError(
+                "A raster set by with_raster() is summarised by zonal_statistics()."
+            )
+        validate_group_by(self.config)
+        validate_merge(self.config)
 
         if self.config.action == "aggregate":
             method = self.config.aggregator_config["method"]
@@ -288,11 +433,13 @@ class EnricherFactory:
                 group_by_column=self.config.group_by[0],
                 value_column=self.config.values_from[0],
                 aggregation_function=aggregation_function,
+                backend=self.config.aggregator_backend,
             )
         elif self.config.action == "count":
             aggregator = CountAggregator(
                 group_by_column=self.config.group_by[0],
                 count_function=len,
+                backend=self.config.aggregator_backend,
             )
         else:
             raise ValueError(
@@ -1,5 +1,7 @@
 from .single_aggregator_enricher import SingleAggregatorEnricher
+from .raster_zonal_statistics_enricher import RasterZonalStatisticsEnricher
 
 __all__ = [
     "SingleAggregatorEnricher",
+    "RasterZonalStatisticsEnricher",
 ]
@@ -0,0 +1,560 @@
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import geopandas as gpd
+import numpy as np
+import rasterio
+import shapely
+from affine import Affine
+from beartype import beartype
+from rasterio.features import rasterize
+from rasterio.windows import Window, transform as window_transform
+
+from urban_mapper import logger
+from urban_mapper.modules.enricher.factory import PreviewBuilder, ENRICHER_REGISTRY
+from urban_mapper.modules.enricher.factory.validation import PERCENTILE_STATISTIC
+from urban_mapper.modules.urban_layer.abc_urban_layer import UrbanLayerBase
+from urban_mapper.modules.enricher.abc_enricher import EnricherBase
+from urban_mapper.modules.enricher.factory.config import EnricherConfig
+from urban_mapper.utils import (
+    block_window_pixels,
+    block_windows,
+    bounds_window,
+    feature_resolution,
+    map_block_windows,
+    open_raster,
+    overview_level,
+    raster_window,
+    valid_pixel_mask,
+)
+
+DEFAULT_MAX_MEMORY = "512MB"
+# Working memory of a pixel besides its value: masks, zone label, value and sort key.
+PIXEL_BYTES = 32
+# Finest sub-pixel grid zones are burnt onto to weigh overview pixels by their coverage.
+MAX_SUPERSAMPLING = 4
+
+
+@beartype
+class RasterZonalStatisticsEnricher(EnricherBase):
+    """Enricher Summarising `A Raster` Within Each `Urban Layer` Geometry.
+
+    Computes zonal statistics (`count`, `sum`, `mean`, `min`, `max`, `std`, `median` and
+    percentiles such as `p90`) of a raster band over each geometry of the urban layer, e.g.
+    the mean land surface temperature of each neighbourhood, or of each street.
+
+    Geometries are reprojected to the raster's coordinate reference system and burnt onto
+    its pixel grid, lines and points being buffered into zones first. Every pixel is thereby
+    labelled with its zone, and the statistics reduced over all zones at once with `NumPy`,
+    never pixel by pixel nor zone by zone. Overlapping zones are burnt in as few separate
+    passes as needed for every pixel to count towards each zone covering it.
+
+    !!! note "Memory"
+        Only the window covering the urban layer is read, in groups of whole internal blocks,
+        and groups without any zone are skipped. Groups are reduced to per-zone partial
+        statistics in a pool of `max_workers` threads, then combined, so that peak memory is
+        set by `max_memory` rather than by the size of the raster. Percentiles are the
+        exception: they keep every pixel within a zone until the end, packed with its zone
+        into 8 bytes, in single precision.
+
+    !!! note "Overviews"
+        With a `resolution`, a number or `"auto"` for a tenth of the urban layer's typical
+        feature size, statistics are computed from the coarsest internal overview of the raster
+        still at least as fine as it, e.g. reading 256 times fewer pixels from the 1/16 overview.
+        Overview pixels are weighted by the share of them each zone covers, measured on a grid
+        up to `MAX_SUPERSAMPLING` times finer, and `count` and `sum` are scaled to full
+        resolution pixels, so that they remain area-weighted: `count` becomes the covered area
+        in full resolution pixels, and `mean` the area-weighted mean. `min`, `max`, `std` and
+        percentiles are those of the overview's pixels, smoothed by its resampling. Rasters
+        without overviews are read at full resolution, see `urban_mapper.utils.build_overviews()`.
+
+    Attributes:
+        config: Config object for the enricher.
+        file_path: Path to the raster.
+        band: Index of the band summarised, starting at 1.
+        buffer: Distance by which lines and points are buffered, in the raster's units, or
+            `None` for half a pixel.
+        all_touched: Whether every pixel touched by a zone counts towards it.
+        statistics: Names of the statistics computed.
+        output_column: Prefix of the output columns.
+        max_memory: Peak working memory of the blocks being read, in bytes or as a size such
+            as `"2GB"`, `DEFAULT_MAX_MEMORY` if `None`.
+        max_workers: Number of groups of blocks processed concurrently, the number of CPUs if `None`.
+        resolution: Resolution the statistics are computed at, in the raster's units, `"auto"` to
+            derive it from the zones, or `None` for the full resolution.
+
+    Examples:
+        >>> import urban_mapper as um
+        >>> mapper = um.UrbanMapper()
+        >>> neighbourhoods = mapper.urban_layer.region_neighborhoods().from_place("New York, USA")
+        >>> enricher = mapper.enricher\
+        ...     .with_raster("land_surface_temperature.tif")\
+        ...     .zonal_statistics(["mean", "max", "p90"], output_column="lst")\
+        ...     .build()
+        >>> neighbourhoods = enricher.enrich(None, neighbourhoods)
+    """
+
+    def __init__(self, config: EnricherConfig = None) -> None:
+        super().__init__(config)
+        self.file_path = Path(self.config.raster["file_path"])
+        self.band = self.config.raster["band"]
+        self.buffer = self.config.raster["buffer"]
+        self.all_touched = self.config.raster["all_touched"]
+        self.max_memory = self.config.raster["max_memory"]
+        self.max_workers = self.config.raster["max_workers"]
+        self.resolution = self.config.raster["resolution"]
+        self.statistics = self.config.aggregator_config["statistics"]
+        self.output_column = (
+            self.config.enricher_config.get("output_column") or self.file_path.stem
+        )
+
+    def enrich(
+        self,
+        input_geodataframe: Optional[
+            Union[Dict[str, gpd.GeoDataFrame], gpd.GeoDataFrame]
+        ],
+        urban_layer: UrbanLayerBase,
+        **kwargs,
+    ) -> UrbanLayerBase:
+        """Enrich an `urban layer` with zonal statistics of the raster.
+
+        The raster is read by the enricher itself: the input data, loaded or not, is ignored,
+        and the statistics are computed once, whatever the number of datasets.
+
+        Args:
+            input_geodataframe: Ignored, kept for compatibility with the pipeline. May be `None`.
+            urban_layer: Urban layer whose geometries are the zones.
+            **kwargs: Extra params for customisation.
+
+        Returns:
+            The urban layer with one new column per statistic.
+        """
+        return self._enrich(input_geodataframe, urban_layer, **kwargs)
+
+    def _enrich(
+        self,
+        input_geodataframe: Optional[
+            Union[Dict[str, gpd.GeoDataFrame], gpd.GeoDataFrame]
+        ],
+        urban_layer: UrbanLayerBase,
+        **kwargs,
+    ) -> UrbanLayerBase:
+        """Compute the zonal statistics of the raster over the urban layer's geometries.
+
+        Zones without any valid pixel get a `count` of 0, and `NaN` for the other statistics.
+
+        Args:
+            input_geodataframe: Ignored.
+            urban_layer: Urban layer to enrich.
+            **kwargs: Extra params for customisation.
+
+        Returns:
+            Enriched urban layer with new columns.
+
+        Raises:
+            ValueError: If the band does not exist in the raster.
+            rasterio.errors.RasterioIOError: If the raster cannot be read.
+        """
+        layer = urban_layer.layer
+        with rasterio.open(self.file_path) as dataset:
+            if not 1 <= self.band <= dataset.count:
+                raise ValueError(
+                    f"Band {self.band} does not exist, {self.file_path} has {dataset.count} band(s)."
+                )
+            zones = self._zones(layer, dataset)
+            level = self._overview_level(dataset, zones)
+            pixel_area = abs(dataset.res[0] * dataset.res[1])
+        with open_raster(self.file_path, level) as dataset:
+            statistics = self._zonal_statistics(
+                dataset, zones, level, abs(dataset.res[0] * dataset.res[1]) / pixel_area
+            )
+        for name, values in statistics.items():
+            layer[f"{self.output_column}_{name}"] = values
+        return urban_layer
+
+    def _zones(self, layer: gpd.GeoDataFrame, dataset: Any) -> np.ndarray:
+        """Reproject the layer's geometries to the raster and buffer lines and points into zones."""
+        geometries = layer.geometry
+        if dataset.crs is not None and layer.crs is not None:
+            geometries = geometries.to_crs(dataset.crs)
+        zones = geometries.values.to_numpy().copy()
+        to_buffer = np.isin(
+            shapely.get_type_id(zones),
+            [
+                shapely.GeometryType.POINT,
+                shapely.GeometryType.LINESTRING,
+                shapely.GeometryType.LINEARRING,
+                shapely.GeometryType.MULTIPOINT,
+                shapely.GeometryType.MULTILINESTRING,
+            ],
+        )
+        if to_buffer.any():
+            buffer = self.buffer
+            if buffer is None:
+                buffer = max(abs(dataset.res[0]), abs(dataset.res[1])) / 2
+            zones[to_buffer] = shapely.buffer(zones[to_buffer], buffer)
+        return zones
+
+    def _overview_level(self, dataset: Any, zones: np.ndarray) -> Optional[int]:
+        """Pick the internal overview matching `resolution`, `None` for the full resolution."""
+        if self.resolution is None:
+            return None
+        resolution = self.resolution
+        if resolution == "auto":
+            resolution = feature_resolution(zones)
+            if resolution is None:
+                return None
+        level = overview_level(dataset, resolution, self.band)
+        logger.log(
+            "DEBUG_LOW",
+            f"RasterZonalStatisticsEnricher: reading overview {level} of {self.file_path} "
+            f"for a {resolution:g} resolution",
+        )
+        return level
+
+    def _zonal_statistics(
+        self,
+        dataset: Any,
+        zones: np.ndarray,
+        level: Optional[int] = None,
+        area_ratio: float = 1.0,
+    ) -> Dict[str, np.ndarray]:
+        """Accumulate the statistics of every zone, group of blocks by group of blocks.
+
+        Args:
+            dataset: The open raster, at full resolution or at the overview `level`.
+            zones: The zones, in the raster's coordinate reference system.
+            level: Index of the overview `dataset` is, `None` for the full resolution.
+            area_ratio: Area of a pixel of `dataset` over that of a full resolution pixel.
+
+        Returns:
+            The values of every statistic, one per zone.
+        """
+        supersampling = 1
+        if level is not None and not self.all_touched:
+            supersampling = int(
+                min(MAX_SUPERSAMPLING, max(1, round(np.sqrt(area_ratio))))
+            )
+        zone_count = len(zones)
+        count = np.zeros(
+            zone_count + 1, dtype=np.int64 if level is None else np.float64
+        )
+        total = np.zeros(zone_count + 1)
+        squares = np.zeros(zone_count + 1)
+        minimum = np.full(zone_count + 1, np.inf)
+        maximum = np.full(zone_count + 1, -np.inf)
+        sort_keys: List[np.ndarray] = []
+        keep_values = any(
+            self._percentile(name) is not None for name in self.statistics
+        )
+
+        present = ~shapely.is_missing(zones) & ~shapely.is_empty(zones)
+        window = (
+            raster_window(dataset, tuple(shapely.total_bounds(zones[present])))
+            if present.any()
+            else None
+        )
+        tree = shapely.STRtree(zones)
+        groups, windows = [], []
+        if window is not None:
+            groups = self._non_overlapping_groups(zones, tree)
+            windows = [
+                block_window
+                for block_window in block_windows(
+                    dataset,
+                    window,
+                    block_window_pixels(
+                        self.max_memory or DEFAULT_MAX_MEMORY,
+                        np.dtype(dataset.dtypes[self.band - 1]).itemsize
+                        + PIXEL_BYTES * supersampling**2,
+                        self.max_workers or os.cpu_count() or 1,
+                    ),
+                )
+                if len(tree.query(shapely.box(*dataset.window_bounds(block_window))))
+            ]
+        partials = map_block_windows(
+            self.file_path,
+            windows,
+            lambda block_dataset, block_window: self._block_statistics(
+                block_dataset,
+                block_window,
+                zones,
+                tree,
+                groups,
+                keep_values,
+                supersampling,
+            ),
+            self.max_workers,
+            level,
+        )
+        for partial in partials:
+            if partial is None:
+                continue
+            ids = partial["ids"]
+            count[ids] += partial["count"]
+            total[ids] += partial["sum"]
+            squares[ids] += partial["squares"]
+            minimum[ids] = np.minimum(minimum[ids], partial["min"])
+            maximum[ids] = np.maximum(maximum[ids], partial["max"])
+            if keep_values:
+                sort_keys.append(partial["sort_keys"])
+
+        count, total, squares = count[1:], total[1:], squares[1:]
+        if level is not None:
+            count, total, squares = (
+                count * area_ratio,
+                total * area_ratio,
+                squares * area_ratio,
+            )
+        covered = count > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.where(covered, total / count, np.nan)
+            variance = np.where(covered, squares / count - mean * mean, np.nan)
+        reductions = {
+            "count": count,
+            "sum": np.where(covered, total, np.nan),
+            "mean": mean,
+            "min": np.where(covered, minimum[1:], np.nan),
+            "max": np.where(covered, maximum[1:], np.nan),
+            "std": np.sqrt(np.clip(variance, 0, None)),
+        }
+        if keep_values:
+            sort_keys = (
+                np.concatenate(sort_keys) if sort_keys else np.empty(0, np.uint64)
+            )
+            sort_keys.sort()
+            key_count = np.bincount(
+                (sort_keys >> np.uint64(32)).astype(np.int64),
+                minlength=zone_count + 1,
+            )[1:]
+        statistics = {}
+        for name in self.statistics:
+            percentile = self._percentile(name)
+            if percentile is None:
+                statistics[name] = reductions[name]
+            else:
+                statistics[name] = self._percentiles(percentile, key_count, sort_keys)
+        logger.log(
+            "DEBUG_LOW",
+            f"RasterZonalStatisticsEnricher: summarised {count.sum():g} pixels of "
+            f"{self.file_path} over {int(covered.sum())}/{zone_count} zones",
+        )
+        return statistics
+
+    def _block_statistics(
+        self,
+        dataset: Any,
+        window: Window,
+        zones: np.ndarray,
+        tree: shapely.STRtree,
+        groups: List[np.ndarray],
+        keep_values: bool,
+        supersampling: int = 1,
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """Reduce the pixels of a group of blocks to partial statistics of the zones they fall in.
+
+        With a `supersampling` above 1, pixels are weighted by the share of them each zone
+        covers, see `_coverage()`.
+
+        Returns:
+            The `ids` of the zones found, plus one, and their pixel `count`, `sum`, sum of
+            `squares`, `min` and `max`, and, if `keep_values`, the pixels' `sort_keys`. `None`
+            if no valid pixel falls in any zone.
+        """
+        in_window = np.zeros(len(zones), dtype=bool)
+        in_window[tree.query(shapely.box(*dataset.window_bounds(window)))] = True
+        data = dataset.read(self.band, window=window)
+        valid = valid_pixel_mask(data[np.newaxis], [dataset.nodatavals[self.band - 1]])
+        transform = dataset.window_transform(window)
+        labels_found, values_found, weights_found = [], [], []
+        for group in groups:
+            members = group[in_window[group]]
+            if not len(members):
+                continue
+            extent = bounds_window(
+                tuple(shapely.total_bounds(zones[members])),
+                transform,
+                int(window.width),
+                int(window.height),
+            )
+            if extent is None:
+                continue
+            rows, columns = extent.toslices()
+            if supersampling > 1:
+                labels, pixels, weights = self._coverage(
+                    zones[members], members + 1, extent, transform, supersampling
+                )
+                within = valid[rows, columns].ravel()[pixels]
+                labels_found.append(labels[within])
+                values_found.append(data[rows, columns].ravel()[pixels][within])
+                weights_found.append(weights[within])
+                continue
+            labels = rasterize(
+                zip(zones[members], members + 1),
+                out_shape=(extent.height, extent.width),
+                transform=window_transform(extent, transform),
+                fill=0,
+                all_touched=self.all_touched,
+                dtype="int32",
+            )
+            within = valid[rows, columns] & (labels > 0)
+            labels_found.append(labels[within])
+            values_found.append(data[rows, columns][within])
+        if not labels_found or not sum(len(labels) for labels in labels_found):
+            return None
+
+        labels, raw_values = np.concatenate(labels_found), np.concatenate(values_found)
+        ids, inverse = np.unique(labels, return_inverse=True)
+        values = raw_values.astype(np.float64)
+        weights = np.concatenate(weights_found) if weights_found else None
+        weighted_values = values if weights is None else values * weights
+        minimum = np.full(len(ids), np.inf)
+        maximum = np.full(len(ids), -np.inf)
+        np.minimum.at(minimum, inverse, values)
+        np.maximum.at(maximum, inverse, values)
+        partial = {
+            "ids": ids,
+            "count": np.bincount(inverse, weights, minlength=len(ids)),
+            "sum": np.bincount(inverse, weighted_values, minlength=len(ids)),
+            "squares": np.bincount(
+                inverse, weighted_values * values, minlength=len(ids)
+            ),
+            "min": minimum,
+            "max": maximum,
+        }
+        if keep_values:
+            partial["sort_keys"] = self._sort_keys(labels, raw_values)
+        return partial
+
+    @staticmethod
+    def _coverage(
+        zones: np.ndarray,
+        labels: np.ndarray,
+        window: Window,
+        transform: Affine,
+        supersampling: int,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Measure the share of every pixel of a window each zone covers.
+
+        Zones are burnt onto a grid `supersampling` times finer than the pixels, and the
+        sub-pixels of every zone counted per pixel.
+
+        Returns:
+            The `labels` of the zones, the flat indexes of the pixels within `window`, and the
+            shares of the pixels covered, one entry per pair of a zone and a pixel it covers.
+        """
+        height, width = int(window.height), int(window.width)
+        fine = rasterize(
+            zip(zones, labels),
+            out_shape=(height * supersampling, width * supersampling),
+            transform=window_transform(window, transform)
+            * Affine.scale(1 / supersampling),
+            fill=0,
+            dtype="int32",
+        )
+        fine_rows, fine_columns = np.nonzero(fine)
+        pixels = (fine_rows // supersampling) * width + fine_columns // supersampling
+        keys, counts = np.unique(
+            fine[fine_rows, fine_columns].astype(np.int64) * (height * width) + pixels,
+            return_counts=True,
+        )
+        return (
+            keys // (height * width),
+            keys % (height * width),
+            counts / supersampling**2,
+        )
+
+    def _non_overlapping_groups(
+        self, zones: np.ndarray, tree: shapely.STRtree
+    ) -> List[np.ndarray]:
+        """Split the zones into groups whose zones do not overlap, to be burnt in one pass each.
+
+        Zones only sharing a boundary may be burnt together, unless `all_touched` is on, as a
+        pixel then counts towards every zone it touches. Groups are formed greedily, each zone
+        joining the first group none of its overlapping zones belongs to.
+        """
+        left, right = tree.query(zones, predicate="intersects")
+        distinct = left < right
+        left, right = left[distinct], right[distinct]
+        if not self.all_touched and len(left):
+            overlapping = shapely.relate_pattern(zones[left], zones[right], "T********")
+            left, right = left[overlapping], right[overlapping]
+        if not len(left):
+            return [np.flatnonzero(~shapely.is_missing(zones))]
+
+        neighbours: Dict[int, List[int]] = {}
+        for a, b in zip(left.tolist(), right.tolist()):
+            neighbours.setdefault(a, []).append(b)
+            neighbours.setdefault(b, []).append(a)
+        group_of = np.full(len(zones), -1)
+        groups: List[List[int]] = []
+        for position in np.flatnonzero(~shapely.is_missing(zones)).tolist():
+            taken = {group_of[other] for other in neighbours.get(position, [])}
+            group = next(
+                index for index in range(len(groups) + 1) if index not in taken
+            )
+            if group == len(groups):
+                groups.append([])
+            groups[group].append(position)
+            group_of[position] = group
+        logger.log(
+            "DEBUG_MID",
+            f"RasterZonalStatisticsEnricher: {len(left)} overlapping pairs of zones, "
+            f"burnt in {len(groups)} passes",
+        )
+        return [np.asarray(group) for group in groups]
+
+    @staticmethod
+    def _percentile(name: str) -> Optional[float]:
+        """Get the percentile a statistic stands for, e.g. 90 for `p90` and 50 for `median`."""
+        if name == "median":
+            return 50.0
+        match = PERCENTILE_STATISTIC.match(name)
+        return float(match.group(1)) if match else None
+
+    @staticmethod
+    def _sort_keys(ids: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Pack zone ids and values into keys sorting by zone, then by value.
+
+        The zone id takes the upper 32 bits, and the value, in single precision, the lower
+        32 bits, its sign flipped so that the unsigned order of the bits is that of the values.
+        """
+        bits = values.astype(np.float32).view(np.uint32)
+        bits = np.where(bits >> 31, ~bits, bits | np.uint32(0x80000000))
+        return (ids.astype(np.uint64) << np.uint64(32)) | bits.astype(np.uint64)
+
+    @staticmethod
+    def _key_values(keys: np.ndarray) -> np.ndarray:
+        """Unpack the values of keys packed by `_sort_keys()`."""
+        bits = (keys & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+        bits = np.where(bits >> 31, bits & np.uint32(0x7FFFFFFF), ~bits)
+        return bits.view(np.float32).astype(np.float64)
+
+    def _percentiles(
+        self, percentile: float, count: np.ndarray, sort_keys: np.ndarray
+    ) -> np.ndarray:
+        """Interpolate a percentile of every zone at once, from the keys sorted by zone and value."""
+        result = np.full(len(count), np.nan)
+        covered = count > 0
+        starts = np.concatenate([[0], np.cumsum(count)[:-1]])[covered]
+        rank = percentile / 100 * (count[covered] - 1)
+        lower, upper = np.floor(rank).astype(np.int64), np.ceil(rank).astype(np.int64)
+        lower_values = self._key_values(sort_keys[starts + lower])
+        upper_values = self._key_values(sort_keys[starts + upper])
+        result[covered] = lower_values + (upper_values - lower_values) * (rank - lower)
+        return result
+
+    def preview(self, format: str = "ascii") -> Any:
+        """Generate a preview of this enricher.
+
+        Creates a summary for quick inspection.
+
+        Args:
+            format: Output format—"ascii" (text) or "json" (dict).
+
+        Returns:
+            Preview in the requested format.
+        """
+        preview_builder = PreviewBuilder(self.config, ENRICHER_REGISTRY)
+        return preview_builder.build_preview(format=format)
@@ -1,12 +1,17 @@
 from typing import Any
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
 from beartype import beartype
 
 from urban_mapper.modules.enricher.factory import PreviewBuilder, ENRICHER_REGISTRY
 from urban_mapper.modules.urban_layer.abc_urban_layer import UrbanLayerBase
 from urban_mapper.modules.enricher.abc_enricher import EnricherBase
 from urban_mapper.modules.enricher.aggregator.abc_aggregator import BaseAggregator
+from urban_mapper.modules.enricher.aggregator.aggregators.simple_aggregator import (
+    MERGE_FUNCTIONS,
+)
 from urban_mapper.modules.enricher.factory.config import EnricherConfig
 
 
@@ -22,6 +27,8 @@ class SingleAggregatorEnricher(EnricherBase):
         aggregator: Aggregator computing stats or counts.
         output_column: Column name for aggregated results.
         debug: Whether to include debug info.
+        merge: Whether to merge results into an existing `output_column` (counts and sums added up,
+            minimums and maximums kept) rather than overwrite it.
 
     Examples:
         >>> import urban_mapper as um
@@ -47,6 +54,16 @@ class SingleAggregatorEnricher(EnricherBase):
         self.aggregator = aggregator
         self.output_column = output_column
         self.debug = config.debug
+        self.merge = config.merge
+        self._merge_function = (
+            MERGE_FUNCTIONS[
+                "count"
+                if config.action == "count"
+                else config.aggregator_config.get("method")
+            ]
+            if self.merge
+            else None
+        )
 
     def _enrich(
         self,
@@ -57,6 +74,8 @@ class SingleAggregatorEnricher(EnricherBase):
         """Enrich an `urban layer` with an `aggregator`.
 
         Aggregates data from the input `GeoDataFrame` and adds it to the urban layer.
+        With `merge` on, the results are merged into the existing output column, and an
+        empty input leaves the layer as it is.
 
         Args:
             input_geodataframe: `GeoDataFrame` with enrichment data.
@@ -69,10 +88,23 @@ class SingleAggregatorEnricher(EnricherBase):
         Raises:
             ValueError: If aggregation fails.
         """
-        aggregated_df = self.aggregator.aggregate(input_geodataframe)
-        enriched_values = (
-            aggregated_df["value"].reindex(urban_layer.layer.index).fillna(0)
+        previous_values = (
+            urban_layer.layer[self.output_column]
+            if self.output_column in urban_layer.layer.columns
+            else pd.Series(np.nan, index=urban_layer.layer.index)
         )
+        if self._merge_function is not None and input_geodataframe.empty:
+            urban_layer.layer[self.output_column] = self._merge_function(
+                previous_values, pd.Series(np.nan, index=urban_layer.layer.index)
+            )
+            return urban_layer
+
+        aggregated_df = self.aggregator.aggregate(input_geodataframe)
+        enriched_values = aggregated_df["value"].reindex(urban_layer.layer.index)
+        if self._merge_function is None:
+            enriched_values = enriched_values.fillna(0)
+        else:
+            enriched_values = self._merge_function(previous_values, enriched_values)
         urban_layer = self.set_layer_data_source(urban_layer, aggregated_df.index)
         urban_layer.layer[self.output_column] = enriched_values
         if self.debug:
@@ -10,6 +10,10 @@ from .validation import (
     validate_group_by,
     validate_action,
     validate_aggregation_method,
+    validate_merge,
+    validate_zonal_statistics,
+    validate_raster,
+    ZONAL_STATISTICS,
 )
 
 from .preview import PreviewBuilder
@@ -23,5 +27,9 @@ __all__ = [
     "validate_group_by",
     "validate_action",
     "validate_aggregation_method",
+    "validate_merge",
+    "validate_zonal_statistics",
+    "validate_raster",
+    "ZONAL_STATISTICS",
     "PreviewBuilder",
 ]
@@ -1,6 +1,7 @@
 from typing import Optional, List, Union, Dict, Any, Callable
 from beartype import beartype
 from urban_mapper import logger
+from urban_mapper.utils import parse_byte_size
 
 
 @beartype
@@ -18,7 +19,10 @@ class EnricherConfig:
         enricher_type: Type of enricher to use.
         enricher_config: Params for the enricher.
         debug: Whether to include debug info.
+        merge: Whether to merge results into the existing output column rather than overwrite it.
+        aggregator_backend: Engine aggregating the groups, `"pandas"` or `"duckdb"`.
         data_id: ID of the dataset to be transformed
+        raster: The raster summarised by zonal statistics, see `with_raster()`.
 
     Examples:
         >>> import urban_mapper as um
@@ -36,7 +40,10 @@ class EnricherConfig:
         self.enricher_type: str = "SingleAggregatorEnricher"
         self.enricher_config: Dict[str, Any] = {}
         self.debug: bool = False
+        self.merge: bool = False
+        self.aggregator_backend: str = "pandas"
         self.data_id: Optional[str] = None
+        self.raster: Optional[Dict[str, Any]] = None
 
     def with_data(
         self,
@@ -160,6 +167,139 @@ class EnricherConfig:
         )
         return self
 
+    def with_raster(
+        self,
+        file_path: str,
+        band: int = 1,
+        buffer: Optional[float] = None,
+        all_touched: bool = False,
+        max_memory: Optional[Union[int, str]] = None,
+        max_workers: Optional[int] = None,
+        resolution: Optional[Union[int, float, str]] = None,
+    ) -> "EnricherConfig":
+        """Set the raster to summarise over the urban layer's geometries.
+
+        Switches the enricher type to `RasterZonalStatisticsEnricher`. The raster is read
+        by the enricher itself, the loaded data being left aside.
+
+        !!! note "Read the following like"
+            ``With the raster <file_path>, summarising its band <band>.''
+
+            Follow the other ``Read the following like`` notes for the continuity of the
+            examples.
+
+        Args:
+            file_path: Path to the raster, e.g. a GeoTIFF.
+            band: Index of the band to summarise, starting at 1 (default: 1).
+            buffer: Distance by which lines and points are buffered into zones, in the raster's
+                units. Default: `None`, which uses half a pixel.
+            all_touched: Whether every pixel touched by a zone counts towards it, rather than
+                only those whose centre falls within it (default: False).
+            max_memory: Peak working memory of the raster blocks being read, in bytes or as a
+                size such as `"2GB"`. Default: `None`, which uses 512MB.
+            max_workers: Number of groups of raster blocks processed concurrently. Default:
+                `None`, which uses the number of CPUs.
+            resolution: Resolution the statistics are computed at, in the raster's units,
+                which reads the raster's closest internal overview no coarser than it, or
+                `"auto"` for a tenth of the urban layer's typical feature size. Default: `None`,
+                which reads the full resolution.
+
+        Returns:
+            Self, for chaining.
+
+        Raises:
+            ValueError: If `max_memory` cannot be parsed, `max_workers` is not positive, or
+                `resolution` is neither positive nor `"auto"`.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> config = mapper.enricher.with_raster("statewide_imagery.tif", max_memory="2GB")
+            >>> config = mapper.enricher.with_raster("statewide_imagery.tif", resolution="auto")
+        """
+        if max_memory is not None:
+            parse_byte_size(max_memory)
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(
+                f"max_workers must be a positive integer, got {max_workers}."
+            )
+        if isinstance(resolution, str) and resolution != "auto":
+            raise ValueError(
+                f"resolution must be a positive number or 'auto', got '{resolution}'."
+            )
+        if (
+            not isinstance(resolution, str)
+            and resolution is not None
+            and resolution <= 0
+        ):
+            raise ValueError(
+                f"resolution must be a positive number or 'auto', got {resolution}."
+            )
+        self.raster = {
+            "file_path": file_path,
+            "band": band,
+            "buffer": buffer,
+            "all_touched": all_touched,
+            "max_memory": max_memory,
+            "max_workers": max_workers,
+            "resolution": resolution,
+        }
+        self.enricher_type = "RasterZonalStatisticsEnricher"
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_RASTER: Initialised EnricherConfig with raster={self.raster}",
+        )
+        return self
+
+    def zonal_statistics(
+        self,
+        statistics: Union[str, List[str]] = "mean",
+        output_column: Optional[str] = None,
+    ) -> "EnricherConfig":
+        """Set up zonal statistics of the raster over each urban layer geometry.
+
+        One column is added per statistic, named `<output_column>_<statistic>`.
+
+        !!! note "Read the following like"
+            ``Summarise the raster by <statistics> within each geometry, the output being new
+            columns prefixed by: <output_column>.''
+
+            Follow the other ``Read the following like`` notes for the continuity of the
+            examples.
+
+        Args:
+            statistics: Statistic(s) to compute—string or list, among `count`, `sum`, `mean`,
+                `min`, `max`, `std`, `median`, and percentiles such as `p90` (default: "mean").
+            output_column: Prefix of the output columns. Default: `None`, which uses the
+                raster's file name, without its extension.
+
+        Returns:
+            Self, for chaining.
+
+        Raises:
+            ValueError: If a statistic is unknown.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> config = mapper.enricher\
+            ...     .with_raster("land_surface_temperature.tif")\
+            ...     .zonal_statistics(["mean", "p90"], output_column="lst")
+        """
+        from .validation import validate_zonal_statistics
+
+        statistics = [statistics] if isinstance(statistics, str) else statistics
+        validate_zonal_statistics(statistics)
+        self.action = "zonal_statistics"
+        self.aggregator_config = {"statistics": statistics}
+        self.enricher_config = {"output_column": output_column}
+        logger.log(
+            "DEBUG_LOW",
+            f"ZONAL_STATISTICS: Initialised EnricherConfig with statistics={statistics} "
+            f"and output_column={output_column}",
+        )
+        return self
+
     def with_type(self, primitive_type: str) -> "EnricherConfig":
         """Set the enricher type.
 
@@ -171,12 +311,11 @@ class EnricherConfig:
             Follow the other ``Read the following like`` notes for the continuity of the
             examples.
 
-        !!! tip "For The Time Being, Only One Enricher Type Is Supported"
+        !!! tip "The Enricher Type Is Mostly Set For You"
 
-            ``SingleAggregatorEnricher`` is the only supported enricher type for now.
+            ``SingleAggregatorEnricher`` is the default enricher type, and
+            ``RasterZonalStatisticsEnricher`` is set by `with_raster()`.
             You have therefore no need to specify the type of enricher you want to use.
-            It'll become deprecated in the future, if more enricher types primitives are
-            implemented.
 
         Args:
             primitive_type: Enricher type name (e.g., "SingleAggregatorEnricher").
@@ -92,8 +92,21 @@ class PreviewBuilder:
                     f"│   └── Output Column: {self.config.enricher_config.get('output_column', 'count')}",
                 ]
             )
+        elif self.config.action == "zonal_statistics":
+            raster = self.config.raster or {}
+            steps.extend(
+                [
+                    "│   ├── Type: Zonal Statistics",
+                    f"│   ├── Raster: {raster.get('file_path', '<Not Set>')} (band {raster.get('band', 1)})",
+                    f"│   ├── Resolution: {raster.get('resolution') or 'Full'}",
+                    f"│   ├── Statistics: {', '.join(self.config.aggregator_config.get('statistics', []))}",
+                    f"│   └── Output Column: {self.config.enricher_config.get('output_column') or '<Raster Name>'}",
+                ]
+            )
         steps.append("└── Step 3: Enricher")
         steps.append(f"    ├── Type: {self.config.enricher_type}")
+        steps.append(f"    ├── Merge: {'Yes' if self.config.merge else 'No'}")
+        steps.append(f"    ├── Backend: {self.config.aggregator_backend}")
         status = "Ready" if self._is_config_complete() else "Incomplete"
         steps.append(f"    └── Status: {status}")
         return "\n".join(steps)
@@ -120,8 +133,13 @@ class PreviewBuilder:
                     "type": self.config.action,
                     "aggregator_config": self.config.aggregator_config,
                     "enricher_config": self.config.enricher_config,
+                    "raster": self.config.raster,
+                },
+                "enricher": {
+                    "type": self.config.enricher_type,
+                    "merge": self.config.merge,
+                    "backend": self.config.aggregator_backend,
                 },
-                "enricher": {"type": self.config.enricher_type},
             },
             "metadata": {
                 "available_aggregation_methods": list(AGGREGATION_FUNCTIONS.keys())
@@ -134,11 +152,17 @@ class PreviewBuilder:
 
         This method validates that all required fields are set in the configuration,
         depending on the action type. For example, aggregate actions require
-        values_from to be set, while all actions require group_by.
+        values_from to be set, zonal statistics require a raster, while all other actions
+        require group_by.
 
         Returns:
             True if the configuration is complete, False otherwise.
         """
+        if self.config.action == "zonal_statistics":
+            return (
+                bool(self.config.raster)
+                and self.config.enricher_type in self.enricher_registry
+            )
         return (
             bool(self.config.group_by)
             and bool(self.config.action)
@@ -1,8 +1,15 @@
+import re
+from typing import List
+
 from .config import EnricherConfig
 from urban_mapper.modules.enricher.aggregator.aggregators.simple_aggregator import (
     AGGREGATION_FUNCTIONS,
+    MERGE_FUNCTIONS,
 )
 
+ZONAL_STATISTICS = ["count", "sum", "mean", "min", "max", "std", "median"]
+PERCENTILE_STATISTIC = re.compile(r"^p(\d{1,2}(\.\d+)?|100)$")
+
 
 def validate_group_by(config: EnricherConfig) -> None:
     """Ensure `group_by` is set in the config.
@@ -27,7 +34,9 @@ def validate_action(config: EnricherConfig) -> None:
         ValueError: If no action is set.
     """
     if not config.action:
-        raise ValueError("No action specified. Use aggregate_with() or count_by().")
+        raise ValueError(
+            "No action specified. Use aggregate_with(), count_by() or zonal_statistics()."
+        )
 
 
 def validate_aggregation_method(method: str) -> None:
@@ -43,3 +52,61 @@ def validate_aggregation_method(method: str) -> None:
         raise ValueError(
             f"Unknown aggregation method '{method}'. Available: {list(AGGREGATION_FUNCTIONS.keys())}"
         )
+
+
+def validate_merge(config: EnricherConfig) -> None:
+    """Ensure merging is only asked for aggregations whose results can be merged.
+
+    Args:
+        config: Enricher config to check.
+
+    Raises:
+        ValueError: If merge is on and the aggregation is neither a count, nor a sum, min or max.
+    """
+    if not config.merge:
+        return
+    method = (
+        "count" if config.action == "count" else config.aggregator_config.get("method")
+    )
+    if method not in MERGE_FUNCTIONS:
+        raise ValueError(
+            f"Results of '{method if isinstance(method, str) else 'custom'}' aggregations cannot be merged. "
+            f"Mergeable aggregations: {list(MERGE_FUNCTIONS.keys())}"
+        )
+
+
+def validate_zonal_statistics(statistics: List[str]) -> None:
+    """Check that every zonal statistic is known.
+
+    Args:
+        statistics: Zonal statistic names to validate, e.g. `["mean", "p90"]`.
+
+    Raises:
+        ValueError: If no statistic is given, or if one is neither in `ZONAL_STATISTICS`
+            nor a percentile `p<q>` with `q` between 0 and 100.
+    """
+    if not statistics:
+        raise ValueError("Zonal statistics require at least one statistic.")
+    for statistic in statistics:
+        if statistic not in ZONAL_STATISTICS and not PERCENTILE_STATISTIC.match(
+            statistic
+        ):
+            raise ValueError(
+                f"Unknown zonal statistic '{statistic}'. Available: {ZONAL_STATISTICS}, "
+                "or a percentile such as 'p90'."
+            )
+
+
+def validate_raster(config: EnricherConfig) -> None:
+    """Ensure a raster is set for zonal statistics, and that they are not merged.
+
+    Args:
+        config: Enricher config to check.
+
+    Raises:
+        ValueError: If no raster is set, or if merge is on.
+    """
+    if not config.raster:
+        raise ValueError("Missing raster. Use with_raster() to set it.")
+    if config.merge:
+        raise ValueError("Zonal statistics cannot be merged, they are recomputed.")
@@ -2,10 +2,12 @@ from .abc_imputer import GeoImputerBase
 from .imputer_factory import ImputerFactory
 from .imputers.simple_geo_imputer import SimpleGeoImputer
 from .imputers.address_geo_imputer import AddressGeoImputer
+from .imputers.raster_sample_imputer import RasterSampleImputer
 
 __all__ = [
     "GeoImputerBase",
     "ImputerFactory",
     "SimpleGeoImputer",
     "AddressGeoImputer",
+    "RasterSampleImputer",
 ]
@@ -1,7 +1,9 @@
 from .simple_geo_imputer import SimpleGeoImputer
 from .address_geo_imputer import AddressGeoImputer
+from .raster_sample_imputer import RasterSampleImputer
 
 __all__ = [
     "SimpleGeoImputer",
     "AddressGeoImputer",
+    "RasterSampleImputer",
 ]
@@ -7,6 +7,7 @@ from shapely.geometry import Point
 from beartype import beartype
 from urban_mapper.modules.urban_layer.abc_urban_layer import UrbanLayerBase
 from urban_mapper.modules.imputer.abc_imputer import GeoImputerBase
+from urban_mapper.utils import defensive_copy
 
 
 @beartype
@@ -77,7 +78,7 @@ class AddressGeoImputer(GeoImputerBase):
             Urban layer is included for interface compatibility but not used.
         """
         _ = urban_layer
-        dataframe = input_geodataframe.copy()
+        dataframe = defensive_copy(input_geodataframe)
 
         if self.geometry_column is None:
             mask_missing = (
@@ -86,7 +87,7 @@ class AddressGeoImputer(GeoImputerBase):
             )
         else:
             mask_missing = dataframe[self.geometry_column].isna()
-        missing_records = dataframe[mask_missing].copy()
+        missing_records = dataframe[mask_missing]
 
         def geocode_address(row, active_geometry_name):
             address = str(row.get(self.address_column, "")).strip()
@@ -1,5 +1,17 @@
 from .abc_loader import LoaderBase
-from .loaders import CSVLoader, ShapefileLoader, ParquetLoader
+from .loaders import (
+    CSVLoader,
+    ShapefileLoader,
+    ParquetLoader,
+    GeoParquetLoader,
+    ArrowLoader,
+    OGRLoader,
+    PartitionedLoader,
+    DuckDBLoader,
+    RasterLoader,
+)
+from .loader_cache import LoaderCache
+from .incremental_state import IncrementalState
 from .loader_factory import LoaderFactory
 
 __all__ = [
@@ -7,5 +19,13 @@ __all__ = [
     "CSVLoader",
     "ShapefileLoader",
     "ParquetLoader",
+    "GeoParquetLoader",
+    "ArrowLoader",
+    "OGRLoader",
+    "PartitionedLoader",
+    "DuckDBLoader",
+    "RasterLoader",
+    "LoaderCache",
+    "IncrementalState",
     "LoaderFactory",
 ]
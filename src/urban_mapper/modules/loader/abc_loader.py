@@ -1,11 +1,26 @@
 from abc import ABC, abstractmethod
+from collections import Counter
 from pathlib import Path
-from typing import Union, Optional, Any, Dict, Tuple
+from typing import Union, Optional, Any, Dict, Tuple, Iterator, List
 import geopandas as gpd
+import numpy as np
+import pandas as pd
 from beartype import beartype
-from urban_mapper.modules.loader.helpers import ensure_coordinate_reference_system
+from pyproj import CRS
+from thefuzz import process
+from urban_mapper.modules.loader.helpers import (
+    normalise_coordinate_reference_system,
+    compact_geodataframe,
+    infer_datetime_format,
+    normalise_time_range,
+    parse_datetimes,
+    time_range_mask,
+)
+from urban_mapper.modules.loader.loader_cache import LoaderCache
+from urban_mapper.modules.loader.incremental_state import IncrementalState
+from urban_mapper import logger
 from urban_mapper.config import DEFAULT_CRS
-from urban_mapper.utils import file_exists
+from urban_mapper.utils import file_exists, cached_transformer, defensive_copy
 
 
 @beartype
@@ -24,9 +39,37 @@ class LoaderBase(ABC):
         coordinate_reference_system (Union[str, Tuple[str, str]]):
             If a string, it specifies the coordinate reference system to use (default: 'EPSG:4326').
             If a tuple (source_crs, target_crs), it defines a conversion from the source CRS to the target CRS (default target CRS: 'EPSG:4326').
+        chunksize (Optional[int]): Number of rows to read at a time. When set, loaders supporting streaming read
+            the file chunk by chunk instead of all at once. Default: `None`, which reads the whole file in one go.
+        cache (Optional[LoaderCache]): On-disk cache of loaded datasets. When set, `load_data_from_file()` serves
+            the dataset from the cache when the file and the loader parameters did not change. Default: `None`
+        compaction (Optional[Dict[str, Any]]): Settings of `compact_geodataframe()` applied to whole-file loads
+            (`categorical_threshold`, `coordinate_tolerance`, `keep_columns`). Default: `None`, which keeps
+            the loaded data as it is.
+        incremental (Optional[IncrementalState]): High-water marks of incremental loads. When set,
+            `load_data_from_file()` only returns the records appended since the previous load. Default: `None`
+        watermark_column (Optional[str]): With `incremental`, column whose largest value seen so far is the
+            high-water mark (e.g. a timestamp), only rows at or above it not loaded yet being returned.
+            Default: `None`, which uses the loader's own notion of appended records (byte offset, row count,
+            files read).
+        time_range (Optional[Tuple[str, Optional[pd.Timestamp], Optional[pd.Timestamp]]]): Only keep the rows whose
+            `column` falls within [`start`, `end`), as a (`column`, `start`, `end`) tuple, either bound being optional.
+            Loaders able to do so skip data outside of it while reading (`Parquet` row groups, `OGR` `where`, `DuckDB`
+            `WHERE`), and rows are dropped before any geometry is built. The column is parsed into datetimes.
+            Default: `None`, which keeps every row.
         additional_loader_parameters (Dict[str, Any]): Additional parameters specific to the loader implementation. Consider this as `kwargs`.
+        required_columns (Optional[List[str]]): Columns the downstream steps actually need, as pushed down by the
+            `UrbanPipeline`. Loaders able to read a subset of columns only read those. Default: `None`, which reads everything.
+        bounding_box (Optional[Tuple[float, float, float, float]]): Area of interest pushed down by the `UrbanPipeline`,
+            as (`minx`, `miny`, `maxx`, `maxy`). Loaders able to skip data outside of it may do so. Default: `None`
+        bounding_box_crs (Optional[str]): Coordinate reference system the `bounding_box` is expressed in. Default: `None`,
+            meaning the source coordinate reference system of the loader.
+        generates_coordinates (bool): Whether the loader falls back to generated latitude / longitude columns
+            (representative points of its geometries) when the configured ones are absent from the file.
     """
 
+    generates_coordinates: bool = False
+
     def __init__(
         self,
         file_path: Union[str, Path],
@@ -34,8 +77,18 @@ class LoaderBase(ABC):
         longitude_column: Optional[str] = None,
         geometry_column: Optional[str] = None,
         coordinate_reference_system: Union[str, Tuple[str, str]] = DEFAULT_CRS,
+        chunksize: Optional[int] = None,
+        cache: Optional[LoaderCache] = None,
+        compaction: Optional[Dict[str, Any]] = None,
+        incremental: Optional[IncrementalState] = None,
+        watermark_column: Optional[str] = None,
+        time_range: Optional[Tuple[str, Any, Any]] = None,
         **additional_loader_parameters: Any,
     ) -> None:
+        if chunksize is not None and chunksize <= 0:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}.")
+        if time_range is not None:
+            time_range = normalise_time_range(*time_range)
         self.file_path: Path = Path(file_path)
         self.latitude_column: str = latitude_column or ""
         self.longitude_column: str = longitude_column or ""
@@ -43,7 +96,19 @@ class LoaderBase(ABC):
         self.coordinate_reference_system: Union[str, Tuple[str, str]] = (
             coordinate_reference_system
         )
+        self.chunksize: Optional[int] = chunksize
+        self.cache: Optional[LoaderCache] = cache
+        self.compaction: Optional[Dict[str, Any]] = compaction
+        self.incremental: Optional[IncrementalState] = incremental
+        self.watermark_column: Optional[str] = watermark_column
+        self.time_range: Optional[
+            Tuple[str, Optional[pd.Timestamp], Optional[pd.Timestamp]]
+        ] = time_range
         self.additional_loader_parameters: Dict[str, Any] = additional_loader_parameters
+        self.required_columns: Optional[List[str]] = None
+        self.bounding_box: Optional[Tuple[float, float, float, float]] = None
+        self.bounding_box_crs: Optional[Any] = None
+        self._datetime_formats: Dict[str, Optional[str]] = {}
 
     @abstractmethod
     def _load_data_from_file(self) -> gpd.GeoDataFrame:
@@ -65,13 +130,15 @@ class LoaderBase(ABC):
         ...
 
     @file_exists("file_path")
-    @ensure_coordinate_reference_system
     def load_data_from_file(self) -> gpd.GeoDataFrame:
         """Load spatial data from a file.
 
         This is the main public method for using `loaders`. It performs validation
         on the inputs before delegating to the implementation-specific `_load_data_from_file` method.
         It also ensures the file exists and that the coordinate reference system is properly set.
+        When a `cache` is set, the dataset is served from it whenever possible, and stored in it otherwise.
+        When `incremental` is set, only the records appended since the previous load are returned,
+        and the cache is bypassed.
 
         Returns:
             A `GeoDataFrame` containing the loaded spatial data.
@@ -85,10 +152,532 @@ class LoaderBase(ABC):
             >>> loader = CSVLoader("taxi_data.csv", latitude_column="pickup_lat", longitude_column="pickup_lng")
             >>> gdf = loader.load_data_from_file()
         """
-        loaded_file = self._load_data_from_file()
+        if self.incremental is not None:
+            return self._load_increment()
+
+        cache_key = self.cache.key(self) if self.cache is not None else None
+        if cache_key is not None:
+            cached_file = self.cache.get(cache_key)
+            if cached_file is not None:
+                return cached_file
+
+        self._validate_schema()
+        loaded_file = normalise_coordinate_reference_system(
+            self._filter_time_range(self._load_data_from_file()),
+            self.coordinate_reference_system,
+        )
+        loaded_file = self._apply_map_columns(loaded_file)
+        if self.compaction is not None:
+            loaded_file = self._compact(loaded_file)
+        if cache_key is not None:
+            self.cache.put(cache_key, loaded_file)
+        return loaded_file
+
+    def _load_data_from_file_chunks(
+        self, chunksize: Optional[int] = None
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Internal implementation method for loading data from a file, chunk by chunk.
+
+        This method is called by `load_data_from_file_chunks()` after validation is performed.
+        Loaders able to stream their file format should override it so that peak memory is
+        bounded by `chunksize` rather than by the size of the file.
+
+        !!! note "Default Behaviour"
+            Loaders which cannot stream their file format fall back to loading the whole
+            file at once and yielding it as a single chunk.
+
+        Args:
+            chunksize: Number of rows to read per chunk, or `None` to let the loader pick
+                its natural unit.
+
+        Yields:
+            `GeoDataFrame` chunks containing the loaded spatial data.
+        """
+        yield self._load_data_from_file()
+
+    @file_exists("file_path")
+    def load_data_from_file_chunks(
+        self, chunksize: Optional[int] = None
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Load spatial data from a file as a stream of `GeoDataFrame` chunks.
+
+        Streaming counterpart of `load_data_from_file()`. Each chunk is converted to the
+        target coordinate reference system and has its columns mapped, exactly like a
+        full load would, so that chunks can be processed independently.
+
+        Args:
+            chunksize: Number of rows per chunk. Default: `None`, which uses the loader's
+                `chunksize` attribute, or the loader's natural unit (e.g. `Parquet` row groups).
+
+        !!! note "Incremental loads"
+            With `incremental` set, the records appended since the previous load are
+            returned as a single chunk.
+
+        Returns:
+            An iterator over `GeoDataFrame` chunks.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If `chunksize` is not a positive integer.
+
+        Examples:
+            >>> from urban_mapper.modules.loader import CSVLoader
+            >>> loader = CSVLoader("taxi_data.csv", latitude_column="pickup_lat", longitude_column="pickup_lng")
+            >>> for chunk in loader.load_data_from_file_chunks(chunksize=500_000):
+            ...     print(len(chunk))
+        """
+        chunksize = chunksize if chunksize is not None else self.chunksize
+        if chunksize is not None and chunksize <= 0:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}.")
+
+        if self.incremental is not None:
+            return iter([self.load_data_from_file()])
+
+        self._validate_schema()
+        return (
+            self._apply_map_columns(
+                normalise_coordinate_reference_system(
+                    self._filter_time_range(chunk), self.coordinate_reference_system
+                )
+            )
+            for chunk in self._load_data_from_file_chunks(chunksize)
+        )
+
+    def _probe_schema(self) -> Dict[str, Any]:
+        """Internal implementation method for probing the schema of a file from its metadata.
+
+        This method is called by `probe_schema()`. Loaders should only read what describes
+        the file (a `Parquet` footer, the first kilobytes of a `CSV`, a layer's metadata),
+        never the data itself.
+
+        !!! note "Default Behaviour"
+            Loaders which cannot probe their file format raise `NotImplementedError`, in
+            which case the configured columns are only checked when the file is loaded.
+
+        Returns:
+            A dictionary with the `columns` of the file (a mapping from column name to
+            Arrow type name, geometry columns being reported as `geometry`), its `row_count`,
+            its `crs` and its `bounding_box` as (`minx`, `miny`, `maxx`, `maxy`). Values the
+            metadata does not hold are `None`.
+
+        Raises:
+            NotImplementedError: If the loader cannot probe its file format.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support schema probing."
+        )
+
+    @file_exists("file_path")
+    def probe_schema(self) -> Dict[str, Any]:
+        """Probe the schema of the file from its metadata only, and check the loader's settings against it.
+
+        Only the metadata of the file is read, so that probing takes milliseconds even for
+        files too large to fit in memory. The configured latitude, longitude and geometry
+        columns, and the `columns` to read if any, are checked to exist in the file, so that
+        a misconfigured loader fails before any heavy I/O.
+
+        Returns:
+            A dictionary with the `columns` of the file (a mapping from column name to
+            Arrow type name), its `row_count`, its `crs` and its `bounding_box`. Values the
+            metadata does not hold are `None`.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            NotImplementedError: If the loader cannot probe its file format.
+            ValueError: If a configured column is not found in the file.
+
+        Examples:
+            >>> from urban_mapper.modules.loader import ParquetLoader
+            >>> loader = ParquetLoader("trips.parquet", latitude_column="pickup_lat", longitude_column="pickup_lng")
+            >>> schema = loader.probe_schema()
+            >>> schema["row_count"], schema["columns"]["fare_amount"]
+            (12000000, 'double')
+        """
+        schema = self._probe_schema()
+        available_columns = list(schema["columns"])
+        configured_columns = {"geometry_column": self.geometry_column}
+        if not self.generates_coordinates:
+            configured_columns["latitude_column"] = self.latitude_column
+            configured_columns["longitude_column"] = self.longitude_column
+        configured_columns.update(
+            (f"columns[{index}]", column)
+            for index, column in enumerate(getattr(self, "columns", None) or [])
+        )
+        for setting, column in configured_columns.items():
+            if column and column not in available_columns:
+                suggestion = ""
+                if available_columns:
+                    match, score = process.extractOne(column, available_columns)
+                    if score > 80:
+                        suggestion = f" Maybe you meant '{match}'?"
+                raise ValueError(
+                    f"Column '{column}' ({setting}) not found in {self.file_path}. "
+                    f"Available columns: {', '.join(available_columns)}.{suggestion}"
+                )
+        return schema
+
+    def _validate_schema(self) -> None:
+        """Check the loader's settings against the file's metadata, when the loader can probe it."""
+        try:
+            self.probe_schema()
+        except NotImplementedError:
+            pass
+
+    def _load_data_since(
+        self, watermark: Dict[str, Any]
+    ) -> Tuple[gpd.GeoDataFrame, Dict[str, Any]]:
+        """Internal implementation method for loading the records appended since a high-water mark.
+
+        This method is called by `load_data_from_file()` when `incremental` is set and no
+        `watermark_column` is. Loaders able to locate appended records in their file format
+        (a byte offset, a row count, new files) should override it.
+
+        !!! note "Default Behaviour"
+            Loaders which cannot locate appended records raise a `ValueError`, asking for a
+            `watermark_column` instead.
+
+        Args:
+            watermark: The high-water mark of the previous load, empty on the first load.
+
+        Returns:
+            The appended records, and the new high-water mark, which must be `JSON`-serialisable.
+
+        Raises:
+            ValueError: If the loader cannot locate appended records.
+        """
+        raise ValueError(
+            f"{type(self).__name__} cannot locate appended records on its own. "
+            "Set a watermark_column to load it incrementally."
+        )
+
+    def _load_data_after_watermark(
+        self, watermark: Dict[str, Any]
+    ) -> Tuple[gpd.GeoDataFrame, Dict[str, Any]]:
+        """Load the rows whose `watermark_column` reached the high-water mark, and were not loaded yet.
+
+        Rows equal to the previous largest value are kept too, since later rows may share it
+        (e.g. timestamps to the second), minus those already loaded: the high-water mark
+        records a hash of every row holding the largest value, its `watermark_column` aside.
+
+        !!! note "Pushdown"
+            Datetime high-water marks are pushed down as a `time_range` starting at the
+            previous largest value, when the loader has no `time_range` of its own, so that
+            loaders able to do so skip older data while reading (`Parquet` row groups, `OGR`
+            `where`). Other sources are read whole, then filtered.
+
+        Args:
+            watermark: The high-water mark of the previous load, empty on the first load.
+
+        Returns:
+            The new rows, and the new high-water mark.
+
+        Raises:
+            ValueError: If the `watermark_column` is not found.
+        """
+        time_range = self.time_range
+        if (
+            watermark.get("datetime")
+            and watermark.get("max_value") is not None
+            and time_range is None
+        ):
+            self.time_range = normalise_time_range(
+                self.watermark_column, watermark["max_value"]
+            )
+        try:
+            loaded_file = self._load_data_from_file()
+        finally:
+            self.time_range = time_range
+        if self.watermark_column not in loaded_file.columns:
+            raise ValueError(
+                f"Watermark column '{self.watermark_column}' not found in {self.file_path}."
+            )
 
+        values = loaded_file[self.watermark_column]
+        seen_at_max = watermark.get("seen_at_max")
+        threshold = None
+        if watermark.get("max_value") is not None:
+            threshold = pd.Series([watermark["max_value"]]).astype(values.dtype)[0]
+            keep = (values > threshold).to_numpy()
+            # High-water marks saved before `seen_at_max` was recorded exclude the boundary.
+            if seen_at_max is not None:
+                at_threshold = (values == threshold).to_numpy()
+                hashes = self._watermark_row_hashes(loaded_file[at_threshold])
+                occurrences = hashes.groupby(hashes).cumcount()
+                already_loaded = Counter(seen_at_max)
+                keep[at_threshold] = [
+                    occurrence >= already_loaded[row_hash]
+                    for row_hash, occurrence in zip(hashes.tolist(), occurrences)
+                ]
+            loaded_file = defensive_copy(loaded_file[keep])
+            values = loaded_file[self.watermark_column]
+
+        if not values.notna().any():
+            return loaded_file, dict(watermark)
+        max_value = values.max()
+        rows_at_max = self._watermark_row_hashes(loaded_file[values == max_value])
+        if threshold is not None and max_value == threshold:
+            rows_at_max = list(seen_at_max or []) + rows_at_max.tolist()
+        else:
+            rows_at_max = rows_at_max.tolist()
+        if isinstance(max_value, pd.Timestamp):
+            new_watermark = {"max_value": max_value.isoformat(), "datetime": True}
+        else:
+            new_watermark = {
+                "max_value": max_value.item()
+                if hasattr(max_value, "item")
+                else max_value
+            }
+        new_watermark["seen_at_max"] = rows_at_max
+        return loaded_file, new_watermark
+
+    def _watermark_row_hashes(self, rows: pd.DataFrame) -> pd.Series:
+        """Hash rows on every column but the `watermark_column`, to recognise those already loaded."""
+        return pd.util.hash_pandas_object(
+            rows.drop(columns=self.watermark_column), index=False
+        )
+
+    def _load_increment(self) -> gpd.GeoDataFrame:
+        """Load the records appended since the previous load, and record the new high-water mark."""
+        key = self.incremental.key(self)
+        watermark = self.incremental.get(key)
+        self._validate_schema()
+        if self.watermark_column is None:
+            loaded_file, new_watermark = self._load_data_since(watermark)
+        else:
+            loaded_file, new_watermark = self._load_data_after_watermark(watermark)
+        logger.log(
+            "DEBUG_LOW",
+            f"{type(self).__name__}: loaded {len(loaded_file)} new records from {self.file_path}",
+        )
+
+        loaded_file = normalise_coordinate_reference_system(
+            self._filter_time_range(loaded_file), self.coordinate_reference_system
+        )
+        loaded_file = self._apply_map_columns(loaded_file)
+        if self.compaction is not None:
+            loaded_file = self._compact(loaded_file)
+        self.incremental.put(key, new_watermark)
+        return loaded_file
+
+    def with_pushdown(
+        self,
+        required_columns: Optional[List[str]] = None,
+        bounding_box: Optional[Tuple[float, float, float, float]] = None,
+        bounding_box_crs: Optional[Any] = None,
+    ) -> "LoaderBase":
+        """Push the needs of the downstream steps down to the loader.
+
+        This is how the `UrbanPipeline` tells a `loader` which columns it will use and which
+        area it will keep, so that loaders able to do so avoid reading the rest of the file, or
+        at least turning it into geometries: `ParquetLoader` and `GeoParquetLoader` skip row
+        groups, `OGRLoader` reads through the spatial index, and `CSVLoader`, `ParquetLoader`
+        and `ArrowLoader` drop rows on their raw coordinates. Loaders that cannot exploit
+        these hints simply ignore them.
+
+        !!! note "Column names"
+            `required_columns` are expressed with the names found in the file, that is,
+            before `map_columns` renames them. The loader's own coordinate or geometry
+            columns are always read, as is the `time_range` column, and any required column
+            absent from the file is ignored.
+
+        Args:
+            required_columns: Columns to read. `None` reads every column.
+            bounding_box: Area of interest as (`minx`, `miny`, `maxx`, `maxy`). `None` reads every row.
+            bounding_box_crs: Coordinate reference system of `bounding_box`. `None` means the
+                loader's source coordinate reference system.
+
+        Returns:
+            The loader instance for method chaining.
+
+        Examples:
+            >>> loader = ParquetLoader("trips.parquet", latitude_column="lat", longitude_column="lon")
+            >>> loader.with_pushdown(
+            ...     required_columns=["fare"],
+            ...     bounding_box=(-74.05, 40.68, -73.90, 40.88),
+            ...     bounding_box_crs="EPSG:4326",
+            ... )
+        """
+        self.required_columns = (
+            list(required_columns) if required_columns is not None else None
+        )
+        if self.required_columns is not None and self.time_range is not None:
+            if self.time_range[0] not in self.required_columns:
+                self.required_columns.append(self.time_range[0])
+        self.bounding_box = bounding_box
+        self.bounding_box_crs = bounding_box_crs
+        return self
+
+    def _source_bounding_box(self) -> Optional[Tuple[float, float, float, float]]:
+        """Express the pushed down `bounding_box` in the source coordinate reference system.
+
+        Returns:
+            The bounding box in the coordinate reference system the file is stored in,
+            or `None` if no bounding box was pushed down.
+        """
+        if self.bounding_box is None:
+            return None
+        source_crs = (
+            self.coordinate_reference_system[0]
+            if isinstance(self.coordinate_reference_system, tuple)
+            else self.coordinate_reference_system
+        )
+        if self.bounding_box_crs is None or CRS.from_user_input(
+            self.bounding_box_crs
+        ) == CRS.from_user_input(source_crs):
+            return self.bounding_box
+        transformer = cached_transformer(self.bounding_box_crs, source_crs)
+        return tuple(transformer.transform_bounds(*self.bounding_box))
+
+    def _target_crs(self) -> Any:
+        """Get the coordinate reference system the loaded data is expressed in."""
+        if isinstance(self.coordinate_reference_system, tuple):
+            return self.coordinate_reference_system[1]
+        return self.coordinate_reference_system
+
+    def _bounding_box_mask(
+        self, longitudes: Any, latitudes: Any
+    ) -> Optional[np.ndarray]:
+        """Mask the raw coordinates falling within the pushed down `bounding_box`.
+
+        Coordinates are compared as plain arrays, before any geometry is built, so that
+        rows outside the area of interest never become geometries. Missing or non-numeric
+        coordinates are masked out, as `BoundingBoxFilter` would drop them too.
+
+        Args:
+            longitudes: The longitude (`x`) values, as read from the file.
+            latitudes: The latitude (`y`) values, as read from the file.
+
+        Returns:
+            A boolean array, `True` for the rows within the bounding box, or `None` if
+            no bounding box was pushed down.
+        """
+        bounding_box = self._source_bounding_box()
+        if bounding_box is None:
+            return None
+        minx, miny, maxx, maxy = bounding_box
+        x = pd.Series(pd.to_numeric(longitudes, errors="coerce")).to_numpy(
+            dtype="float64", na_value=np.nan
+        )
+        y = pd.Series(pd.to_numeric(latitudes, errors="coerce")).to_numpy(
+            dtype="float64", na_value=np.nan
+        )
+        within = (x >= minx) & (x <= maxx) & (y >= miny) & (y <= maxy)
+        logger.log(
+            "DEBUG_LOW",
+            f"{type(self).__name__}: keeping {int(within.sum())} out of {len(within)} "
+            f"rows within the pushed down bounding box of {self.file_path}",
+        )
+        return within
+
+    def _parse_time_range_column(self, values: pd.Series) -> pd.Series:
+        """Parse the values of the `time_range` column into datetimes.
+
+        Values are parsed with a format inferred once, from the first value of the first
+        batch read, and reused for every later batch, rather than guessed value by value.
+        """
+        column = self.time_range[0]
+        if column not in self._datetime_formats:
+            self._datetime_formats[column] = infer_datetime_format(values)
+        return parse_datetimes(values, self._datetime_formats[column])
+
+    def _time_range_mask(self, values: Any) -> Optional[np.ndarray]:
+        """Mask the values of the `time_range` column falling within the range.
+
+        Args:
+            values: The values of the `time_range` column, as read from the file.
+
+        Returns:
+            A boolean array, `True` for the rows within the range, or `None` if no
+            `time_range` is set.
+        """
+        if self.time_range is None:
+            return None
+        return time_range_mask(
+            self._parse_time_range_column(pd.Series(values)), *self.time_range[1:]
+        )
+
+    def _filter_time_range(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Drop the rows outside the `time_range`, parsing its column into datetimes.
+
+        Loaders call it before building geometries. It is applied again to every loaded
+        `GeoDataFrame`, which costs a mere comparison once the column holds datetimes, so
+        that loaders unable to filter while reading still honour the range.
+
+        Args:
+            dataframe: The rows read from the file, with their original column names.
+
+        Returns:
+            The rows within the range, every row if no `time_range` is set.
+
+        Raises:
+            ValueError: If the `time_range` column is not found.
+        """
+        if self.time_range is None:
+            return dataframe
+        column = self.time_range[0]
+        if column not in dataframe.columns:
+            raise ValueError(
+                f"Time range column '{column}' not found in {self.file_path}."
+            )
+        dataframe[column] = self._parse_time_range_column(dataframe[column])
+        within = time_range_mask(dataframe[column], *self.time_range[1:])
+        if within.all():
+            return dataframe
+        logger.log(
+            "DEBUG_LOW",
+            f"{type(self).__name__}: keeping {int(within.sum())} out of {len(within)} "
+            f"rows within the time range of {self.file_path}",
+        )
+        return defensive_copy(dataframe.loc[within])
+
+    def _source_files(self) -> List[Path]:
+        """List the files this loader reads, e.g. for the cache to fingerprint them.
+
+        Returns:
+            The files read by the loader. Single-file loaders read `file_path` only.
+        """
+        return [self.file_path]
+
+    def _compact(self, loaded_file: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """Compact a loaded `GeoDataFrame` according to the `compaction` settings.
+
+        Unless `keep_columns` is set, the columns kept are the ones pushed down by the
+        `UrbanPipeline`, if any, so that columns nothing downstream uses are dropped.
+
+        Args:
+            loaded_file: The loaded `GeoDataFrame`, with its columns already mapped.
+
+        Returns:
+            The compacted `GeoDataFrame`.
+        """
+        map_columns = self.additional_loader_parameters.get("map_columns")
+        map_columns = map_columns if isinstance(map_columns, dict) else {}
+        compaction = dict(self.compaction)
+        if compaction.get("keep_columns") is None and self.required_columns is not None:
+            compaction["keep_columns"] = [
+                map_columns.get(column, column) for column in self.required_columns
+            ]
+        return compact_geodataframe(
+            loaded_file,
+            coordinate_columns=[
+                map_columns.get(column, column)
+                for column in (self.latitude_column, self.longitude_column)
+                if column
+            ],
+            **compaction,
+        )
+
+    def _apply_map_columns(self, loaded_file: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """Rename the columns of a loaded `GeoDataFrame` according to `map_columns`.
+
+        Args:
+            loaded_file: The `GeoDataFrame` to rename.
+
+        Returns:
+            The `GeoDataFrame` with its columns (and active geometry) renamed.
+        """
         if self.additional_loader_parameters.get("map_columns") is not None:
-            map_columns = self.additional_loader_parameters.get("map_columns")
+            map_columns = dict(self.additional_loader_parameters.get("map_columns"))
 
             if (
                 loaded_file.active_geometry_name is not None
@@ -1,7 +1,81 @@
 from .ensure_coordinate_reference_system import (
     ensure_coordinate_reference_system,
+    normalise_coordinate_reference_system,
+)
+from .decode_geometries import (
+    decode_geometries,
+    read_geoparquet_metadata,
+    geoparquet_column_crs,
+    GEOMETRY_ENCODINGS,
+)
+from .arrow_table_to_geodataframe import (
+    arrow_table_to_geodataframe,
+    geoarrow_columns,
+    ACTIVE_GEOMETRY_METADATA_KEY,
+)
+from .discover_files import (
+    discover_files,
+    is_glob_pattern,
+    is_multi_file_source,
+    parse_partition_values,
+    partition_matches,
+    partition_base_directory,
+)
+from .compact_geodataframe import compact_geodataframe
+from .read_parquet_rows_since import read_parquet_rows_since
+from .parquet_row_groups_within import parquet_row_groups_within
+from .points_from_coordinates import points_from_coordinates
+from .time_range import (
+    normalise_time_range,
+    infer_datetime_format,
+    parse_datetimes,
+    time_range_mask,
+    parquet_row_groups_between,
+)
+from .compressed_files import (
+    COMPRESSION_SUFFIXES,
+    compression_suffix,
+    uncompressed_suffix,
+    open_decompressed,
+    gdal_virtual_path,
+)
+from .probe_schema import (
+    arrow_schema_columns,
+    crs_name,
+    parquet_coordinate_bounds,
 )
 
 __all__ = [
     "ensure_coordinate_reference_system",
+    "normalise_coordinate_reference_system",
+    "decode_geometries",
+    "read_geoparquet_metadata",
+    "geoparquet_column_crs",
+    "GEOMETRY_ENCODINGS",
+    "arrow_table_to_geodataframe",
+    "geoarrow_columns",
+    "ACTIVE_GEOMETRY_METADATA_KEY",
+    "discover_files",
+    "is_glob_pattern",
+    "is_multi_file_source",
+    "parse_partition_values",
+    "partition_matches",
+    "partition_base_directory",
+    "compact_geodataframe",
+    "read_parquet_rows_since",
+    "parquet_row_groups_within",
+    "arrow_schema_columns",
+    "crs_name",
+    "parquet_coordinate_bounds",
+    "points_from_coordinates",
+    "normalise_time_range",
+    "infer_datetime_format",
+    "parse_datetimes",
+    "time_range_mask",
+    "parquet_row_groups_between",
+    "COMPRESSION_SUFFIXES",
+    "compression_suffix",
+    "uncompressed_suffix",
+    "open_decompressed",
+    "gdal_virtual_path",
 ]
@@ -0,0 +1,137 @@
+import json
+from typing import Any, Dict, Optional
+
+import geopandas as gpd
+import pandas as pd
+import pyarrow as pa
+from beartype import beartype
+from pyproj import CRS
+
+from urban_mapper.modules.loader.helpers.decode_geometries import decode_geometries
+
+GEOARROW_ENCODINGS = {"geoarrow.wkb": "wkb", "geoarrow.wkt": "wkt"}
+ACTIVE_GEOMETRY_METADATA_KEY = b"urban_mapper:active_geometry"
+
+
+@beartype
+def geoarrow_columns(schema: pa.Schema) -> Dict[str, Dict[str, Any]]:
+    """List the `GeoArrow` geometry columns of an Arrow schema.
+
+    Args:
+        schema: The Arrow schema to inspect.
+
+    Returns:
+        A mapping from column name to `{"encoding": ..., "crs": ...}` for every column
+        tagged with a `geoarrow.wkb` or `geoarrow.wkt` extension name.
+
+    Raises:
+        ValueError: If a column uses a `GeoArrow` encoding other than `WKB` or `WKT`.
+    """
+    columns = {}
+    for field in schema:
+        metadata = field.metadata or {}
+        extension_name = metadata.get(b"ARROW:extension:name", b"").decode()
+        if isinstance(field.type, pa.ExtensionType):
+            extension_name = field.type.extension_name
+        if not extension_name.startswith("geoarrow."):
+            continue
+        if extension_name not in GEOARROW_ENCODINGS:
+            raise ValueError(
+                f"Unsupported GeoArrow encoding '{extension_name}' for column '{field.name}'. "
+                f"Supported encodings are: {', '.join(GEOARROW_ENCODINGS)}."
+            )
+        extension_metadata = json.loads(
+            metadata.get(b"ARROW:extension:metadata", b"{}") or b"{}"
+        )
+        crs = extension_metadata.get("crs")
+        if isinstance(crs, dict):
+            crs = CRS.from_json_dict(crs)
+            authority = crs.to_authority()
+            if authority is not None:
+                crs = CRS.from_authority(*authority)
+        columns[field.name] = {
+            "encoding": GEOARROW_ENCODINGS[extension_name],
+            "crs": crs,
+        }
+    return columns
+
+
+@beartype
+def arrow_table_to_geodataframe(
+    table: pa.Table,
+    geometry_column: Optional[str] = None,
+    crs: Optional[Any] = None,
+    zero_copy: bool = True,
+) -> gpd.GeoDataFrame:
+    """Convert an Arrow table holding encoded geometries into a `GeoDataFrame`.
+
+    Every `GeoArrow` column (and `geometry_column`, if given) is decoded in bulk into
+    `shapely` geometries. Other columns are converted to pandas without copying when
+    `zero_copy` is set, as Arrow-backed (`pd.ArrowDtype`) columns sharing the table's
+    buffers, which for a memory-mapped table means sharing the OS page cache.
+
+    Args:
+        table: The Arrow table to convert.
+        geometry_column: The active geometry column. Default: `None`, which uses the column
+            recorded in the table metadata, or the first `GeoArrow` column.
+        crs: The coordinate reference system of the geometries. Default: `None`, which uses
+            the `CRS` recorded in the `GeoArrow` metadata.
+        zero_copy: Whether to expose non-geometry columns as Arrow-backed pandas columns. Default: `True`
+
+    Returns:
+        A `GeoDataFrame` with the decoded geometries.
+
+    Raises:
+        ValueError: If the table holds no geometry column.
+    """
+    geometry_columns = geoarrow_columns(table.schema)
+    if geometry_column is None:
+        schema_metadata = table.schema.metadata or {}
+        if ACTIVE_GEOMETRY_METADATA_KEY in schema_metadata:
+            geometry_column = schema_metadata[ACTIVE_GEOMETRY_METADATA_KEY].decode()
+        elif geometry_columns:
+            geometry_column = next(iter(geometry_columns))
+        else:
+            raise ValueError(
+                "No geometry column found in the Arrow table. "
+                "Specify a geometry column, or latitude and longitude columns."
+            )
+    if geometry_column not in table.column_names:
+        raise ValueError(f"Column '{geometry_column}' not found in the Arrow table.")
+    geometry_columns.setdefault(geometry_column, {"encoding": "auto", "crs": None})
+
+    dataframe = table.drop_columns(list(geometry_columns)).to_pandas(
+        types_mapper=pd.ArrowDtype if zero_copy else None,
+        split_blocks=True,
+    )
+    for name in [name for name in table.column_names if name in geometry_columns]:
+        column = table.column(name)
+        if isinstance(column.type, pa.ExtensionType):
+            column = pa.chunked_array(
+                [chunk.storage for chunk in column.chunks],
+                type=column.type.storage_type,
+            )
+        geometries = decode_geometries(
+            pd.Series(
+                column.to_numpy(zero_copy_only=False),
+                index=dataframe.index,
+                name=name,
+            ),
+            encoding=geometry_columns[name]["encoding"],
+        )
+        position = [
+            column_name
+            for column_name in table.column_names
+            if column_name in dataframe.columns or column_name == name
+        ].index(name)
+        dataframe.insert(
+            position,
+            name,
+            gpd.GeoSeries(
+                geometries,
+                index=dataframe.index,
+                crs=crs if crs is not None else geometry_columns[name]["crs"],
+            ),
+        )
+
+    return gpd.GeoDataFrame(dataframe, geometry=geometry_column)
@@ -0,0 +1,131 @@
+from typing import List, Optional
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from beartype import beartype
+
+from urban_mapper import logger
+
+
+@beartype
+def compact_geodataframe(
+    geodataframe: gpd.GeoDataFrame,
+    categorical_threshold: float = 0.5,
+    coordinate_columns: Optional[List[str]] = None,
+    coordinate_tolerance: Optional[float] = None,
+    keep_columns: Optional[List[str]] = None,
+) -> gpd.GeoDataFrame:
+    """Shrink the memory footprint of a `GeoDataFrame`.
+
+    - [x] Integer columns are downcast to the smallest signed integer type holding their values,
+      so that later arithmetic, e.g. a subtraction, cannot wrap around.
+    - [x] Float columns are downcast to `float32` when no value changes in doing so.
+    - [x] String columns with few distinct values are stored as `categoricals`.
+    - [x] Coordinate columns are downcast to `float32` when no value moves by more than `coordinate_tolerance`.
+    - [x] Columns outside of `keep_columns` are dropped.
+
+    A per-column before / after memory report is sent to the debug logger.
+
+    Args:
+        geodataframe: The `GeoDataFrame` to compact.
+        categorical_threshold: String columns whose ratio of distinct values to rows is at most this
+            are stored as `categoricals`. Default: `0.5`
+        coordinate_columns: Latitude and longitude columns, which are only downcast within `coordinate_tolerance`.
+            Default: `None`
+        coordinate_tolerance: Largest acceptable change of a coordinate, in the units of the coordinates
+            (e.g. `1e-5` degrees, about a metre). Default: `None`, which keeps coordinates as they are.
+        keep_columns: Columns to keep, geometry columns aside. Default: `None`, which keeps every column.
+
+    Returns:
+        The compacted `GeoDataFrame`.
+
+    Raises:
+        ValueError: If `categorical_threshold` is not between `0` and `1`.
+
+    Examples:
+        >>> compacted = compact_geodataframe(gdf, coordinate_columns=["lat", "lon"], coordinate_tolerance=1e-5)
+    """
+    if not 0 <= categorical_threshold <= 1:
+        raise ValueError(
+            f"categorical_threshold must be between 0 and 1, got {categorical_threshold}."
+        )
+    coordinate_columns = [
+        column for column in coordinate_columns or [] if column in geodataframe.columns
+    ]
+    geometry_columns = [
+        column
+        for column in geodataframe.columns
+        if isinstance(geodataframe[column].dtype, gpd.array.GeometryDtype)
+    ]
+    if keep_columns is not None:
+        kept = set(keep_columns) | set(coordinate_columns) | set(geometry_columns)
+        dropped = [column for column in geodataframe.columns if column not in kept]
+        if dropped:
+            logger.log("DEBUG_LOW", f"Compaction: dropping unused columns {dropped}")
+            geodataframe = geodataframe.drop(columns=dropped)
+
+    memory_before = geodataframe.memory_usage(index=False, deep=True)
+    compacted_columns = {}
+    for column in geodataframe.columns:
+        if column in geometry_columns:
+            continue
+        series = geodataframe[column]
+        if column in coordinate_columns:
+            compacted = _downcast_floats(series, coordinate_tolerance)
+        elif pd.api.types.is_bool_dtype(series.dtype):
+            compacted = series
+        elif pd.api.types.is_integer_dtype(series.dtype):
+            compacted = _downcast_integers(series)
+        elif pd.api.types.is_float_dtype(series.dtype):
+            compacted = _downcast_floats(series, 0.0)
+        elif pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(
+            series.dtype
+        ):
+            compacted = _categorise_strings(series, categorical_threshold)
+        else:
+            compacted = series
+        if compacted is not series:
+            compacted_columns[column] = compacted
+    if compacted_columns:
+        geodataframe = geodataframe.assign(**compacted_columns)
+
+    memory_after = geodataframe.memory_usage(index=False, deep=True)
+    for column in memory_before.index:
+        logger.log(
+            "DEBUG_LOW",
+            f"Compaction: {column}: {memory_before[column] / 2**20:.2f}MB -> "
+            f"{memory_after[column] / 2**20:.2f}MB ({geodataframe[column].dtype})",
+        )
+    logger.log(
+        "DEBUG_MID",
+        f"Compaction: {memory_before.sum() / 2**20:.2f}MB -> {memory_after.sum() / 2**20:.2f}MB",
+    )
+    return geodataframe
+
+
+def _downcast_integers(series: pd.Series) -> pd.Series:
+    if series.empty:
+        return series
+    compacted = pd.to_numeric(series, downcast="integer")
+    return compacted if compacted.dtype != series.dtype else series
+
+
+def _downcast_floats(series: pd.Series, tolerance: Optional[float]) -> pd.Series:
+    if tolerance is None or series.dtype != np.float64:
+        return series
+    compacted = series.astype(np.float32)
+    error = np.abs(compacted.to_numpy(dtype=np.float64) - series.to_numpy())
+    if np.nanmax(error, initial=0.0) <= tolerance:
+        return compacted
+    return series
+
+
+def _categorise_strings(series: pd.Series, categorical_threshold: float) -> pd.Series:
+    if series.empty:
+        return series
+    if pd.api.types.infer_dtype(series, skipna=True) != "string":
+        return series
+    if series.nunique() / len(series) > categorical_threshold:
+        return series
+    return series.astype("category")
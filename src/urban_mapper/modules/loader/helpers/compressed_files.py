@@ -0,0 +1,141 @@
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Collection, Iterator, List, Optional, Union
+
+import pyarrow as pa
+from beartype import beartype
+
+COMPRESSION_CODECS = {".gz": "gzip", ".bz2": "bz2", ".zst": "zstd"}
+COMPRESSION_SUFFIXES = [*COMPRESSION_CODECS, ".zip"]
+GDAL_VIRTUAL_FILE_SYSTEMS = {".zip": "/vsizip/", ".gz": "/vsigzip/"}
+
+
+@beartype
+def compression_suffix(file_path: Union[str, Path]) -> Optional[str]:
+    """Get the compression suffix of a file, e.g. `".gz"` for `trips.csv.gz`.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        The lower-cased suffix, one of `COMPRESSION_SUFFIXES`, or `None` for an uncompressed file.
+    """
+    suffix = Path(file_path).suffix.lower()
+    return suffix if suffix in COMPRESSION_SUFFIXES else None
+
+
+@beartype
+def uncompressed_suffix(
+    file_path: Union[str, Path], extensions: Collection[str]
+) -> str:
+    """Get the extension of the data a file holds, looking through compression and archives.
+
+    Compound extensions are read from the name, e.g. `".csv"` for `trips.csv.gz` or
+    `".shp"` for `parcels.shp.zip`. A `zip` archive named after its content only, e.g.
+    `parcels.zip`, is listed to find the member with one of `extensions`.
+
+    Args:
+        file_path: Path to the file.
+        extensions: Extensions of the supported formats, e.g. `[".csv", ".shp"]`.
+
+    Returns:
+        The lower-cased extension of the data, or of the file itself if nothing better is found.
+    """
+    suffix = compression_suffix(file_path)
+    if suffix is None:
+        return Path(file_path).suffix.lower()
+    inner_suffix = Path(Path(file_path).stem).suffix.lower()
+    if inner_suffix in extensions or suffix != ".zip" or not Path(file_path).is_file():
+        return inner_suffix or suffix
+    members = _archive_members(file_path, extensions)
+    return Path(members[0]).suffix.lower() if members else suffix
+
+
+@beartype
+@contextmanager
+def open_decompressed(file_path: Union[str, Path]) -> Iterator[BinaryIO]:
+    """Open a compressed file as a stream of its decompressed bytes.
+
+    Nothing is written to disk: `gzip`, `bzip2` and `zstd` files are decompressed by
+    `pyarrow` as they are read, and the single member of a `zip` archive is read in place.
+
+    Args:
+        file_path: Path to the compressed file.
+
+    Yields:
+        A binary stream of the decompressed content, closed when the block exits.
+
+    Raises:
+        ValueError: If the file is not compressed, or if a `zip` archive does not hold exactly one file.
+    """
+    suffix = compression_suffix(file_path)
+    if suffix is None:
+        raise ValueError(f"{file_path} is not a compressed file.")
+    if suffix in COMPRESSION_CODECS:
+        with pa.input_stream(
+            str(file_path), compression=COMPRESSION_CODECS[suffix]
+        ) as stream:
+            yield stream
+        return
+    with zipfile.ZipFile(file_path) as archive:
+        members = _archive_members(file_path)
+        if len(members) != 1:
+            raise ValueError(
+                f"{file_path} holds {len(members)} files, only single-file zip archives can be streamed."
+            )
+        with archive.open(members[0]) as stream:
+            yield stream
+
+
+@beartype
+def gdal_virtual_path(file_path: Union[str, Path], extensions: Collection[str]) -> str:
+    """Build the `GDAL` virtual path reading a compressed dataset without extracting it.
+
+    `zip` archives are read through `/vsizip/`, pointing at the member with one of
+    `extensions` (e.g. the `.shp` of a shapefile bundle, its sidecar files being found
+    next to it), and `gzip` files through `/vsigzip/`.
+
+    Args:
+        file_path: Path to the compressed file.
+        extensions: Extensions of the datasets to look for in `zip` archives, e.g. `[".gpkg", ".shp"]`.
+
+    Returns:
+        The virtual path, e.g. `/vsizip//data/parcels.zip/parcels.shp`.
+
+    Raises:
+        ValueError: If `GDAL` cannot stream the compression, or if a `zip` archive does not hold
+            exactly one dataset.
+    """
+    suffix = compression_suffix(file_path)
+    if suffix not in GDAL_VIRTUAL_FILE_SYSTEMS:
+        raise ValueError(
+            f"GDAL cannot read {file_path} without extracting it, supported compressions are: "
+            f"{', '.join(GDAL_VIRTUAL_FILE_SYSTEMS)}."
+        )
+    virtual_path = GDAL_VIRTUAL_FILE_SYSTEMS[suffix] + str(Path(file_path).resolve())
+    if suffix != ".zip":
+        return virtual_path
+    members = _archive_members(file_path, extensions)
+    if len(members) != 1:
+        raise ValueError(
+            f"{file_path} holds {len(members)} datasets with extensions {list(extensions)}, expected one."
+        )
+    return f"{virtual_path}/{members[0]}"
+
+
+def _archive_members(
+    file_path: Union[str, Path], extensions: Optional[Collection[str]] = None
+) -> List[str]:
+    """List the files of a `zip` archive, skipping directories and `macOS` metadata."""
+    with zipfile.ZipFile(file_path) as archive:
+        members = [
+            name
+            for name in archive.namelist()
+            if not name.endswith("/") and not name.startswith("__MACOSX/")
+        ]
+    if extensions is None:
+        return members
+    return sorted(
+        member for member in members if Path(member).suffix.lower() in extensions
+    )
@@ -0,0 +1,155 @@
+import json
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import shapely
+from beartype import beartype
+from pyproj import CRS
+
+GEOMETRY_ENCODINGS = ["auto", "wkt", "wkb", "hex", "geojson"]
+
+_DECODERS = {
+    "wkt": lambda values: shapely.from_wkt(values, on_invalid="ignore"),
+    "wkb": lambda values: shapely.from_wkb(values, on_invalid="ignore"),
+    "hex": lambda values: shapely.from_wkb(values, on_invalid="ignore"),
+    "geojson": lambda values: shapely.from_geojson(values, on_invalid="ignore"),
+}
+
+
+@beartype
+def decode_geometries(
+    values: pd.Series,
+    encoding: str = "auto",
+) -> np.ndarray:
+    """Decode a column of encoded geometries into `shapely` geometries, in bulk.
+
+    Geometries are decoded through `shapely`'s vectorised array functions rather than one
+    Python call per row. With `encoding="auto"`, the encoding of each value is detected
+    from its type and first character: `bytes` are `WKB`, strings starting with `{` are
+    `GeoJSON`, strings starting with a digit are hex-encoded `WKB`, and other strings are `WKT`.
+    Values which already are `shapely` geometries are kept as they are.
+
+    Args:
+        values: The column to decode. Missing values are left missing.
+        encoding: One of `auto`, `wkt`, `wkb`, `hex` or `geojson`. Default: `auto`
+
+    Returns:
+        An object array of `shapely` geometries, with `None` for missing values.
+
+    Raises:
+        ValueError: If `encoding` is not supported.
+        ValueError: If any value could not be decoded. All failing rows are reported at once.
+
+    Examples:
+        >>> from urban_mapper.modules.loader.helpers import decode_geometries
+        >>> dataframe["geometry"] = decode_geometries(dataframe["geometry"])
+    """
+    if encoding not in GEOMETRY_ENCODINGS:
+        raise ValueError(
+            f"Unsupported geometry encoding '{encoding}'. "
+            f"Supported encodings are: {', '.join(GEOMETRY_ENCODINGS)}."
+        )
+
+    raw = values.to_numpy(dtype=object)
+    decoded = np.full(len(raw), None, dtype=object)
+    present = values.notna().to_numpy()
+    already_decoded = present & shapely.is_geometry(raw)
+    decoded[already_decoded] = raw[already_decoded]
+    pending = present & ~already_decoded
+
+    if pending.any():
+        for value_encoding, mask in _encoding_masks(raw, pending, encoding).items():
+            if mask.any():
+                decoded[mask] = _DECODERS[value_encoding](raw[mask])
+
+    failed = pending & shapely.is_missing(decoded)
+    if failed.any():
+        failed_labels = values.index[failed]
+        examples = ", ".join(
+            f"{label!r}: {str(value)[:60]!r}"
+            for label, value in zip(failed_labels[:5], raw[failed][:5])
+        )
+        raise ValueError(
+            f"Could not decode {int(failed.sum())} out of {int(present.sum())} geometries "
+            f"in column '{values.name}' (encoding: {encoding}). First failing rows: {examples}"
+        )
+    return decoded
+
+
+def _encoding_masks(
+    raw: np.ndarray, pending: np.ndarray, encoding: str
+) -> Dict[str, np.ndarray]:
+    """Split the pending values per encoding, leaving values of the wrong type out."""
+    inferred = pd.api.types.infer_dtype(raw[pending], skipna=True)
+    if inferred == "string":
+        is_string, is_bytes = pending, np.zeros_like(pending)
+    elif inferred == "bytes":
+        is_string, is_bytes = np.zeros_like(pending), pending
+    else:
+        is_string = pending & np.fromiter(
+            (isinstance(value, str) for value in raw), dtype=bool, count=len(raw)
+        )
+        is_bytes = pending & np.fromiter(
+            (isinstance(value, (bytes, bytearray)) for value in raw),
+            dtype=bool,
+            count=len(raw),
+        )
+
+    if encoding == "wkb":
+        return {"wkb": is_bytes}
+    if encoding != "auto":
+        return {encoding: is_string}
+
+    first_characters = (
+        pd.Series(raw[is_string], dtype=object).str.lstrip().str[:1].to_numpy()
+    )
+    is_geojson = np.zeros_like(pending)
+    is_hex = np.zeros_like(pending)
+    is_geojson[is_string] = first_characters == "{"
+    is_hex[is_string] = np.isin(first_characters, list("0123456789"))
+    return {
+        "wkb": is_bytes,
+        "geojson": is_geojson,
+        "hex": is_hex,
+        "wkt": is_string & ~is_geojson & ~is_hex,
+    }
+
+
+@beartype
+def read_geoparquet_metadata(schema: pa.Schema) -> Optional[Dict[str, Any]]:
+    """Read the `GeoParquet` metadata stored under the `geo` key of an Arrow schema.
+
+    Args:
+        schema: The Arrow schema of a `Parquet` file.
+
+    Returns:
+        The decoded `geo` metadata, or `None` if the file is not a `GeoParquet` file.
+    """
+    if schema.metadata is None or b"geo" not in schema.metadata:
+        return None
+    return json.loads(schema.metadata[b"geo"])
+
+
+@beartype
+def geoparquet_column_crs(geo_metadata: Dict[str, Any], column: str) -> Optional[CRS]:
+    """Get the coordinate reference system of a `GeoParquet` geometry column.
+
+    Args:
+        geo_metadata: The `geo` metadata, as returned by `read_geoparquet_metadata`.
+        column: The geometry column.
+
+    Returns:
+        The column's `CRS`, `OGC:CRS84` when the specification's default applies, or `None`
+        if the column is not a geometry column or its `CRS` is explicitly unknown.
+    """
+    column_metadata = geo_metadata.get("columns", {}).get(column)
+    if column_metadata is None:
+        return None
+    crs = column_metadata.get("crs", "OGC:CRS84")
+    if crs is None:
+        return None
+    return (
+        CRS.from_json_dict(crs) if isinstance(crs, dict) else CRS.from_user_input(crs)
+    )
@@ -0,0 +1,142 @@
+import glob
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Union, Any
+
+from beartype import beartype
+
+GLOB_CHARACTERS = ("*", "?", "[")
+
+
+@beartype
+def is_glob_pattern(path: Union[str, Path]) -> bool:
+    """Tell whether a path is a glob pattern, such as `trips/2024-*.parquet`."""
+    return any(character in str(path) for character in GLOB_CHARACTERS)
+
+
+@beartype
+def is_multi_file_source(path: Union[str, Path]) -> bool:
+    """Tell whether a path designates several files: a glob pattern or a directory."""
+    return is_glob_pattern(path) or Path(path).is_dir()
+
+
+@beartype
+def partition_base_directory(path: Union[str, Path]) -> Path:
+    """Get the directory partition values are parsed from, i.e. the part of a glob pattern before any wildcard."""
+    if not is_glob_pattern(path):
+        return Path(path)
+    parts = []
+    for part in Path(path).parts:
+        if is_glob_pattern(part):
+            break
+        parts.append(part)
+    return Path(*parts) if parts else Path(".")
+
+
+@beartype
+def parse_partition_values(
+    file_path: Union[str, Path], base_directory: Union[str, Path]
+) -> Dict[str, str]:
+    """Parse the `hive`-style partition values of a file, e.g. `year=2024/month=05/`.
+
+    Args:
+        file_path: The partitioned file.
+        base_directory: The root of the partitioned dataset.
+
+    Returns:
+        A mapping from partition key to partition value, in directory order.
+    """
+    try:
+        directories = Path(file_path).parent.relative_to(base_directory).parts
+    except ValueError:
+        directories = Path(file_path).parent.parts
+    return dict(
+        directory.split("=", 1)
+        for directory in directories
+        if "=" in directory and not directory.startswith("=")
+    )
+
+
+@beartype
+def partition_matches(
+    partition_values: Dict[str, str], partition_filter: Optional[Dict[str, Any]]
+) -> bool:
+    """Tell whether partition values satisfy a partition filter.
+
+    Args:
+        partition_values: The partition values of a directory or file. Keys absent from it are not checked.
+        partition_filter: Mapping from partition key to the accepted value, or list of accepted values.
+
+    Returns:
+        `True` if every filtered key present in `partition_values` holds an accepted value.
+    """
+    if not partition_filter:
+        return True
+    for key, accepted in partition_filter.items():
+        if key not in partition_values:
+            continue
+        accepted_values = (
+            accepted if isinstance(accepted, (list, tuple, set)) else [accepted]
+        )
+        if partition_values[key] not in {str(value) for value in accepted_values}:
+            return False
+    return True
+
+
+@beartype
+def discover_files(
+    source: Union[str, Path],
+    extensions: Optional[List[str]] = None,
+    partition_filter: Optional[Dict[str, Any]] = None,
+) -> List[Path]:
+    """List the files of a glob pattern or of a (`hive`-partitioned) directory.
+
+    Directories are walked recursively, and subdirectories whose partition value is rejected
+    by `partition_filter` are skipped entirely, without being listed. Hidden and bookkeeping
+    files (starting with `.` or `_`, such as `_SUCCESS`) are ignored.
+
+    Args:
+        source: A glob pattern (`trips/2024-*.parquet`, `trips/**/*.csv`) or a directory.
+        extensions: File extensions to keep (e.g. `[".parquet"]`). Default: `None`, which keeps every file.
+        partition_filter: Mapping from partition key to the accepted value, or list of accepted values.
+            Default: `None`, which keeps every partition.
+
+    Returns:
+        The matching files, sorted.
+    """
+    base_directory = partition_base_directory(source)
+    if is_glob_pattern(source):
+        candidates = [Path(path) for path in glob.glob(str(source), recursive=True)]
+        candidates = [
+            path
+            for path in candidates
+            if path.is_file()
+            and partition_matches(
+                parse_partition_values(path, base_directory), partition_filter
+            )
+        ]
+    else:
+        candidates = []
+        for directory, subdirectories, file_names in os.walk(source):
+            subdirectories[:] = [
+                subdirectory
+                for subdirectory in subdirectories
+                if not subdirectory.startswith((".", "_"))
+                and partition_matches(
+                    parse_partition_values(
+                        Path(directory) / subdirectory / "_", base_directory
+                    ),
+                    partition_filter,
+                )
+            ]
+            candidates.extend(Path(directory) / file_name for file_name in file_names)
+
+    return sorted(
+        path
+        for path in candidates
+        if not path.name.startswith((".", "_"))
+        and (
+            extensions is None
+            or any(path.name.lower().endswith(extension) for extension in extensions)
+        )
+    )
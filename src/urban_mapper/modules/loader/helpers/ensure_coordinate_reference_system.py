@@ -5,6 +5,37 @@ from beartype import beartype
 from urban_mapper.config import DEFAULT_CRS
 
 
+@beartype
+def normalise_coordinate_reference_system(
+    loaded_geodataframe: gpd.GeoDataFrame,
+    coordinate_reference_system: Union[str, Tuple[str, str]] = DEFAULT_CRS,
+) -> gpd.GeoDataFrame:
+    """Set or convert the `CRS` of a loaded `GeoDataFrame` to the loader's target `CRS`.
+
+    Args:
+        loaded_geodataframe: The `GeoDataFrame` freshly built by a loader.
+        coordinate_reference_system: Either the target `CRS`, or a `(source, target)` tuple
+            in which case only the target is considered.
+
+    Returns:
+        The `GeoDataFrame` expressed in the target coordinate reference system.
+    """
+    target_coordinate_reference_system = (
+        coordinate_reference_system[1]
+        if isinstance(coordinate_reference_system, tuple)
+        else coordinate_reference_system
+    )
+
+    if loaded_geodataframe.crs is None:
+        loaded_geodataframe.set_crs(target_coordinate_reference_system, inplace=True)
+    elif loaded_geodataframe.crs.to_string() != target_coordinate_reference_system:
+        loaded_geodataframe = loaded_geodataframe.to_crs(
+            target_coordinate_reference_system
+        )
+
+    return loaded_geodataframe
+
+
 @beartype
 def ensure_coordinate_reference_system(
     function_to_wrap: Callable[..., gpd.GeoDataFrame],
@@ -14,22 +45,8 @@ def ensure_coordinate_reference_system(
         target_coordinate_reference_system: Union[str, Tuple[str, str]] = getattr(
             self, "coordinate_reference_system", DEFAULT_CRS
         )
-
-        target_coordinate_reference_system = (
-            target_coordinate_reference_system[1]
-            if isinstance(target_coordinate_reference_system, tuple)
-            else target_coordinate_reference_system
+        return normalise_coordinate_reference_system(
+            loaded_geodataframe, target_coordinate_reference_system
         )
 
-        if loaded_geodataframe.crs is None:
-            loaded_geodataframe.set_crs(
-                target_coordinate_reference_system, inplace=True
-            )
-        elif loaded_geodataframe.crs.to_string() != target_coordinate_reference_system:
-            loaded_geodataframe = loaded_geodataframe.to_crs(
-                target_coordinate_reference_system
-            )
-
-        return loaded_geodataframe
-
     return wrapper
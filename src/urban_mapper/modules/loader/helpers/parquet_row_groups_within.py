@@ -0,0 +1,74 @@
+from typing import Any, List, Tuple
+
+import pyarrow.parquet as pq
+from beartype import beartype
+
+
+@beartype
+def parquet_row_groups_within(
+    parquet_file: pq.ParquetFile,
+    bounding_box: Tuple[float, float, float, float],
+    x_columns: Tuple[str, str],
+    y_columns: Tuple[str, str],
+) -> List[int]:
+    """Select the row groups of a `Parquet` file that may hold rows within a bounding box.
+
+    Row groups are skipped using the min/max statistics of the columns holding the
+    extent of each row. Point coordinates pass the same column as minimum and maximum,
+    e.g. `("lon", "lon")`, while a `GeoParquet` bounding box covering passes its fields,
+    e.g. `("bbox.xmin", "bbox.xmax")`. Row groups lacking statistics, or with non-numeric
+    statistics, are kept.
+
+    Args:
+        parquet_file: The opened `Parquet` file.
+        bounding_box: Area of interest as (`minx`, `miny`, `maxx`, `maxy`), in the file's
+            coordinate reference system.
+        x_columns: Paths of the columns holding the minimum and maximum `x` of each row.
+        y_columns: Paths of the columns holding the minimum and maximum `y` of each row.
+
+    Returns:
+        The indices of the row groups to read. Every row group if a column is missing.
+    """
+    metadata = parquet_file.metadata
+    row_groups = list(range(metadata.num_row_groups))
+    column_index = {
+        metadata.schema.column(index).path: index
+        for index in range(metadata.num_columns)
+    }
+    if any(column not in column_index for column in (*x_columns, *y_columns)):
+        return row_groups
+
+    minx, miny, maxx, maxy = bounding_box
+
+    def overlaps(row_group: int, columns: Tuple[str, str], low: float, high: float):
+        statistics = metadata.row_group(row_group)
+        return _statistics_overlap(
+            statistics.column(column_index[columns[0]]).statistics,
+            statistics.column(column_index[columns[1]]).statistics,
+            low,
+            high,
+        )
+
+    return [
+        row_group
+        for row_group in row_groups
+        if overlaps(row_group, x_columns, minx, maxx)
+        and overlaps(row_group, y_columns, miny, maxy)
+    ]
+
+
+def _statistics_overlap(
+    minimum_statistics: Any, maximum_statistics: Any, low: float, high: float
+) -> bool:
+    """Tell whether column chunks of row extents may hold one overlapping [`low`, `high`]."""
+    if (
+        minimum_statistics is None
+        or maximum_statistics is None
+        or not minimum_statistics.has_min_max
+        or not maximum_statistics.has_min_max
+    ):
+        return True
+    try:
+        return maximum_statistics.max >= low and minimum_statistics.min <= high
+    except TypeError:
+        return True
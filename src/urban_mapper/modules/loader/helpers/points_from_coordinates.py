@@ -0,0 +1,62 @@
+from typing import Any, Tuple, Union
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from beartype import beartype
+from geopandas.array import GeometryArray
+from pyproj import CRS
+
+from urban_mapper import logger
+from urban_mapper.config import DEFAULT_CRS
+from urban_mapper.utils import cached_transformer
+
+
+@beartype
+def points_from_coordinates(
+    longitudes: Any,
+    latitudes: Any,
+    coordinate_reference_system: Union[Any, Tuple[Any, Any]] = DEFAULT_CRS,
+) -> GeometryArray:
+    """Build point geometries from raw coordinates, directly in the target `CRS`.
+
+    When `coordinate_reference_system` is a `(source, target)` tuple, the longitude and
+    latitude arrays are transformed with a cached `Transformer` before any geometry exists,
+    rather than building points in the source `CRS` and transforming every geometry
+    afterwards with `to_crs()`. Missing or non-numeric coordinates become `NaN`.
+
+    Args:
+        longitudes: The longitude (`x`) values, as read from the source.
+        latitudes: The latitude (`y`) values, as read from the source.
+        coordinate_reference_system: Either the `CRS` of the coordinates, or a
+            `(source, target)` tuple to transform them from `source` to `target`.
+
+    Returns:
+        The points, as a `GeometryArray` holding the target `CRS`.
+
+    Examples:
+        >>> points = points_from_coordinates(
+        ...     dataframe["lon"], dataframe["lat"], ("EPSG:4326", "EPSG:3857")
+        ... )
+        >>> gdf = gpd.GeoDataFrame(dataframe, geometry=points)
+    """
+    source_crs, target_crs = (
+        coordinate_reference_system
+        if isinstance(coordinate_reference_system, tuple)
+        else (coordinate_reference_system, coordinate_reference_system)
+    )
+    x = pd.Series(pd.to_numeric(longitudes, errors="coerce")).to_numpy(
+        dtype="float64", na_value=np.nan
+    )
+    y = pd.Series(pd.to_numeric(latitudes, errors="coerce")).to_numpy(
+        dtype="float64", na_value=np.nan
+    )
+    if source_crs != target_crs and CRS.from_user_input(
+        source_crs
+    ) != CRS.from_user_input(target_crs):
+        logger.log(
+            "DEBUG_LOW",
+            f"Transforming {len(x)} coordinates from {source_crs} to {target_crs}",
+        )
+        x, y = cached_transformer(source_crs, target_crs).transform(x, y)
+    return gpd.points_from_xy(x, y, crs=target_crs)
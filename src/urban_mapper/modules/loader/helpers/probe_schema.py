@@ -0,0 +1,79 @@
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from beartype import beartype
+from pyproj import CRS
+
+
+@beartype
+def arrow_schema_columns(
+    schema: pa.Schema, geometry_columns: Iterable[str] = ()
+) -> Dict[str, str]:
+    """Describe the columns of an Arrow schema for `probe_schema()`.
+
+    Args:
+        schema: The Arrow schema to describe.
+        geometry_columns: Columns holding encoded geometries, reported as `geometry`.
+
+    Returns:
+        A mapping from column name to Arrow type name, in schema order.
+    """
+    geometry_columns = set(geometry_columns)
+    return {
+        field.name: "geometry" if field.name in geometry_columns else str(field.type)
+        for field in schema
+    }
+
+
+@beartype
+def crs_name(crs: Any) -> Optional[str]:
+    """Name a coordinate reference system, e.g. `EPSG:4326`, or `None` if it is unknown."""
+    if crs is None:
+        return None
+    return CRS.from_user_input(crs).to_string()
+
+
+@beartype
+def parquet_coordinate_bounds(
+    parquet_file: pq.ParquetFile, longitude_column: str, latitude_column: str
+) -> Optional[Tuple[float, float, float, float]]:
+    """Compute the bounding box of coordinate columns from `Parquet` row group statistics.
+
+    Args:
+        parquet_file: The opened `Parquet` file.
+        longitude_column: The column holding longitudes (`x`).
+        latitude_column: The column holding latitudes (`y`).
+
+    Returns:
+        The bounding box as (`minx`, `miny`, `maxx`, `maxy`), or `None` if a column is
+        missing, or if any row group lacks numeric min/max statistics.
+    """
+    metadata = parquet_file.metadata
+    column_index = {
+        metadata.schema.column(index).path: index
+        for index in range(metadata.num_columns)
+    }
+    if (
+        longitude_column not in column_index
+        or latitude_column not in column_index
+        or metadata.num_row_groups == 0
+    ):
+        return None
+
+    bounds = []
+    for column in (longitude_column, latitude_column):
+        minimums, maximums = [], []
+        for row_group in range(metadata.num_row_groups):
+            statistics = (
+                metadata.row_group(row_group).column(column_index[column]).statistics
+            )
+            if statistics is None or not statistics.has_min_max:
+                return None
+            if not isinstance(statistics.min, (int, float)):
+                return None
+            minimums.append(statistics.min)
+            maximums.append(statistics.max)
+        bounds.append((float(min(minimums)), float(max(maximums))))
+    (minx, maxx), (miny, maxy) = bounds
+    return minx, miny, maxx, maxy
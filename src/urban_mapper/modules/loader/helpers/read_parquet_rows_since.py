@@ -0,0 +1,40 @@
+from typing import List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from beartype import beartype
+
+
+@beartype
+def read_parquet_rows_since(
+    parquet_file: pq.ParquetFile, rows: int, columns: Optional[List[str]] = None
+) -> pa.Table:
+    """Read the rows of a `Parquet` file past its first `rows` ones.
+
+    Row groups holding only rows before `rows` are not read at all.
+
+    Args:
+        parquet_file: The opened `Parquet` file.
+        rows: Number of leading rows to skip, e.g. the rows read by a previous load.
+        columns: Columns to read. Default: `None`, which reads every column.
+
+    Returns:
+        The rows past the first `rows` ones, possibly none.
+    """
+    metadata = parquet_file.metadata
+    row_groups: List[int] = []
+    skipped_rows = 0
+    first_row = 0
+    for row_group in range(metadata.num_row_groups):
+        row_group_rows = metadata.row_group(row_group).num_rows
+        if first_row + row_group_rows > rows:
+            if not row_groups:
+                skipped_rows = max(rows - first_row, 0)
+            row_groups.append(row_group)
+        first_row += row_group_rows
+    if not row_groups:
+        table = parquet_file.schema_arrow.empty_table()
+        return table.select(columns) if columns is not None else table
+    return parquet_file.read_row_groups(
+        row_groups, columns=columns, use_pandas_metadata=True
+    ).slice(skipped_rows)
@@ -0,0 +1,184 @@
+import datetime
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from beartype import beartype
+from pandas.api.types import is_datetime64_any_dtype, is_object_dtype, is_string_dtype
+from pandas.tseries.api import guess_datetime_format
+
+
+@beartype
+def normalise_time_range(
+    column: str, start: Any = None, end: Any = None
+) -> Tuple[str, Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+    """Normalise the bounds of a time range into `pd.Timestamp` values.
+
+    Args:
+        column: The datetime column the range applies to.
+        start: The first instant to keep, as anything `pd.Timestamp` accepts (e.g. `"2024-01-01"`).
+            Default: `None`, which keeps everything before `end`.
+        end: The first instant to drop. Default: `None`, which keeps everything after `start`.
+
+    Returns:
+        The (`column`, `start`, `end`) tuple, bounds as `pd.Timestamp` or `None`.
+
+    Raises:
+        ValueError: If both bounds are missing, or if `start` is not before `end`.
+    """
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+    if start is None and end is None:
+        raise ValueError("time_range needs a start, an end, or both.")
+    if start is not None and end is not None and start >= end:
+        raise ValueError(f"time_range start ({start}) must be before its end ({end}).")
+    return column, start, end
+
+
+@beartype
+def infer_datetime_format(values: pd.Series) -> Optional[str]:
+    """Infer the `strftime` format of a column of datetime strings from its first value.
+
+    Args:
+        values: The column, as read from the source.
+
+    Returns:
+        The inferred format, e.g. `"%Y-%m-%d %H:%M:%S"`, or `None` if the column holds no
+        string, or its format cannot be inferred.
+    """
+    if not (is_object_dtype(values) or is_string_dtype(values)):
+        return None
+    first_valid = values.first_valid_index()
+    if first_valid is None or not isinstance(values[first_valid], str):
+        return None
+    return guess_datetime_format(values[first_valid])
+
+
+@beartype
+def parse_datetimes(
+    values: pd.Series, datetime_format: Optional[str] = None
+) -> pd.Series:
+    """Parse a column into `datetime64` values, fast.
+
+    With a `datetime_format`, the column is parsed in a single vectorised pass rather than
+    value by value. Values not matching the format are parsed again on their own, so that a
+    few odd values (e.g. without fractional seconds) do not fail the whole column.
+    Values with different time zone offsets are converted to `UTC`. Unparseable values
+    become `NaT`.
+
+    Args:
+        values: The column to parse. Columns already holding datetimes are returned as is.
+        datetime_format: The `strftime` format of the values, as returned by
+            `infer_datetime_format()`. Default: `None`, which lets pandas infer it.
+
+    Returns:
+        The parsed column, with the same index.
+    """
+    if is_datetime64_any_dtype(values):
+        return values
+    if datetime_format is None:
+        return pd.to_datetime(values, errors="coerce")
+    parsed = pd.to_datetime(values, format=datetime_format, errors="coerce")
+    if not is_datetime64_any_dtype(parsed):
+        return _parse_mixed_offsets(values)
+    mismatched = parsed.isna() & values.notna()
+    if mismatched.any():
+        reparsed = pd.to_datetime(values[mismatched], format="mixed", errors="coerce")
+        if reparsed.dtype != parsed.dtype:
+            return _parse_mixed_offsets(values)
+        parsed[mismatched] = reparsed
+    return parsed
+
+
+@beartype
+def time_range_mask(
+    values: pd.Series,
+    start: Optional[pd.Timestamp] = None,
+    end: Optional[pd.Timestamp] = None,
+) -> np.ndarray:
+    """Mask the datetimes falling within [`start`, `end`).
+
+    Bounds are aligned with the column: naive bounds are taken in the column's time zone,
+    and aware bounds are converted to `UTC` for naive columns. Missing values are masked out.
+
+    Args:
+        values: The parsed datetimes, as returned by `parse_datetimes()`.
+        start: The first instant to keep. Default: `None`, which keeps everything before `end`.
+        end: The first instant to drop. Default: `None`, which keeps everything after `start`.
+
+    Returns:
+        A boolean array, `True` for the values within the range.
+    """
+    within = values.notna().to_numpy()
+    time_zone = values.dt.tz
+    if start is not None:
+        within &= (values >= _align_timestamp(start, time_zone)).to_numpy()
+    if end is not None:
+        within &= (values < _align_timestamp(end, time_zone)).to_numpy()
+    return within
+
+
+@beartype
+def parquet_row_groups_between(
+    parquet_file: pq.ParquetFile,
+    column: str,
+    start: Optional[pd.Timestamp] = None,
+    end: Optional[pd.Timestamp] = None,
+) -> List[int]:
+    """Select the row groups of a `Parquet` file that may hold datetimes within [`start`, `end`).
+
+    Row groups are skipped using the min/max statistics of `column`. Row groups lacking
+    statistics, or with statistics that are not datetimes (e.g. strings), are kept.
+
+    Args:
+        parquet_file: The opened `Parquet` file.
+        column: The datetime column.
+        start: The first instant to keep. Default: `None`
+        end: The first instant to drop. Default: `None`
+
+    Returns:
+        The indices of the row groups to read. Every row group if the column is missing.
+    """
+    metadata = parquet_file.metadata
+    row_groups = list(range(metadata.num_row_groups))
+    column_index = {
+        metadata.schema.column(index).path: index
+        for index in range(metadata.num_columns)
+    }
+    if column not in column_index:
+        return row_groups
+
+    def overlaps(row_group: int) -> bool:
+        statistics = (
+            metadata.row_group(row_group).column(column_index[column]).statistics
+        )
+        if statistics is None or not statistics.has_min_max:
+            return True
+        if not all(
+            isinstance(value, (datetime.date, datetime.datetime))
+            for value in (statistics.min, statistics.max)
+        ):
+            return True
+        minimum, maximum = pd.Timestamp(statistics.min), pd.Timestamp(statistics.max)
+        if start is not None and maximum < _align_timestamp(start, maximum.tz):
+            return False
+        if end is not None and minimum >= _align_timestamp(end, minimum.tz):
+            return False
+        return True
+
+    return [row_group for row_group in row_groups if overlaps(row_group)]
+
+
+def _align_timestamp(timestamp: pd.Timestamp, time_zone: Any) -> pd.Timestamp:
+    """Express a bound in the time zone of the values it is compared to."""
+    if time_zone is not None and timestamp.tzinfo is None:
+        return timestamp.tz_localize(time_zone)
+    if time_zone is None and timestamp.tzinfo is not None:
+        return timestamp.tz_convert("UTC").tz_localize(None)
+    return timestamp
+
+
+def _parse_mixed_offsets(values: pd.Series) -> pd.Series:
+    """Parse values of heterogeneous formats or time zone offsets, converting them to `UTC`."""
+    return pd.to_datetime(values, format="mixed", errors="coerce", utc=True)
@@ -0,0 +1,173 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from beartype import beartype
+
+from urban_mapper import logger
+
+
+@beartype
+class IncrementalState:
+    """Persisted high-water marks of incremental, append-only loads.
+
+    A `loader` given an `IncrementalState` only returns the records appended to its source
+    since the previous load, and records where it stopped in a `JSON` state file. The kind of
+    high-water mark depends on the loader:
+
+    - [x] `CSVLoader`: the byte offset reached in the file.
+    - [x] `ParquetLoader`, `GeoParquetLoader` and `ArrowLoader`: the number of rows read.
+    - [x] `PartitionedLoader`: the list of files already read.
+    - [x] Any loader with a `watermark_column`: the largest value of that column seen so far
+        (e.g. a timestamp), with hashes of the rows holding it, only rows at or above it not
+        loaded yet being returned.
+
+    Sources found shorter than their high-water mark are considered rewritten, and read
+    again from the start.
+
+    !!! note "Committing"
+        By default, high-water marks are saved as soon as the new records are loaded. With
+        `auto_commit=False`, they are kept pending until `commit()` is called, e.g. once the
+        results of the run are safely stored, so that a failed run loads the same records again.
+
+    Attributes:
+        state_path (Path): The `JSON` file holding the high-water marks.
+        auto_commit (bool): Whether to save high-water marks as soon as records are loaded. Default: `True`
+
+    Examples:
+        >>> from urban_mapper.modules.loader import CSVLoader, IncrementalState
+        >>> state = IncrementalState("state/taxi_trips.json")
+        >>> loader = CSVLoader("taxi_trips.csv", latitude_column="lat", longitude_column="lon", incremental=state)
+        >>> gdf = loader.load_data_from_file()  # Every row
+        >>> gdf = loader.load_data_from_file()  # Only the rows appended since
+        >>> state.reset("taxi_trips.csv")
+    """
+
+    def __init__(self, state_path: Union[str, Path], auto_commit: bool = True) -> None:
+        self.state_path: Path = Path(state_path).expanduser()
+        self.auto_commit = auto_commit
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def key(self, loader: Any) -> str:
+        """Compute the key under which a loader's high-water mark is stored.
+
+        Args:
+            loader: The loader about to load its source.
+
+        Returns:
+            The key, made of the loader's type, resolved source path and watermark column.
+        """
+        return json.dumps(
+            [
+                type(loader).__name__,
+                str(Path(loader.file_path).expanduser().resolve()),
+                loader.watermark_column,
+            ]
+        )
+
+    def get(self, key: str) -> Dict[str, Any]:
+        """Fetch a high-water mark, pending ones included.
+
+        Args:
+            key: The key, as returned by `key()`.
+
+        Returns:
+            The high-water mark, or an empty dictionary if the source was never loaded.
+        """
+        with self._lock:
+            if key in self._pending:
+                return dict(self._pending[key])
+            return dict(self._read().get(key, {}))
+
+    def put(self, key: str, watermark: Dict[str, Any]) -> None:
+        """Record a new high-water mark, saving it unless `auto_commit` is disabled.
+
+        Args:
+            key: The key, as returned by `key()`.
+            watermark: The new high-water mark. Must be `JSON`-serialisable.
+        """
+        with self._lock:
+            self._pending[key] = watermark
+        if self.auto_commit:
+            self.commit()
+
+    def commit(self) -> None:
+        """Save every pending high-water mark to the state file."""
+        with self._lock:
+            if not self._pending:
+                return
+            state = self._read()
+            state.update(self._pending)
+            self._write(state)
+            logger.log(
+                "DEBUG_LOW",
+                f"IncrementalState: committed {len(self._pending)} high-water marks to {self.state_path}",
+            )
+            self._pending.clear()
+
+    def rollback(self) -> None:
+        """Drop every pending high-water mark, so that the next load starts again from the saved ones."""
+        with self._lock:
+            self._pending.clear()
+
+    def reset(self, file_path: Optional[Union[str, Path]] = None) -> int:
+        """Forget the high-water marks of a source, or of every source.
+
+        Args:
+            file_path: The source to forget. Default: `None`, which forgets every source.
+
+        Returns:
+            The number of high-water marks forgotten.
+        """
+        with self._lock:
+            state = self._read()
+            resolved = (
+                str(Path(file_path).expanduser().resolve())
+                if file_path is not None
+                else None
+            )
+            forgotten = [
+                key
+                for key in set(state) | set(self._pending)
+                if resolved is None or json.loads(key)[1] == resolved
+            ]
+            for key in forgotten:
+                state.pop(key, None)
+                self._pending.pop(key, None)
+            self._write(state)
+        logger.log(
+            "DEBUG_LOW",
+            f"IncrementalState: reset {len(forgotten)} high-water marks in {self.state_path}",
+        )
+        return len(forgotten)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        if not self.state_path.exists():
+            return {}
+        return json.loads(self.state_path.read_text())
+
+    def _write(self, state: Dict[str, Dict[str, Any]]) -> None:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.state_path.parent, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "w") as file:
+                json.dump(state, file, indent=2, sort_keys=True, default=str)
+            os.replace(temporary_path, self.state_path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
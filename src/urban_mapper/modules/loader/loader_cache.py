@@ -0,0 +1,196 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import geopandas as gpd
+import pyarrow as pa
+import pyarrow.feather as feather
+from beartype import beartype
+
+from urban_mapper import logger
+from urban_mapper.modules.loader.helpers import (
+    arrow_table_to_geodataframe,
+    ACTIVE_GEOMETRY_METADATA_KEY,
+)
+from urban_mapper.utils import parse_byte_size
+
+CACHE_FILE_SUFFIX = ".arrow"
+
+
+@beartype
+class LoaderCache:
+    """On-disk cache of loaded, `CRS`-normalised datasets.
+
+    The cache stores the `GeoDataFrame` returned by a `loader`, once its geometries are built,
+    its coordinate reference system normalised and its columns mapped, as an uncompressed
+    `Arrow IPC` (`Feather`) file with `WKB` geometries. Later loads of the same file with the
+    same loader parameters read that file back instead of parsing the source again: the Arrow
+    table is memory-mapped, then copied into NumPy-backed columns and its geometries decoded,
+    so that a cached dataset has the same dtypes as a freshly loaded one.
+
+    Entries are keyed on the resolved path, size and modification time of the source file(s),
+    together with every parameter of the loader (columns, `CRS`, `map_columns`, etc.), so
+    that editing the file or changing the loader never serves stale data. The cache is
+    bounded in size, the least recently used entries being evicted first.
+
+    Attributes:
+        cache_directory (Path): Directory holding the cached datasets.
+        max_size (Optional[int]): Maximum size of the cache, in bytes. Default: `None`, which means unbounded.
+
+    Examples:
+        >>> from urban_mapper.modules.loader import CSVLoader, LoaderCache
+        >>> cache = LoaderCache("~/.cache/urban_mapper", max_size="10GB")
+        >>> loader = CSVLoader("taxi_trips.csv", latitude_column="lat", longitude_column="lon", cache=cache)
+        >>> gdf = loader.load_data_from_file()  # Parses the CSV and fills the cache
+        >>> gdf = loader.load_data_from_file()  # Reads the cached dataset back
+        >>> cache.invalidate("taxi_trips.csv")
+    """
+
+    def __init__(
+        self,
+        cache_directory: Union[str, Path],
+        max_size: Optional[Union[int, str]] = None,
+    ) -> None:
+        self.cache_directory: Path = Path(cache_directory).expanduser()
+        self.max_size: Optional[int] = (
+            parse_byte_size(max_size) if max_size is not None else None
+        )
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, loader: Any) -> str:
+        """Compute the cache key of a loader.
+
+        Args:
+            loader: The loader about to load its file.
+
+        Returns:
+            The name of the cache entry for this file and these loader parameters.
+        """
+        file_path = Path(loader.file_path).resolve()
+        source_files = [
+            (str(Path(source_file).resolve()), source_file.stat())
+            for source_file in loader._source_files()
+        ]
+        parameters = {
+            name: value
+            for name, value in vars(loader).items()
+            if name not in ("cache", "file_path") and not name.startswith("_")
+        }
+        fingerprint = json.dumps(
+            {
+                "loader": type(loader).__name__,
+                "file_path": str(file_path),
+                "source_files": [
+                    (source_file, file_stat.st_size, file_stat.st_mtime_ns)
+                    for source_file, file_stat in source_files
+                ],
+                "parameters": parameters,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return (
+            f"{self._path_digest(file_path)}-"
+            f"{hashlib.sha256(fingerprint.encode()).hexdigest()[:32]}"
+        )
+
+    def get(self, key: str) -> Optional[gpd.GeoDataFrame]:
+        """Fetch a cached dataset.
+
+        Args:
+            key: The cache key, as returned by `key()`.
+
+        Returns:
+            The cached `GeoDataFrame`, read from its memory-mapped Arrow file then copied
+            into NumPy-backed columns, or `None` on a cache miss.
+        """
+        entry = self._entry_path(key)
+        if not entry.exists():
+            logger.log("DEBUG_LOW", f"LoaderCache: miss for {key}")
+            return None
+        with pa.memory_map(str(entry)) as source:
+            geodataframe = arrow_table_to_geodataframe(
+                pa.ipc.open_file(source).read_all(), zero_copy=False
+            )
+        os.utime(entry)
+        logger.log("DEBUG_LOW", f"LoaderCache: hit for {key}")
+        return geodataframe
+
+    def put(self, key: str, geodataframe: gpd.GeoDataFrame) -> None:
+        """Store a dataset in the cache, then evict old entries if the cache is too large.
+
+        Args:
+            key: The cache key, as returned by `key()`.
+            geodataframe: The loaded dataset to store.
+        """
+        table = pa.table(geodataframe.to_arrow(geometry_encoding="WKB"))
+        table = table.replace_schema_metadata(
+            {
+                **(table.schema.metadata or {}),
+                ACTIVE_GEOMETRY_METADATA_KEY: geodataframe.active_geometry_name.encode(),
+            }
+        )
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.cache_directory, suffix=".tmp"
+        )
+        os.close(file_descriptor)
+        try:
+            feather.write_feather(table, temporary_path, compression="uncompressed")
+            os.replace(temporary_path, self._entry_path(key))
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+        logger.log("DEBUG_LOW", f"LoaderCache: stored {key}")
+        self._evict()
+
+    def invalidate(self, file_path: Union[str, Path]) -> int:
+        """Drop every cached dataset loaded from a given file.
+
+        Args:
+            file_path: The source file whose cached datasets should be dropped.
+
+        Returns:
+            The number of entries removed.
+        """
+        digest = self._path_digest(Path(file_path).expanduser().resolve())
+        entries = list(self.cache_directory.glob(f"{digest}-*{CACHE_FILE_SUFFIX}"))
+        for entry in entries:
+            entry.unlink(missing_ok=True)
+        logger.log(
+            "DEBUG_LOW",
+            f"LoaderCache: invalidated {len(entries)} entries for {file_path}",
+        )
+        return len(entries)
+
+    def clear(self) -> None:
+        """Drop every cached dataset."""
+        for entry in self._entries():
+            entry.unlink(missing_ok=True)
+
+    def size(self) -> int:
+        """Get the current size of the cache, in bytes."""
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def _evict(self) -> None:
+        if self.max_size is None:
+            return
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime_ns)
+        total_size = sum(entry.stat().st_size for entry in entries)
+        while entries and total_size > self.max_size:
+            oldest = entries.pop(0)
+            total_size -= oldest.stat().st_size
+            oldest.unlink(missing_ok=True)
+            logger.log("DEBUG_LOW", f"LoaderCache: evicted {oldest.stem}")
+
+    def _entries(self) -> list:
+        return list(self.cache_directory.glob(f"*{CACHE_FILE_SUFFIX}"))
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_directory / f"{key}{CACHE_FILE_SUFFIX}"
+
+    @staticmethod
+    def _path_digest(file_path: Path) -> str:
+        return hashlib.sha256(str(file_path).encode()).hexdigest()[:16]
@@ -1,12 +1,12 @@
+import inspect
 import json
 from collections import defaultdict
-from itertools import islice
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Union, Dict, Tuple
+from typing import Optional, Union, Dict, Tuple, Iterator, Any, List
 
 import datasets
 import geopandas as gpd
-from shapely import wkt
 import huggingface_hub
 import pandas as pd
 from beartype import beartype
@@ -15,19 +15,90 @@ from thefuzz import process
 from urban_mapper import logger
 from urban_mapper.config import DEFAULT_CRS
 from urban_mapper.modules.loader.abc_loader import LoaderBase
+from urban_mapper.modules.loader.loader_cache import LoaderCache
+from urban_mapper.modules.loader.incremental_state import IncrementalState
 from urban_mapper.modules.loader.loaders.csv_loader import CSVLoader
 from urban_mapper.modules.loader.loaders.parquet_loader import ParquetLoader
 from urban_mapper.modules.loader.loaders.shapefile_loader import ShapefileLoader
-from urban_mapper.utils import require_attributes
+from urban_mapper.modules.loader.loaders.geoparquet_loader import GeoParquetLoader
+from urban_mapper.modules.loader.loaders.arrow_loader import ArrowLoader
+from urban_mapper.modules.loader.loaders.ogr_loader import OGRLoader
+from urban_mapper.modules.loader.loaders.partitioned_loader import PartitionedLoader
+from urban_mapper.modules.loader.loaders.duckdb_loader import DuckDBLoader
+from urban_mapper.modules.loader.loaders.raster_loader import RasterLoader
+from urban_mapper.modules.loader.helpers import (
+    decode_geometries,
+    discover_files,
+    compact_geodataframe,
+    is_glob_pattern,
+    is_multi_file_source,
+    points_from_coordinates,
+    uncompressed_suffix,
+    COMPRESSION_SUFFIXES,
+    normalise_time_range,
+    infer_datetime_format,
+    parse_datetimes,
+    time_range_mask,
+)
+from urban_mapper.utils import require_attributes, defensive_copy
 from urban_mapper.utils.helpers.reset_attribute_before import reset_attributes_before
 
 FILE_LOADER_FACTORY = {
     ".csv": {"class": CSVLoader, "requires_columns": True},
     ".shp": {"class": ShapefileLoader, "requires_columns": False},
     ".parquet": {"class": ParquetLoader, "requires_columns": True},
+    ".geoparquet": {"class": GeoParquetLoader, "requires_columns": False},
+    ".arrow": {"class": ArrowLoader, "requires_columns": False},
+    ".feather": {"class": ArrowLoader, "requires_columns": False},
+    ".gpkg": {"class": OGRLoader, "requires_columns": False},
+    ".geojson": {"class": OGRLoader, "requires_columns": False},
+    ".fgb": {"class": OGRLoader, "requires_columns": False},
+    ".tif": {"class": RasterLoader, "requires_columns": False},
+    ".tiff": {"class": RasterLoader, "requires_columns": False},
 }
 
 
+HUGGINGFACE_STREAMING_BATCH_SIZE = 100_000
+
+
+@contextmanager
+def _huggingface_offline(offline: bool) -> Iterator[None]:
+    """Keep `datasets` and `huggingface_hub` away from the network, for the duration of the block."""
+    if not offline:
+        yield
+        return
+    previous = (
+        datasets.config.HF_HUB_OFFLINE,
+        huggingface_hub.constants.HF_HUB_OFFLINE,
+    )
+    datasets.config.HF_HUB_OFFLINE = huggingface_hub.constants.HF_HUB_OFFLINE = True
+    try:
+        yield
+    finally:
+        datasets.config.HF_HUB_OFFLINE, huggingface_hub.constants.HF_HUB_OFFLINE = (
+            previous
+        )
+
+
+def _format_schema(schema: Dict[str, Any]) -> str:
+    """Format a schema probed by `LoaderBase.probe_schema()` for the ascii preview."""
+    row_count = schema["row_count"]
+    if row_count is not None and schema.get("row_count_is_estimate"):
+        row_count = f"~{row_count} (estimated)"
+    lines = [
+        "  Schema:",
+        f"    Rows: {row_count if row_count is not None else 'Unknown'}",
+        f"    CRS: {schema['crs'] or 'Unknown'}",
+        f"    Bounding Box: {schema['bounding_box'] or 'Unknown'}",
+        "    Columns:",
+    ]
+    lines.extend(
+        f"      {column}: {column_type}"
+        for column, column_type in schema["columns"].items()
+    )
+    return "\n".join(lines) + "\n"
+
+
 @beartype
 class LoaderFactory:
     """Factory class for creating and configuring data loaders.
@@ -39,11 +110,17 @@ class LoaderFactory:
     interface regardless of the underlying data source.
     
     Attributes:
-        source_type: The type of data source ("file" or "dataframe").
-        source_data: The actual data source (file path or dataframe).
+        source_type: The type of data source ("file", "dataframe", "huggingface" or "sql").
+        source_data: The actual data source (file path, dataframe, dataset or `SQL` query).
+        sql_files: Files registered as views for the `SQL` query, if any.
         latitude_column: The name of the column containing latitude values.
         longitude_column: The name of the column containing longitude values.
         crs: The coordinate reference system to use for the loaded data.
+        chunksize: Number of rows to read at a time, when streaming the file chunk by chunk.
+        cache: On-disk cache of loaded datasets, if any.
+        incremental: High-water marks of incremental loads, if any.
+        time_range: Datetime column and [`start`, `end`) bounds of the rows to keep, if any.
+        loader_options: Extra keyword arguments handed over to the file loader (e.g. `engine` for `CSVLoader`).
         _instance: The underlying loader instance (internal use only).
         _preview: Preview configuration (internal use only).
         
@@ -69,12 +146,26 @@ class LoaderFactory:
 
     def __init__(self):
         self.source_type: Optional[str] = None
-        self.source_data: Optional[Union[str, pd.DataFrame, gpd.GeoDataFrame]] = None
+        self.source_data: Optional[
+            Union[str, pd.DataFrame, gpd.GeoDataFrame, datasets.IterableDataset]
+        ] = None
         self.latitude_column: Optional[str] = None
         self.longitude_column: Optional[str] = None
         self.map_columns: Optional[Dict[str, str]] = None
         self.geometry_column: Optional[str] = None
         self.crs: Union[str, Tuple[str, str]] = DEFAULT_CRS
+        self.chunksize: Optional[int] = None
+        self.cache: Optional[LoaderCache] = None
+        self.compaction: Optional[Dict[str, Any]] = None
+        self.incremental: Optional[IncrementalState] = None
+        self.watermark_column: Optional[str] = None
+        self.time_range: Optional[
+            Tuple[str, Optional[pd.Timestamp], Optional[pd.Timestamp]]
+        ] = None
+        self.loader_options: Dict[str, Any] = {}
+        self.partition_filter: Optional[Dict[str, Any]] = None
+        self.max_workers: Optional[int] = None
+        self.sql_files: Optional[Dict[str, Union[str, Path]]] = None
         self._instance: Optional[LoaderBase] = None
         self._preview: Optional[dict] = None
 
@@ -86,6 +177,16 @@ class LoaderFactory:
         self.map_columns = None
         self.geometry_column = None
         self.crs = DEFAULT_CRS
+        self.chunksize = None
+        self.cache = None
+        self.compaction = None
+        self.incremental = None
+        self.watermark_column = None
+        self.time_range = None
+        self.loader_options = {}
+        self.partition_filter = None
+        self.max_workers = None
+        self.sql_files = None
         self._instance = None
         self._preview = None
 
@@ -94,10 +195,21 @@ class LoaderFactory:
 
         This method sets up the factory to load data from a file path. The file format
         is determined by the file extension. Supported formats include `CSV`, `shapefile`,
-        and `Parquet`.
+        `Parquet`, `GeoParquet` (`.geoparquet`), `Arrow IPC` / `Feather` (`.arrow`, `.feather`),
+        `GeoPackage`, `GeoJSON` and `FlatGeobuf` (`.gpkg`, `.geojson`, `.fgb`), and `GeoTIFF`
+        rasters (`.tif`, `.tiff`), whose valid pixels are loaded as points.
+
+        A glob pattern (`trips/2024-*.parquet`) or a directory (e.g. `hive`-partitioned,
+        `trips/year=2024/month=05/`) loads every matching file at once, concurrently, through a
+        `PartitionedLoader`. See `with_partition_filter()` and `with_max_workers()`.
+
+        Compressed files are streamed through decompression, never extracted to disk: `CSV`
+        files compressed with `gzip`, `bzip2` or `zstd` (`.csv.gz`, `.csv.bz2`, `.csv.zst`) or
+        zipped, and `zip` archives or `gzip` files of `OGR` formats (e.g. a zipped `shapefile`
+        bundle, `parcels.zip`, or `.geojson.gz`).
 
         Args:
-            file_path: Path to the data file to load.
+            file_path: Path to the data file to load, glob pattern, or directory.
 
         Returns:
             The LoaderFactory instance for method chaining.
@@ -105,6 +217,12 @@ class LoaderFactory:
         Examples:
             >>> loader = mapper.loader.from_file("data/points.csv")
             >>> # Next steps would typically be to call with_columns() and load()
+            >>>
+            >>> # One file per day
+            >>> loader = mapper.loader.from_file("data/trips/2024-*.parquet")
+            >>>
+            >>> # A zipped shapefile bundle, as downloaded
+            >>> loader = mapper.loader.from_file("data/parcels.zip")
         """
         self._reset()
         self.source_type = "file"
@@ -150,6 +268,52 @@ class LoaderFactory:
         )
         return self
 
+    def from_sql(
+        self, query: str, files: Optional[Dict[str, Union[str, Path]]] = None
+    ) -> "LoaderFactory":
+        """Configure the factory to load the result of a `SQL` query run in `DuckDB`.
+
+        This method sets up the factory to run a query in an in-process `DuckDB` database,
+        through a `DuckDBLoader`, so that filters, projections, joins and aggregations run
+        in `DuckDB`'s vectorised, multi-threaded engine, straight on the files, and only the
+        result reaches pandas. Each of `files` is registered as a view named after its key.
+        As for other sources, call `with_columns()` to point at the result's coordinates or
+        geometry.
+
+        Options of the `DuckDBLoader`, such as the `database` file to query, the number of
+        `threads`, or whether to load the `spatial` extension, are set with `with_options()`.
+
+        !!! note "Optional dependency"
+            This source requires `duckdb`, which is not installed with `UrbanMapper`.
+            Install it with `uv add duckdb`.
+
+        Args:
+            query: The `SQL` query whose result is loaded.
+            files: Mapping from view name to the file, or glob pattern, registered under it.
+                Default: `None`, when querying a `database` file set with `with_options()`.
+
+        Returns:
+            The LoaderFactory instance for method chaining.
+
+        Examples:
+            >>> gdf = mapper.loader.from_sql(
+            ...         "SELECT pickup_lat, pickup_lng, fare FROM trips WHERE fare > 50",
+            ...         files={"trips": "data/taxi_trips/*.parquet"},
+            ...     )\
+            ...     .with_columns(longitude_column="pickup_lng", latitude_column="pickup_lat")\
+            ...     .with_options(threads=8)\
+            ...     .load()
+        """
+        self._reset()
+        self.source_type = "sql"
+        self.source_data = query
+        self.sql_files = files
+        logger.log(
+            "DEBUG_LOW",
+            f"FROM_SQL: Initialised LoaderFactory with query={query} and files={files}",
+        )
+        return self
+
     def _build_dataset_dict(self, limit: Optional[int] = None):
         all_datasets = [
             dataset.id
@@ -172,6 +336,9 @@ class LoaderFactory:
         number_of_rows: Optional[int] = None,
         streaming: Optional[bool] = False,
         debug_limit_list_datasets: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        offline: bool = False,
     ) -> "LoaderFactory":
         """
         Load a dataset from `Hugging Face's Hub` using the `datasets` library.
@@ -221,11 +388,21 @@ class LoaderFactory:
 
             Errors come with context—like available datasets in a namespace—so you can fix it fast.
 
+        !!! tip "Fast and lean loading"
+            Datasets are converted straight from their underlying `Arrow` table to pandas, restricted beforehand
+            to `columns` when given. In streaming mode, nothing is downloaded until `load()`, which then reads
+            the dataset batch by batch; combined with `with_chunksize()`, `load()` yields one `GeoDataFrame`
+            per batch, so that the whole dataset never sits in memory.
+
         Args:
             repo_id (str): The dataset repository ID on Hugging Face.
             number_of_rows (Optional[int]): Number of rows to load. Defaults to None.
             streaming (Optional[bool]): Whether to use streaming mode. Defaults to False.
             debug_limit_list_datasets (Optional[int]): Limit on datasets fetched for error handling. Defaults to None.
+            columns (Optional[List[str]]): Columns to keep, selected before any conversion. Defaults to None, which keeps every column.
+            cache_dir (Optional[Union[str, Path]]): Directory of the local dataset cache. Defaults to None, which uses
+                the `datasets` library's default cache.
+            offline (bool): Whether to only use the local dataset cache, without reaching the Hub. Defaults to False.
 
         Returns:
             LoaderFactory: The updated LoaderFactory instance for method chaining.
@@ -244,6 +421,15 @@ class LoaderFactory:
             >>> gdf = loader.load()
             >>> print(gdf.head())  # Next steps: process the loaded subset
 
+            >>> # Stream the coordinates of a large dataset, 100,000 rows at a time
+            >>> chunks = mapper.loader.from_huggingface("oscur/pluto", streaming=True, columns=["latitude", "longitude"])\
+            ...     .with_columns(longitude_column="longitude", latitude_column="latitude")\
+            ...     .with_chunksize(100_000)\
+            ...     .load()
+
+            >>> # Reuse a previously downloaded dataset, without network access
+            >>> loader = mapper.loader.from_huggingface("oscur/pluto", cache_dir="~/hf_cache", offline=True)
+
             >>> # Load 1000 rows without streaming
             >>> loader = mapper.loader.from_huggingface("oscur/taxisvis1M", number_of_rows=1000)
             >>> gdf = loader.load()
@@ -279,32 +465,51 @@ class LoaderFactory:
         """
         self._reset()
         self.source_type = "huggingface"
+        if streaming and offline:
+            raise ValueError(
+                "Streaming reads the dataset from the Hub and cannot be used offline. "
+                "Set streaming=False to load it from the local cache."
+            )
         try:
-            if number_of_rows:
-                if streaming:
-                    # Use streaming mode to fetch only the required rows
-                    dataset = datasets.load_dataset(
-                        repo_id, split="train", streaming=True
-                    )
-                    limited_rows = list(islice(dataset, number_of_rows))
-                    self.source_data = pd.DataFrame(limited_rows)
-                    logger.log(
-                        "DEBUG_LOW",
-                        f"Loaded {number_of_rows} rows in streaming mode from {repo_id}.",
-                    )
-                else:
-                    # Use slicing with split for non-streaming mode
-                    dataset = datasets.load_dataset(
-                        repo_id, split=f"train[:{number_of_rows}]"
-                    )
-                    self.source_data = pd.DataFrame(dataset)
-                    logger.log(
-                        "DEBUG_LOW", f"Loaded {number_of_rows} rows from {repo_id}."
-                    )
+            with _huggingface_offline(offline):
+                dataset = datasets.load_dataset(
+                    repo_id,
+                    split=(
+                        f"train[:{number_of_rows}]"
+                        if number_of_rows and not streaming
+                        else "train"
+                    ),
+                    streaming=bool(streaming),
+                    cache_dir=(
+                        str(Path(cache_dir).expanduser())
+                        if cache_dir is not None
+                        else None
+                    ),
+                )
+            if columns is not None:
+                dataset = dataset.select_columns(columns)
+            if streaming:
+                if number_of_rows:
+                    dataset = dataset.take(number_of_rows)
+                # Batches are only fetched by load(), as Arrow tables
+                self.source_data = dataset.with_format("arrow")
+                logger.log(
+                    "DEBUG_LOW",
+                    f"Opened {repo_id} in streaming mode"
+                    + (
+                        f", limited to {number_of_rows} rows."
+                        if number_of_rows
+                        else "."
+                    ),
+                )
             else:
-                dataset = datasets.load_dataset(repo_id, split="train")
-                self.source_data = pd.DataFrame(dataset)
-                logger.log("DEBUG_LOW", f"Loaded dataset {repo_id}.")
+                self.source_data = dataset.with_format("arrow")[:].to_pandas(
+                    split_blocks=True
+                )
+                logger.log(
+                    "DEBUG_LOW",
+                    f"Loaded {len(self.source_data)} rows from {repo_id}.",
+                )
 
         except datasets.exceptions.DatasetNotFoundError as e:
             dataset_dict = self._build_dataset_dict(limit=debug_limit_list_datasets)
@@ -489,51 +694,536 @@ class LoaderFactory:
         )
         return self
 
-    def _load_from_file(self) -> gpd.GeoDataFrame:
-        file_path: str = self.source_data
-        file_ext = Path(file_path).suffix.lower()
-        loader_class = FILE_LOADER_FACTORY[file_ext]["class"]
-        self._instance = loader_class(
-            file_path,
+    def with_chunksize(self, chunksize: int) -> "LoaderFactory":
+        """Stream the file chunk by chunk instead of loading it all at once.
+
+        This method configures how many rows are read at a time. Once set, `load()` returns
+        an iterator of `GeoDataFrames`, each already converted to the configured `CRS`,
+        so that peak memory is bounded by the chunk size rather than by the file size.
+        Loaders built with `build()` for an `UrbanPipeline` parse the file chunk by chunk too.
+
+        Args:
+            chunksize: Number of rows per chunk. Must be a positive integer.
+
+        Returns:
+            The LoaderFactory instance for method chaining.
+
+        Raises:
+            ValueError: If `chunksize` is not a positive integer.
+
+        Examples:
+            >>> chunks = mapper.loader.from_file("data/taxi_trips.csv")\
+            ...     .with_columns(longitude_column="lon", latitude_column="lat")\
+            ...     .with_chunksize(500_000)\
+            ...     .load()
+            >>> for chunk in chunks:
+            ...     print(len(chunk))
+        """
+        if chunksize <= 0:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}.")
+        self.chunksize = chunksize
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_CHUNKSIZE: Initialised LoaderFactory with chunksize={chunksize}",
+        )
+        return self
+
+    def with_cache(
+        self,
+        cache_directory: Union[str, Path],
+        max_size: Optional[Union[int, str]] = None,
+    ) -> "LoaderFactory":
+        """Cache the loaded dataset on disk, so that later runs skip parsing it.
+
+        This method makes the loader store the ready-to-use `GeoDataFrame` (geometries built,
+        `CRS` normalised, columns mapped) in `cache_directory`. Later loads of the same file,
+        with the same loader parameters, read the cached Arrow file back instead of parsing
+        the file again. Editing the file or changing any parameter misses the cache.
+
+        !!! note "File sources only"
+            The cache applies to file sources loaded whole. DataFrame and Hugging Face sources,
+            as well as chunked loads, bypass it.
+
+        Args:
+            cache_directory: Directory holding the cached datasets. Created if missing.
+            max_size: Maximum size of the cache, in bytes or as a string such as `"10GB"`.
+                The least recently used datasets are evicted beyond it. Default: `None`, unbounded.
+
+        Returns:
+            The LoaderFactory instance for method chaining.
+
+        Examples:
+            >>> gdf = mapper.loader.from_file("data/taxi_trips.csv")\
+            ...     .with_columns(longitude_column="lon", latitude_column="lat")\
+            ...     .with_cache("~/.cache/urban_mapper", max_size="10GB")\
+            ...     .load()
+            >>> # Drop the cached versions of a file
+            >>> mapper.loader.from_file("data/taxi_trips.csv")\
+            ...     .with_cache("~/.cache/urban_mapper").cache.invalidate("data/taxi_trips.csv")
+        """
+        self.cache = LoaderCache(cache_directory, max_size=max_size)
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_CACHE: Initialised LoaderFactory with cache_directory={cache_directory}, max_size={max_size}",
+        )
+        return self
+
+    def with_incremental(
+        self,
+        state_path: Union[str, Path],
+        watermark_column: Optional[str] = None,
+        auto_commit: bool = True,
+    ) -> "LoaderFactory":
+        """Only load the records appended to the source since the previous run.
+
+        This method makes the loader record, in the `JSON` file `state_path`, how far it read
+        its source (a high-water mark), and only return the records appended since on later
+        runs: the lines past the last byte offset read for a `CSV` file, the rows past the last
+        row count for `Parquet`, `GeoParquet` and `Arrow` files, and the files not read yet for
+        a glob pattern or directory. With a `watermark_column` (e.g. a timestamp), the rows
+        whose value reaches the largest value seen so far, and were not loaded yet, are returned
+        instead, whatever the format.
+
+        !!! note "Watermark columns"
+            Values need not be strictly increasing: rows appended later with the same largest
+            value (e.g. timestamps to the day) are still loaded, those already loaded being
+            recognised by a hash of their other columns. Datetime columns are pushed down as a
+            `time_range`, so that `Parquet`, `GeoParquet` and `OGR` sources skip older data while
+            reading, unless the loader has a `time_range` of its own. Other columns are read
+            whole on every run.
+
+        !!! tip "Merging results"
+            Enrichers built with `with_merge()` update their output columns with the results
+            of the new records, rather than overwriting them.
+
+        !!! note "File sources only"
+            Incremental loads apply to file sources, and bypass `with_cache()`.
+
+        Args:
+            state_path: The `JSON` file holding the high-water marks. Created if missing.
+            watermark_column: Column whose largest value seen so far is the high-water mark,
+                e.g. a timestamp or an increasing identifier.
+                Default: `None`, which uses the format's own notion of appended records.
+            auto_commit: Whether to save the high-water marks as soon as the records are loaded.
+                With `False`, call `incremental.commit()` once the results of the run are stored,
+                so that a failed run loads the same records again. Default: `True`
+
+        Returns:
+            The LoaderFactory instance for method chaining.
+
+        Examples:
+            >>> new_trips = mapper.loader.from_file("data/trips/")\
+            ...     .with_columns(longitude_column="lon", latitude_column="lat")\
+            ...     .with_incremental("state/trips.json")\
+            ...     .load()
+            >>> # Rows stamped after the previous run only
+            >>> new_complaints = mapper.loader.from_file("data/311_complaints.csv")\
+            ...     .with_columns(longitude_column="lon", latitude_column="lat")\
+            ...     .with_incremental("state/311.json", watermark_column="created_date")\
+            ...     .load()
+        """
+        self.incremental = IncrementalState(state_path, auto_commit=auto_commit)
+        self.watermark_column = watermark_column
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_INCREMENTAL: Initialised LoaderFactory with state_path={state_path}, "
+            f"watermark_column={watermark_column}, auto_commit={auto_commit}",
+        )
+        return self
+
+    def with_compaction(
+        self,
+        categorical_threshold: float = 0.5,
+        coordinate_tolerance: Optional[float] = None,
+        keep_columns: Optional[List[str]] = None,
+    ) -> "LoaderFactory":
+        """Shrink the loaded `GeoDataFrame` in memory, right after loading it.
+
+        Integer and float columns are downcast to the smallest type holding their values
+        exactly, and string columns with few distinct values are stored as `categoricals`.
+        Latitude and longitude columns are only stored as `float32` when no coordinate moves
+        by more than `coordinate_tolerance`. Columns outside of `keep_columns` are dropped; in an
+        `UrbanPipeline` with `pushdown`, so are the columns no step uses. A per-column memory
+        report is sent to the debug logger.
+
+        !!! note "Whole loads only"
+            Chunked loads are not compacted, as chunks could end up with different types.
+
+        Args:
+            categorical_threshold: String columns whose ratio of distinct values to rows is at most this
+                are stored as `categoricals`. Default: `0.5`
+            coordinate_tolerance: Largest acceptable change of a coordinate, in the units of the coordinates
+                (e.g. `1e-5` degrees, about a metre). Default: `None`, which keeps coordinates as `float64`.
+            keep_columns: Columns to keep, after `with_map()` renaming. Coordinate and geometry columns are
+                always kept. Default: `None`, which keeps every column.
+
+        Returns:
+            The LoaderFactory instance for method chaining.
+
+        Examples:
+            >>> gdf = mapper.loader.from_file("data/311_complaints.csv")\
+            ...     .with_columns(longitude_column="lon", latitude_column="lat")\
+            ...     .with_compaction(coordinate_tolerance=1e-5)\
+            ...     .load()
+        """
+        if not 0 <= categorical_threshold <= 1:
+            raise ValueError(
+                f"categorical_threshold must be between 0 and 1, got {categorical_threshold}."
+            )
+        self.compaction = {
+            "categorical_threshold": categorical_threshold,
+            "coordinate_tolerance": coordinate_tolerance,
+            "keep_columns": keep_columns,
+        }
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_COMPACTION: Initialised LoaderFactory with compaction={self.compaction}",
+        )
+        return self
+
+    def with_options(self, **loader_options: Any) -> "LoaderFactory":
+        """Hand over format-specific options to the file loader.
+
+        This method forwards keyword arguments to the constructor of the loader picked from
+        the file extension, for options that only make sense for some formats, such as the
+        `engine`, `schema_path` or `parallel` of `CSVLoader`, or the `columns` of `ParquetLoader`.
+        Calling it several times merges the options.
+
+        Args:
+            **loader_options: Keyword arguments for the loader's constructor.
+
+        Returns:
+            The LoaderFactory instance for method chaining.
+
+        Examples:
+            >>> gdf = mapper.loader.from_file("data/taxi_trips.csv")\
+            ...     .with_columns(longitude_column="lon", latitude_column="lat")\
+            ...     .with_options(engine="pyarrow", schema_path="data/taxi_trips.schema")\
+            ...     .load()
+            >>>
+            >>> # Parse a multi-gigabyte CSV file on eight cores
+            >>> gdf = mapper.loader.from_file("data/taxi_trips.csv")\
+            ...     .with_columns(longitude_column="lon", latitude_column="lat")\
+            ...     .with_options(parallel=8)\
+            ...     .load()
+        """
+        self.loader_options.update(loader_options)
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_OPTIONS: Initialised LoaderFactory with loader_options={self.loader_options}",
+        )
+        return self
+
+    def with_filters(
+        self,
+        bbox: Optional[Tuple[Union[int, float], ...]] = None,
+        mask: Optional[Any] = None,
+        where: Optional[str] = None,
+        columns: Optional[list] = None,
+    ) -> "LoaderFactory":
+        """Filter the features read from a vector file, while it is being read.
+
+        This method forwards filters to `OGRLoader` (`GeoPackage`, `GeoJSON`, `FlatGeobuf` and
+        `shapefiles`), which has `GDAL` evaluate them during the read, using the file's spatial
+        index where there is one, so that discarded features are never materialised.
+
+        Args:
+            bbox: Only read features intersecting this (`minx`, `miny`, `maxx`, `maxy`) box,
+                expressed in the file's coordinate reference system. Default: `None`
+            mask: Only read features intersecting this `shapely` geometry, expressed in the file's
+                coordinate reference system. Cannot be combined with `bbox`. Default: `None`
+            where: `OGR SQL` `WHERE` clause to filter features on their attributes. Default: `None`
+            columns: List of attribute columns to read. Default: `None`, which reads all columns.
+
+        Returns:
+            The LoaderFactory instance for method chaining.
+
+        Raises:
+            ValueError: If the source is not a file, or if its loader does not support one of the filters.
+
+        Examples:
+            >>> gdf = mapper.loader.from_file("data/parcels.gpkg")\
+            ...     .with_filters(
+            ...         bbox=(-74.02, 40.70, -73.97, 40.75),
+            ...         where="land_use = 'residential'",
+            ...         columns=["parcel_id", "land_use"],
+            ...     )\
+            ...     .load()
+        """
+        if self.source_type != "file":
+            raise ValueError("with_filters() can only be used with from_file().")
+        filters = {
+            name: value
+            for name, value in {
+                "bbox": bbox,
+                "mask": mask,
+                "where": where,
+                "columns": columns,
+            }.items()
+            if value is not None
+        }
+        file_ext = uncompressed_suffix(self.source_data, FILE_LOADER_FACTORY)
+        if file_ext in FILE_LOADER_FACTORY:
+            supported = inspect.signature(
+                FILE_LOADER_FACTORY[file_ext]["class"].__init__
+            ).parameters
+            unsupported = [name for name in filters if name not in supported]
+            if unsupported:
+                raise ValueError(
+                    f"Filters {unsupported} are not supported for '{file_ext}' files."
+                )
+        self.loader_options.update(filters)
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_FILTERS: Initialised LoaderFactory with filters={filters}",
+        )
+        return self
+
+    def with_time_range(
+        self, column: str, start: Any = None, end: Any = None
+    ) -> "LoaderFactory":
+        """Only load the rows whose datetime `column` falls within [`start`, `end`).
+
+        The range is pushed down to the loader, so that data outside of it is skipped while
+        reading where the format allows: `Parquet` and `GeoParquet` row groups are pruned
+        from their statistics, `OGR` formats get a `where` clause evaluated by `GDAL`, and
+        `SQL` queries a `WHERE` clause evaluated by `DuckDB`. `CSV` files are still scanned,
+        but rows are dropped chunk by chunk, before any geometry is built.
+
+        The column is parsed into datetimes on the way, with a format inferred once from its
+        first value rather than guessed value by value.
+
+        !!! note "Half-open range"
+            `start` is kept and `end` is dropped, so that consecutive ranges (e.g. months)
+            never share a row.
+
+        Args:
+            column: The datetime column to filter on.
+            start: The first instant to keep, as anything `pd.Timestamp` accepts (e.g.
+                `"2024-05-01"`). Default: `None`, which keeps everything before `end`.
+            end: The first instant to drop. Default: `None`, which keeps everything after `start`.
+
+        Returns:
+            The LoaderFactory instance for method chaining.
+
+        Raises:
+            ValueError: If both bounds are missing, or if `start` is not before `end`.
+
+        Examples:
+            >>> may = mapper.loader.from_file("data/taxi_trips.parquet")\
+            ...     .with_columns(longitude_column="lon", latitude_column="lat")\
+            ...     .with_time_range("pickup_datetime", "2024-05-01", "2024-06-01")\
+            ...     .load()
+        """
+        self.time_range = normalise_time_range(column, start, end)
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_TIME_RANGE: Initialised LoaderFactory with time_range={self.time_range}",
+        )
+        return self
+
+    def with_partition_filter(self, **partition_values: Any) -> "LoaderFactory":
+        """Only load some partitions of a partitioned directory or glob pattern.
+
+        Partitions are read from `hive`-style directory names (`year=2024/month=05/`).
+        Directories whose partition value is not accepted are skipped entirely, without even
+        being listed. Calling it several times merges the filters.
+
+        Args:
+            **partition_values: Accepted value, or list of accepted values, per partition key.
+
+        Returns:
+            The LoaderFactory instance for method chaining.
+
+        Raises:
+            ValueError: If the source is not a glob pattern or a directory.
+
+        Examples:
+            >>> gdf = mapper.loader.from_file("data/trips/")\
+            ...     .with_columns(longitude_column="lon", latitude_column="lat")\
+            ...     .with_partition_filter(year=2024, month=["05", "06"])\
+            ...     .load()
+        """
+        if self.source_type != "file" or not is_multi_file_source(self.source_data):
+            raise ValueError(
+                "with_partition_filter() can only be used with from_file() on a glob pattern or a directory."
+            )
+        self.partition_filter = {**(self.partition_filter or {}), **partition_values}
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_PARTITION_FILTER: Initialised LoaderFactory with partition_filter={self.partition_filter}",
+        )
+        return self
+
+    def with_max_workers(self, max_workers: int) -> "LoaderFactory":
+        """Set how many files of a glob pattern or directory are read concurrently.
+
+        Args:
+            max_workers: Number of files read at the same time.
+
+        Returns:
+            The LoaderFactory instance for method chaining.
+
+        Raises:
+            ValueError: If `max_workers` is not a positive integer.
+
+        Examples:
+            >>> gdf = mapper.loader.from_file("data/trips/2024-*.parquet")\
+            ...     .with_columns(longitude_column="lon", latitude_column="lat")\
+            ...     .with_max_workers(8)\
+            ...     .load()
+        """
+        if max_workers <= 0:
+            raise ValueError(
+                f"max_workers must be a positive integer, got {max_workers}."
+            )
+        self.max_workers = max_workers
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_MAX_WORKERS: Initialised LoaderFactory with max_workers={max_workers}",
+        )
+        return self
+
+    def _file_extension(self) -> str:
+        """Get the extension picking the loader, looking inside directories and archives if need be.
+
+        Compressed files are picked by the extension of what they hold, e.g. `.csv` for
+        `trips.csv.gz`, or `.shp` for a zipped `shapefile` bundle.
+        """
+        file_path = self.source_data
+        if is_glob_pattern(file_path) or not Path(file_path).is_dir():
+            return uncompressed_suffix(file_path, FILE_LOADER_FACTORY)
+        for file in discover_files(file_path, partition_filter=self.partition_filter):
+            file_ext = uncompressed_suffix(file, FILE_LOADER_FACTORY)
+            if file_ext in FILE_LOADER_FACTORY:
+                return file_ext
+        raise ValueError(f"No supported file found in directory: {file_path}")
+
+    def _loader_settings(self) -> Dict[str, Any]:
+        """Gather the settings shared by every loader the factory builds."""
+        return dict(
             latitude_column=self.latitude_column,
             longitude_column=self.longitude_column,
             geometry_column=self.geometry_column,
             coordinate_reference_system=self.crs,
+            chunksize=self.chunksize,
+            cache=self.cache,
+            compaction=self.compaction,
+            incremental=self.incremental,
+            watermark_column=self.watermark_column,
+            time_range=self.time_range,
             map_columns=self.map_columns,
         )
+
+    def _build_file_loader(self, loader_class: type) -> LoaderBase:
+        """Instantiate `loader_class`, wrapped in a `PartitionedLoader` for several files."""
+        loader_settings = self._loader_settings()
+        if is_multi_file_source(self.source_data):
+            return PartitionedLoader(
+                self.source_data,
+                loader_class=loader_class,
+                extensions=[
+                    self._file_extension() + suffix
+                    for suffix in ["", *COMPRESSION_SUFFIXES]
+                ],
+                partition_filter=self.partition_filter,
+                max_workers=self.max_workers,
+                loader_options=self.loader_options,
+                **loader_settings,
+            )
+        return loader_class(self.source_data, **loader_settings, **self.loader_options)
+
+    def _load_from_file(
+        self,
+    ) -> Union[gpd.GeoDataFrame, Iterator[gpd.GeoDataFrame]]:
+        loader_class = FILE_LOADER_FACTORY[self._file_extension()]["class"]
+        self._instance = self._build_file_loader(loader_class)
+        if self.chunksize is not None:
+            return self._instance.load_data_from_file_chunks()
+        return self._instance.load_data_from_file()
+
+    def _build_sql_loader(self) -> LoaderBase:
+        """Instantiate the `DuckDBLoader` running the configured query."""
+        return DuckDBLoader(
+            self.source_data,
+            files=self.sql_files,
+            **self._loader_settings(),
+            **self.loader_options,
+        )
+
+    def _load_from_sql(
+        self,
+    ) -> Union[gpd.GeoDataFrame, Iterator[gpd.GeoDataFrame]]:
+        self._instance = self._build_sql_loader()
+        if self.chunksize is not None:
+            return self._instance.load_data_from_file_chunks()
         return self._instance.load_data_from_file()
 
     def _load_from_dataframe(self) -> gpd.GeoDataFrame:
-        input_dataframe: Union[pd.DataFrame, gpd.GeoDataFrame] = self.source_data.copy()
+        geo_dataframe = self._dataframe_to_geodataframe(
+            defensive_copy(self.source_data)
+        )
+        if self.compaction is not None:
+            map_columns = self.map_columns if isinstance(self.map_columns, dict) else {}
+            geo_dataframe = compact_geodataframe(
+                geo_dataframe,
+                coordinate_columns=[
+                    map_columns.get(column, column)
+                    for column in (self.latitude_column, self.longitude_column)
+                    if column is not None
+                ],
+                **self.compaction,
+            )
+        return geo_dataframe
+
+    def _load_from_huggingface_stream(
+        self,
+    ) -> Union[gpd.GeoDataFrame, Iterator[gpd.GeoDataFrame]]:
+        batches = (
+            self._dataframe_to_geodataframe(table.to_pandas(split_blocks=True))
+            for table in self.source_data.iter(
+                batch_size=self.chunksize or HUGGINGFACE_STREAMING_BATCH_SIZE
+            )
+        )
+        if self.chunksize is not None:
+            return batches
+        return pd.concat(batches, ignore_index=True)
+
+    def _dataframe_to_geodataframe(
+        self, input_dataframe: Union[pd.DataFrame, gpd.GeoDataFrame]
+    ) -> gpd.GeoDataFrame:
+        if self.time_range is not None:
+            input_dataframe = self._filter_time_range(input_dataframe)
         if isinstance(input_dataframe, gpd.GeoDataFrame):
-            geo_dataframe: gpd.GeoDataFrame = input_dataframe.copy()
+            geo_dataframe: gpd.GeoDataFrame = input_dataframe
         else:
             if self.latitude_column is not None and self.longitude_column is not None:
-                geometry = gpd.points_from_xy(
-                    input_dataframe[self.longitude_column],
-                    input_dataframe[self.latitude_column],
+                geo_dataframe = gpd.GeoDataFrame(
+                    input_dataframe,
+                    geometry=points_from_coordinates(
+                        input_dataframe[self.longitude_column],
+                        input_dataframe[self.latitude_column],
+                        self.crs,
+                    ),
+                    copy=False,
                 )
             else:
-                filter_not_na = input_dataframe[self.geometry_column].notna()
-                input_dataframe.loc[filter_not_na, self.geometry_column] = (
-                    input_dataframe.loc[filter_not_na, self.geometry_column].apply(
-                        wkt.loads
-                    )
+                input_dataframe[self.geometry_column] = decode_geometries(
+                    input_dataframe[self.geometry_column]
+                )
+                geo_dataframe = gpd.GeoDataFrame(
+                    input_dataframe,
+                    geometry=self.geometry_column,
+                    crs=self.crs[0] if isinstance(self.crs, tuple) else self.crs,
+                    copy=False,
                 )
-                geometry = self.geometry_column
-
-            geo_dataframe = gpd.GeoDataFrame(
-                input_dataframe,
-                geometry=geometry,
-                crs=self.crs[0] if isinstance(self.crs, tuple) else self.crs,
-            )
 
         target_coordinate_reference_system = (
             self.crs[1] if isinstance(self.crs, tuple) else self.crs
         )
 
         if geo_dataframe.crs is None:
-            geo_dataframe.set_crs(target_coordinate_reference_system, inplace=True)
+            geo_dataframe = geo_dataframe.set_crs(target_coordinate_reference_system)
         elif geo_dataframe.crs.to_string() != target_coordinate_reference_system:
             geo_dataframe = geo_dataframe.to_crs(target_coordinate_reference_system)
 
@@ -542,8 +1232,22 @@ class LoaderFactory:
 
         return geo_dataframe
 
+    def _filter_time_range(
+        self, input_dataframe: Union[pd.DataFrame, gpd.GeoDataFrame]
+    ) -> Union[pd.DataFrame, gpd.GeoDataFrame]:
+        """Drop the rows of an in-memory source outside the `time_range`."""
+        column, start, end = self.time_range
+        if column not in input_dataframe.columns:
+            raise ValueError(f"Time range column '{column}' not found in the data.")
+        input_dataframe[column] = parse_datetimes(
+            input_dataframe[column], infer_datetime_format(input_dataframe[column])
+        )
+        return input_dataframe[
+            time_range_mask(input_dataframe[column], start, end)
+        ].reset_index(drop=True)
+
     @require_attributes(["source_type", "source_data"])
-    def load(self) -> gpd.GeoDataFrame:
+    def load(self) -> Union[gpd.GeoDataFrame, Iterator[gpd.GeoDataFrame]]:
         """Load the data and return it as a `GeoDataFrame`.
         
         This method loads the data from the configured source and returns it as a
@@ -551,7 +1255,8 @@ class LoaderFactory:
         source types and formats.
                 
         Returns:
-            A GeoDataFrame containing the loaded data.
+            A GeoDataFrame containing the loaded data, or an iterator of `GeoDataFrame`
+            chunks when `with_chunksize()` was called on a file source or a streamed Hugging Face dataset.
             
         Raises:
             ValueError: If the source type is invalid, the file format is unsupported,
@@ -575,7 +1280,7 @@ class LoaderFactory:
         )
 
         if self.source_type == "file":
-            file_ext = Path(self.source_data).suffix.lower()
+            file_ext = self._file_extension()
             if file_ext not in FILE_LOADER_FACTORY:
                 raise ValueError(f"Unsupported file format: {file_ext}")
             loader_info = FILE_LOADER_FACTORY[file_ext]
@@ -590,6 +1295,18 @@ class LoaderFactory:
             if self._preview is not None:
                 self.preview(format=self._preview["format"])
             return loaded_data
+        elif self.source_type == "sql":
+            if (has_geometry and has_lat_or_long) or (
+                not has_geometry and not has_lat_and_long
+            ):
+                raise ValueError(
+                    "SQL query loading requires latitude and longitude columns or only geometry column. "
+                    "Call with_columns() with valid column names."
+                )
+            loaded_data = self._load_from_sql()
+            if self._preview is not None:
+                self.preview(format=self._preview["format"])
+            return loaded_data
         elif self.source_type == "dataframe":
             if (has_geometry and has_lat_or_long) or (
                 not has_geometry and not has_lat_and_long
@@ -612,7 +1329,10 @@ class LoaderFactory:
                     "Hugging Face dataset loading requires latitude and longitude columns or only geometry column. "
                     "Call with_columns() with valid column names."
                 )
-            loaded_data = self._load_from_dataframe()
+            if isinstance(self.source_data, datasets.IterableDataset):
+                loaded_data = self._load_from_huggingface_stream()
+            else:
+                loaded_data = self._load_from_dataframe()
             if self._preview is not None:
                 logger.log(
                     "DEBUG_LOW",
@@ -652,9 +1372,14 @@ class LoaderFactory:
             "WARNING: build() should only be used in UrbanPipeline. "
             "In other cases, using .load() is a better option.",
         )
+        if self.source_type == "sql":
+            self._instance = self._build_sql_loader()
+            if self._preview is not None:
+                self.preview(format=self._preview["format"])
+            return self._instance
         if self.source_type != "file":
-            raise ValueError("Build only supports file sources for now.")
-        file_ext = Path(self.source_data).suffix.lower()
+            raise ValueError("Build only supports file and SQL sources for now.")
+        file_ext = self._file_extension()
         if file_ext not in FILE_LOADER_FACTORY:
             raise ValueError(f"Unsupported file format: {file_ext}")
         loader_info = FILE_LOADER_FACTORY[file_ext]
@@ -674,18 +1399,53 @@ class LoaderFactory:
             raise ValueError(
                 f"Loader for {file_ext} requires latitude and longitude columns. Call with_columns() first."
             )
-        self._instance = loader_class(
-            file_path=self.source_data,
-            latitude_column=self.latitude_column,
-            longitude_column=self.longitude_column,
-            geometry_column=self.geometry_column,
-            coordinate_reference_system=self.crs,
-            map_columns=self.map_columns,
-        )
+        self._instance = self._build_file_loader(loader_class)
         if self._preview is not None:
             self.preview(format=self._preview["format"])
         return self._instance
 
+    @require_attributes(["source_type", "source_data"])
+    def probe(self) -> Dict[str, Any]:
+        """Probe the schema of the configured file from its metadata only, without loading it.
+
+        Only the metadata is read (a `Parquet` footer, the first kilobytes of a `CSV`, a layer's
+        `OGR` metadata), so that probing takes milliseconds whatever the size of the file. The
+        columns set with `with_columns()` or `with_options(columns=...)` are checked to exist,
+        so that a misconfigured loader fails before any heavy I/O. For a `SQL` source, the query
+        is bound by `DuckDB`, without running it, to tell the columns of its result.
+
+        !!! note "Validation on load"
+            `load()` performs the same checks before reading the file, so calling `probe()`
+            is only needed to inspect the schema.
+
+        Returns:
+            A dictionary with the `columns` of the file (a mapping from column name to Arrow
+            type name), its `row_count`, its `crs` and its `bounding_box`. Values the metadata
+            does not hold are `None`.
+
+        Raises:
+            ValueError: If the source is not a file or a query, the file format is unsupported, or a
+                configured column is not found in the file.
+            NotImplementedError: If the file's loader cannot probe its file format.
+
+        Examples:
+            >>> schema = mapper.loader.from_file("data/trips.parquet")\
+            ...     .with_columns(longitude_column="pickup_lng", latitude_column="pickup_lat")\
+            ...     .probe()
+            >>> schema["row_count"]
+            12000000
+        """
+        if self.source_type == "sql":
+            self._instance = self._build_sql_loader()
+            return self._instance.probe_schema()
+        if self.source_type != "file":
+            raise ValueError("Schema probing only supports file and SQL sources.")
+        file_ext = self._file_extension()
+        if file_ext not in FILE_LOADER_FACTORY:
+            raise ValueError(f"Unsupported file format: {file_ext}")
+        self._instance = self._build_file_loader(FILE_LOADER_FACTORY[file_ext]["class"])
+        return self._instance.probe_schema()
+
     def preview(self, format="ascii") -> None:
         """Display a preview of the `loader` configuration and settings.
         
@@ -703,18 +1463,27 @@ class LoaderFactory:
             ValueError: If an unsupported format is specified.
             
         Note:
-            This method requires a loader instance to be available. Call load()
+            For file sources, the preview includes the schema of the file, probed from its
+            metadata only (see `probe()`), and can thus be displayed before loading anything.
+            Other sources require a loader instance to be available: call load()
             or build() first to create an instance.
             
         Examples:
             >>> loader = mapper.loader.from_file("data/points.csv")\
             ...     .with_columns(longitude_column="lon", latitude_column="lat")
-            >>> # Preview after loading data
-            >>> loader.load()
+            >>> # Preview the loader and the file's schema, before loading anything
             >>> loader.preview()
             >>> # Or JSON format
             >>> loader.preview(format="json")
         """
+        schema = None
+        probed = self._instance is None and self.source_type in ("file", "sql")
+        if probed:
+            try:
+                schema = self.probe()
+            except NotImplementedError:
+                schema = None
+
         if self._instance is None:
             logger.log(
                 "DEBUG_LOW",
@@ -724,10 +1493,17 @@ class LoaderFactory:
 
         if hasattr(self._instance, "preview"):
             preview_data = self._instance.preview(format=format)
+            if not probed:
+                try:
+                    schema = self._instance.probe_schema()
+                except NotImplementedError:
+                    schema = None
             if format == "ascii":
-                print(preview_data)
+                print(preview_data + _format_schema(schema) if schema else preview_data)
             elif format == "json":
-                print(json.dumps(preview_data, indent=2))
+                if schema is not None:
+                    preview_data = {**preview_data, "schema": schema}
+                print(json.dumps(preview_data, indent=2, default=str))
             else:
                 raise ValueError(f"Unsupported format '{format}'.")
         else:
@@ -1,9 +1,21 @@
 from .csv_loader import CSVLoader
 from .shapefile_loader import ShapefileLoader
 from .parquet_loader import ParquetLoader
+from .geoparquet_loader import GeoParquetLoader
+from .arrow_loader import ArrowLoader
+from .ogr_loader import OGRLoader
+from .partitioned_loader import PartitionedLoader
+from .duckdb_loader import DuckDBLoader
+from .raster_loader import RasterLoader
 
 __all__ = [
     "CSVLoader",
     "ShapefileLoader",
     "ParquetLoader",
+    "GeoParquetLoader",
+    "ArrowLoader",
+    "OGRLoader",
+    "PartitionedLoader",
+    "DuckDBLoader",
+    "RasterLoader",
 ]
@@ -0,0 +1,334 @@
+import geopandas as gpd
+import pandas as pd
+import pyarrow as pa
+from beartype import beartype
+from pathlib import Path
+from typing import Union, Optional, Any, Tuple, Iterator, List, Dict
+
+from urban_mapper import logger
+from urban_mapper.modules.loader.abc_loader import LoaderBase
+from urban_mapper.modules.loader.helpers import (
+    arrow_table_to_geodataframe,
+    geoarrow_columns,
+    arrow_schema_columns,
+    crs_name,
+    points_from_coordinates,
+)
+from urban_mapper.config import DEFAULT_CRS
+
+
+@beartype
+class ArrowLoader(LoaderBase):
+    """Loader for `Arrow IPC` / `Feather` files, memory-mapped.
+
+    This loader memory-maps the file rather than reading it, so that several processes
+    loading the same file share a single copy of it through the OS page cache. Non-geometry
+    columns are exposed as Arrow-backed pandas columns (`pd.ArrowDtype`) pointing straight
+    at the mapped memory, without any copy. Geometries are built in bulk, either from the
+    latitude and longitude columns, or by decoding a `WKB` / `WKT` geometry column. Files
+    written by `geopandas` (`GeoDataFrame.to_feather()` / `to_arrow()`) carry `GeoArrow`
+    metadata, in which case no column needs to be specified.
+
+    !!! note "Zero-copy"
+        Memory-mapping only avoids copies for uncompressed files. Compressed `Feather`
+        files are still supported, but are decompressed into memory.
+
+    Attributes:
+        file_path (Union[str, Path]): Path to the `Arrow IPC` / `Feather` file to load.
+        latitude_column (Optional[str]): Name of the column containing latitude values. Default: `None`
+        longitude_column (Optional[str]): Name of the column containing longitude values. Default: `None`
+        geometry_column (Optional[str]): Name of the column containing `WKB` or `WKT` geometries. Default: `None`,
+            which uses the file's `GeoArrow` geometry column, if any.
+        coordinate_reference_system (Union[str, Tuple[str, str]]):
+            If a string, it specifies the coordinate reference system to use (default: 'EPSG:4326').
+            If a tuple (source_crs, target_crs), it defines a conversion from the source CRS to the target CRS (default target CRS: 'EPSG:4326').
+        columns (Optional[list[str]]): List of columns to read from the file. Default: `None`, which reads all columns.
+        zero_copy (bool): Whether to expose non-geometry columns as Arrow-backed pandas columns sharing the mapped
+            memory. If `False`, columns are converted to regular `NumPy`-backed columns. Default: `True`
+        chunksize (Optional[int]): Number of rows per chunk when streaming. Default: `None`
+
+    Examples:
+        >>> from urban_mapper.modules.loader import ArrowLoader
+        >>>
+        >>> # Point table with coordinates columns
+        >>> loader = ArrowLoader(
+        ...     file_path="taxi_trips.arrow",
+        ...     latitude_column="pickup_lat",
+        ...     longitude_column="pickup_lng"
+        ... )
+        >>> gdf = loader.load_data_from_file()
+        >>>
+        >>> # File written by geopandas' to_feather()
+        >>> loader = ArrowLoader(file_path="buildings.feather")
+        >>> gdf = loader.load_data_from_file()
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        latitude_column: Optional[str] = None,
+        longitude_column: Optional[str] = None,
+        geometry_column: Optional[str] = None,
+        coordinate_reference_system: Union[str, Tuple[str, str]] = DEFAULT_CRS,
+        columns: Optional[list[str]] = None,
+        zero_copy: bool = True,
+        **additional_loader_parameters: Any,
+    ) -> None:
+        super().__init__(
+            file_path=file_path,
+            latitude_column=latitude_column,
+            longitude_column=longitude_column,
+            geometry_column=geometry_column,
+            coordinate_reference_system=coordinate_reference_system,
+            **additional_loader_parameters,
+        )
+        self.columns = columns
+        self.zero_copy = zero_copy
+
+    def _load_data_from_file(self) -> gpd.GeoDataFrame:
+        """Memory-map an `Arrow IPC` / `Feather` file and convert it to a `GeoDataFrame`.
+
+        Returns:
+            A `GeoDataFrame` whose non-geometry columns share the mapped memory.
+
+        Raises:
+            ValueError: If no geometry can be built: neither latitude and longitude columns,
+                nor a geometry column, nor `GeoArrow` metadata.
+            ValueError: If the specified columns are not found in the file.
+        """
+        return self._build_geodataframe(self._read_table())
+
+    def _load_data_from_file_chunks(
+        self, chunksize: Optional[int] = None
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Load data from an `Arrow IPC` / `Feather` file chunk by chunk.
+
+        The file is memory-mapped once, and chunks are zero-copy slices of it.
+
+        Args:
+            chunksize: Number of rows per chunk. Default: `None`, which yields one chunk per
+                record batch of the file.
+
+        Yields:
+            `GeoDataFrame` chunks.
+        """
+        table = self._read_table()
+        if chunksize is None:
+            slices = (
+                pa.Table.from_batches([batch], schema=table.schema)
+                for batch in table.to_batches()
+            )
+        else:
+            slices = (
+                table.slice(offset, chunksize)
+                for offset in range(0, table.num_rows, chunksize)
+            )
+        for table_slice in slices:
+            yield self._build_geodataframe(table_slice)
+
+    def _load_data_since(
+        self, watermark: Dict[str, Any]
+    ) -> Tuple[gpd.GeoDataFrame, Dict[str, Any]]:
+        """Load the rows appended to the `Arrow IPC` / `Feather` file since the row count of the previous load.
+
+        The file is memory-mapped, so that the rows read by the previous load are never copied.
+        A file holding fewer rows than the previous load is read again from the start.
+
+        Args:
+            watermark: The `rows` read by the previous load, empty on the first load.
+
+        Returns:
+            The appended rows, and the new number of `rows` read.
+        """
+        table = self._read_table()
+        rows = watermark.get("rows", 0)
+        if rows > table.num_rows:
+            logger.log(
+                "DEBUG_MID",
+                f"ArrowLoader: {self.file_path} was rewritten, reading it from the start again",
+            )
+            rows = 0
+        return self._build_geodataframe(table.slice(rows)), {"rows": table.num_rows}
+
+    def _probe_schema(self) -> Dict[str, Any]:
+        """Probe the schema of the `Arrow IPC` / `Feather` file from its footer.
+
+        The row count is summed from the record batch headers of the memory-mapped file,
+        without reading any column. `Arrow IPC` streams have no footer, so their row count
+        is `None`.
+
+        Returns:
+            The `columns`, `row_count`, `crs` and `bounding_box` (always `None`) of the file.
+        """
+        source = pa.memory_map(str(self.file_path))
+        try:
+            reader = pa.ipc.open_file(source)
+            row_count = sum(
+                reader.get_batch(index).num_rows
+                for index in range(reader.num_record_batches)
+            )
+        except pa.ArrowInvalid:
+            source.seek(0)
+            reader = pa.ipc.open_stream(source)
+            row_count = None
+        geometry_columns = geoarrow_columns(reader.schema)
+        if isinstance(self.coordinate_reference_system, tuple):
+            source_crs = self.coordinate_reference_system[0]
+        elif geometry_columns and self.latitude_column == "":
+            geometry_column = self.geometry_column or next(iter(geometry_columns))
+            source_crs = geometry_columns.get(geometry_column, {}).get("crs")
+        else:
+            source_crs = self.coordinate_reference_system
+        return {
+            "columns": arrow_schema_columns(reader.schema, geometry_columns),
+            "row_count": row_count,
+            "crs": crs_name(source_crs),
+            "bounding_box": None,
+        }
+
+    def _read_table(self) -> pa.Table:
+        """Memory-map the file and select the columns to read, without copying."""
+        source = pa.memory_map(str(self.file_path))
+        try:
+            table = pa.ipc.open_file(source).read_all()
+        except pa.ArrowInvalid:
+            source.seek(0)
+            table = pa.ipc.open_stream(source).read_all()
+        columns = self._columns_to_read(table.schema)
+        if columns is not None:
+            missing = [name for name in columns if name not in table.column_names]
+            if missing:
+                raise ValueError(
+                    f"Columns {missing} not found in the Arrow file. "
+                    f"Available columns: {table.column_names}"
+                )
+            table = table.select(columns)
+        return table
+
+    def _columns_to_read(self, schema: pa.Schema) -> Optional[List[str]]:
+        """Work out which columns to read, always keeping the coordinate or geometry columns."""
+        if self.columns is not None:
+            needed = set(self.columns)
+        elif self.required_columns is not None:
+            needed = set(self.required_columns)
+        else:
+            return None
+        needed |= {
+            self.latitude_column,
+            self.longitude_column,
+            self.geometry_column,
+        } | set(geoarrow_columns(schema))
+        return [name for name in schema.names if name in needed]
+
+    def _build_geodataframe(self, table: pa.Table) -> gpd.GeoDataFrame:
+        """Convert a memory-mapped Arrow table into a `GeoDataFrame`.
+
+        Rows outside the `time_range`, or whose coordinates fall outside the pushed down
+        bounding box, are filtered out of the table before it is converted and any point
+        geometry is built. The filtered columns are then copies, no longer sharing the
+        mapped memory. Point geometries are built directly in the target coordinate
+        reference system.
+
+        Args:
+            table: The rows of the file.
+
+        Returns:
+            A `GeoDataFrame` in the target coordinate reference system for points, in the
+            source one for geometry columns.
+        """
+        source_crs = (
+            self.coordinate_reference_system[0]
+            if isinstance(self.coordinate_reference_system, tuple)
+            else None
+        )
+        if self.time_range is not None and self.time_range[0] in table.column_names:
+            in_time_range = self._time_range_mask(
+                table.column(self.time_range[0]).to_pandas()
+            )
+            if not in_time_range.all():
+                table = table.filter(pa.array(in_time_range))
+        if self.latitude_column != "" and self.longitude_column != "":
+            for coordinate_column in (self.latitude_column, self.longitude_column):
+                if coordinate_column not in table.column_names:
+                    raise ValueError(
+                        f"Column '{coordinate_column}' not found in the Arrow file."
+                    )
+            within = self._bounding_box_mask(
+                table.column(self.longitude_column).to_numpy(),
+                table.column(self.latitude_column).to_numpy(),
+            )
+            if within is not None:
+                table = table.filter(pa.array(within))
+            if geoarrow_columns(table.schema):
+                dataframe = arrow_table_to_geodataframe(table, zero_copy=self.zero_copy)
+            else:
+                dataframe = table.to_pandas(
+                    types_mapper=pd.ArrowDtype if self.zero_copy else None,
+                    split_blocks=True,
+                )
+            return gpd.GeoDataFrame(
+                pd.DataFrame(dataframe),
+                geometry=points_from_coordinates(
+                    table.column(self.longitude_column).to_pandas(),
+                    table.column(self.latitude_column).to_pandas(),
+                    self.coordinate_reference_system,
+                ),
+            )
+
+        geodataframe = arrow_table_to_geodataframe(
+            table,
+            geometry_column=self.geometry_column or None,
+            crs=source_crs,
+            zero_copy=self.zero_copy,
+        )
+        if geodataframe.crs is None:
+            geodataframe = geodataframe.set_crs(self.coordinate_reference_system)
+        return geodataframe
+
+    def preview(self, format: str = "ascii") -> Any:
+        """Generate a preview of this `Arrow` loader.
+
+        Creates a summary representation of the loader for quick inspection.
+
+        Args:
+            format: The output format for the preview. Options include:
+
+                - [x] "ascii": Text-based format for terminal display
+                - [x] "json": JSON-formatted data for programmatic use
+
+        Returns:
+            A string or dictionary representing the loader, depending on the format.
+
+        Raises:
+            ValueError: If an unsupported format is requested.
+        """
+        cols = self.columns if self.columns else "All columns"
+
+        if format == "ascii":
+            return (
+                f"Loader: ArrowLoader\n"
+                f"  File: {self.file_path}\n"
+                f"  Latitude Column: {self.latitude_column}\n"
+                f"  Longitude Column: {self.longitude_column}\n"
+                f"  Geometry Column: {self.geometry_column or 'From GeoArrow metadata'}\n"
+                f"  Columns: {cols}\n"
+                f"  Zero Copy: {self.zero_copy}\n"
+                f"  Chunk Size: {self.chunksize or 'Whole file'}\n"
+                f"  CRS: {self.coordinate_reference_system}\n"
+                f"  Additional params: {self.additional_loader_parameters}\n"
+            )
+        elif format == "json":
+            return {
+                "loader": "ArrowLoader",
+                "file": self.file_path,
+                "latitude_column": self.latitude_column,
+                "longitude_column": self.longitude_column,
+                "geometry_column": self.geometry_column,
+                "columns": cols,
+                "zero_copy": self.zero_copy,
+                "chunksize": self.chunksize,
+                "crs": self.coordinate_reference_system,
+                "additional_params": self.additional_loader_parameters,
+            }
+        else:
+            raise ValueError(f"Unsupported format: {format}")
@@ -1,14 +1,35 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
 import pandas as pd
 import geopandas as gpd
-from shapely import wkt
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import shapely
 from beartype import beartype
 from pathlib import Path
-from typing import Union, Optional, Any, Tuple
+from typing import Union, Optional, Any, Tuple, Iterator, List, Dict, BinaryIO
 
+from urban_mapper import logger
 from urban_mapper.modules.loader.abc_loader import LoaderBase
+from urban_mapper.modules.loader.helpers import (
+    decode_geometries,
+    arrow_schema_columns,
+    crs_name,
+    points_from_coordinates,
+    compression_suffix,
+    open_decompressed,
+)
 from urban_mapper.config import DEFAULT_CRS
 from urban_mapper.utils.helpers import require_either_or_attributes
 
+DEFAULT_CHUNKSIZE = 100_000
+SCHEMA_PROBE_BYTES = 64 * 1024
+CSV_ENGINES = ["pandas", "pyarrow"]
+
+
 @beartype
 class CSVLoader(LoaderBase):
     """Loader for `CSV` files containing spatial data.
@@ -18,15 +39,29 @@ class CSVLoader(LoaderBase):
     and longitude columns to create point geometries for each row.
 
     Attributes:
-        file_path (Path): Path to the `CSV` file to load.
+        file_path (Path): Path to the `CSV` file to load. Compressed files (`.csv.gz`, `.csv.bz2`, `.csv.zst`, or
+            a `.zip` archive holding a single file) are decompressed on the fly, without extracting them to disk.
         latitude_column (str): Name of the column containing latitude values.
         longitude_column (str): Name of the column containing longitude values.
-        geometry_column (str): Name of the column containing geometry data in WKT format.
+        geometry_column (str): Name of the column containing encoded geometries (`WKT`, hex `WKB` or `GeoJSON`).
         coordinate_reference_system (Union[str, Tuple[str, str]]):
             If a string, it specifies the coordinate reference system to use (default: 'EPSG:4326').
             If a tuple (source_crs, target_crs), it defines a conversion from the source CRS to the target CRS (default target CRS: 'EPSG:4326').
         separator (str): The delimiter character used in the CSV file. Default: `","`
         encoding (str): The character encoding of the CSV file. Default: `"utf-8"`
+        geometry_encoding (str): How geometries in `geometry_column` are encoded, one of `"auto"`, `"wkt"`,
+            `"hex"` or `"geojson"`. Default: `"auto"`, which detects the encoding of each value.
+        chunksize (Optional[int]): Number of rows parsed at a time. When set, the file is read chunk by chunk,
+            which bounds the parsing memory by the chunk size. Default: `None`
+        engine (str): The parser to use, either `"pandas"` or `"pyarrow"`. The `pyarrow` engine parses the file
+            on all cores and reads the coordinate columns straight as `float64`. Default: `"pandas"`
+        columns (Optional[list[str]]): List of columns to read from the file. Default: `None`, which reads all columns.
+        schema_path (Optional[Union[str, Path]]): With the `pyarrow` engine, where to store the column types inferred
+            on the first read. Later reads reuse them instead of inferring them again. Default: `None`
+        parallel (Optional[int]): Number of processes parsing the file at the same time. When set, the file is split
+            into as many newline-aligned byte ranges, each parsed, coerced and turned into geometries in its own
+            process. Cannot be combined with `chunksize`, nor with compressed files. Default: `None`, which parses
+            the file in this process.
 
     Examples:
         >>> from urban_mapper.modules.loader import CSVLoader
@@ -72,6 +107,36 @@ class CSVLoader(LoaderBase):
         ...     coordinate_reference_system=("EPSG:4326", "EPSG:3857")
         ... )
         >>> gdf = loader.load_data_from_file()
+        >>>
+        >>> # Multi-threaded parsing, reusing the column types of previous runs
+        >>> loader = CSVLoader(
+        ...     file_path="taxi_trips.csv",
+        ...     latitude_column="pickup_lat",
+        ...     longitude_column="pickup_lng",
+        ...     engine="pyarrow",
+        ...     columns=["pickup_lat", "pickup_lng", "fare_amount"],
+        ...     schema_path="taxi_trips.schema"
+        ... )
+        >>> gdf = loader.load_data_from_file()
+        >>>
+        >>> # Parsing a multi-gigabyte file on eight cores
+        >>> loader = CSVLoader(
+        ...     file_path="taxi_trips.csv",
+        ...     latitude_column="pickup_lat",
+        ...     longitude_column="pickup_lng",
+        ...     parallel=8
+        ... )
+        >>> gdf = loader.load_data_from_file()
+        >>>
+        >>> # Streaming a large file chunk by chunk
+        >>> loader = CSVLoader(
+        ...     file_path="taxi_trips.csv",
+        ...     latitude_column="pickup_lat",
+        ...     longitude_column="pickup_lng",
+        ...     chunksize=500_000
+        ... )
+        >>> for chunk in loader.load_data_from_file_chunks():
+        ...     print(len(chunk))
     """
 
     def __init__(
@@ -83,8 +148,19 @@ class CSVLoader(LoaderBase):
         coordinate_reference_system: Union[str, Tuple[str, str]] = DEFAULT_CRS,
         separator: str = ",",
         encoding: str = "utf-8",
+        geometry_encoding: str = "auto",
+        engine: str = "pandas",
+        columns: Optional[list[str]] = None,
+        schema_path: Optional[Union[str, Path]] = None,
+        parallel: Optional[int] = None,
         **additional_loader_parameters: Any,
     ) -> None:
+        if engine not in CSV_ENGINES:
+            raise ValueError(
+                f"Unsupported CSV engine '{engine}'. Supported engines are: {', '.join(CSV_ENGINES)}."
+            )
+        if parallel is not None and parallel <= 0:
+            raise ValueError(f"parallel must be a positive integer, got {parallel}.")
         super().__init__(
             file_path=file_path,
             latitude_column=latitude_column,
@@ -95,6 +171,19 @@ class CSVLoader(LoaderBase):
         )
         self.separator = separator
         self.encoding = encoding
+        self.geometry_encoding = geometry_encoding
+        self.engine = engine
+        self.columns = columns
+        self.schema_path = Path(schema_path) if schema_path is not None else None
+        self.parallel = parallel
+        if self.parallel is not None and self.chunksize is not None:
+            raise ValueError(
+                "parallel and chunksize cannot be used together. Pick one."
+            )
+        if self.parallel is not None and compression_suffix(self.file_path) is not None:
+            raise ValueError(
+                "parallel cannot be used with compressed files, whose byte ranges cannot be read on their own."
+            )
 
     @require_either_or_attributes(
         [["latitude_column", "longitude_column"], ["geometry_column"]],
@@ -118,10 +207,436 @@ class CSVLoader(LoaderBase):
             pd.errors.ParserError: If the CSV file cannot be parsed.
             UnicodeDecodeError: If the file encoding is incorrect.
         """
+        if self.chunksize is not None:
+            return pd.concat(
+                self._load_data_from_file_chunks(self.chunksize), ignore_index=True
+            )
+        if self.parallel is not None and self.parallel > 1:
+            return self._load_data_in_parallel()
+
+        if self.engine == "pyarrow":
+            convert_options = self._arrow_convert_options()
+            with self._open_source() as source:
+                table = pacsv.read_csv(
+                    source,
+                    read_options=self._arrow_read_options(),
+                    parse_options=pacsv.ParseOptions(delimiter=self.separator),
+                    convert_options=convert_options,
+                )
+            self._store_schema(table.schema)
+            dataframe = table.to_pandas(split_blocks=True, self_destruct=True)
+            del table
+        else:
+            usecols = self._columns_to_read()
+            with self._open_source() as source:
+                dataframe = pd.read_csv(
+                    source,
+                    sep=self.separator,
+                    encoding=self.encoding,
+                    usecols=usecols,
+                )
+        return self._build_geodataframe(dataframe)
+
+    @require_either_or_attributes(
+        [["latitude_column", "longitude_column"], ["geometry_column"]],
+        error_msg="Either both 'latitude_column' and 'longitude_column' must be set, or 'geometry_column' must be set.",
+    )
+    def _load_data_from_file_chunks(
+        self, chunksize: Optional[int] = None
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Load data from a `CSV` file chunk by chunk.
+
+        Uses pandas' chunked reader so that only `chunksize` rows are parsed and held
+        in memory at any time, each chunk being converted to a `GeoDataFrame` on its own.
+        Compressed files are decompressed as the chunks are read.
+
+        Args:
+            chunksize: Number of rows per chunk. Default: `None`, which uses `DEFAULT_CHUNKSIZE`.
+
+        Yields:
+            `GeoDataFrame` chunks with point geometries created from the latitude and
+            longitude columns, or geometries parsed from the geometry column.
+
+        Raises:
+            ValueError: If the specified columns are not found in the CSV file.
+            pd.errors.ParserError: If the CSV file cannot be parsed.
+        """
+        chunksize = chunksize or DEFAULT_CHUNKSIZE
+        if self.engine == "pyarrow":
+            convert_options = self._arrow_convert_options()
+            with self._open_source() as source:
+                reader = pacsv.open_csv(
+                    source,
+                    read_options=self._arrow_read_options(),
+                    parse_options=pacsv.ParseOptions(delimiter=self.separator),
+                    convert_options=convert_options,
+                )
+                self._store_schema(reader.schema)
+                for table in _rebatch(reader, chunksize):
+                    yield self._build_geodataframe(
+                        table.to_pandas(split_blocks=True, self_destruct=True)
+                    )
+            return
+
+        usecols = self._columns_to_read()
+        with (
+            self._open_source() as source,
+            pd.read_csv(
+                source,
+                sep=self.separator,
+                encoding=self.encoding,
+                usecols=usecols,
+                chunksize=chunksize,
+            ) as reader,
+        ):
+            for dataframe in reader:
+                yield self._build_geodataframe(dataframe)
+
+    @require_either_or_attributes(
+        [["latitude_column", "longitude_column"], ["geometry_column"]],
+        error_msg="Either both 'latitude_column' and 'longitude_column' must be set, or 'geometry_column' must be set.",
+    )
+    def _load_data_since(
+        self, watermark: Dict[str, Any]
+    ) -> Tuple[gpd.GeoDataFrame, Dict[str, Any]]:
+        """Load the lines appended to the `CSV` file since the byte offset of the previous load.
+
+        Only complete lines are read, so that a line being written is picked up by the next
+        load. A file shorter than the offset, or whose header changed, is read again from the start.
+
+        Args:
+            watermark: The `offset` and `header` of the previous load, empty on the first load.
+
+        Returns:
+            The appended rows, and the new `offset` and `header`.
+
+        Raises:
+            ValueError: If the file is compressed, as its byte offsets cannot be sought to.
+        """
+        if compression_suffix(self.file_path) is not None:
+            raise ValueError(
+                f"Incremental loads of compressed files need a watermark_column, {self.file_path} "
+                "cannot be read from a byte offset."
+            )
+        with open(self.file_path, "rb") as file:
+            header = file.readline()
+            offset = watermark.get("offset", len(header))
+            if watermark and (
+                watermark.get("header") != header.decode(self.encoding)
+                or offset > os.path.getsize(self.file_path)
+            ):
+                logger.log(
+                    "DEBUG_MID",
+                    f"CSVLoader: {self.file_path} was rewritten, reading it from the start again",
+                )
+                offset = len(header)
+            file.seek(offset)
+            appended = file.read()
+        appended = appended[: appended.rfind(b"\n") + 1]
+
+        column_names = pd.read_csv(
+            io.BytesIO(header), sep=self.separator, encoding=self.encoding
+        ).columns
         dataframe = pd.read_csv(
-            self.file_path, sep=self.separator, encoding=self.encoding
+            io.BytesIO(appended),
+            sep=self.separator,
+            encoding=self.encoding,
+            header=None,
+            names=list(column_names),
+            usecols=self._columns_to_read(),
+        )
+        return self._build_geodataframe(dataframe), {
+            "offset": offset + len(appended),
+            "header": header.decode(self.encoding),
+        }
+
+    def _probe_schema(self) -> Dict[str, Any]:
+        """Probe the schema of the `CSV` file from its first kilobytes.
+
+        Column types are inferred from the complete lines of the first `SCHEMA_PROBE_BYTES`
+        bytes, or taken from `schema_path` when a schema was stored by a previous read. The
+        row count is estimated from the size of the file and the length of the sampled lines.
+        For compressed files, only the first bytes are decompressed, and the row count is
+        unknown unless the whole file fits in the sample.
+
+        Returns:
+            The `columns`, estimated `row_count` (flagged by `row_count_is_estimate`), `crs`
+            and `bounding_box` (always `None`, a `CSV` file having no spatial metadata).
+        """
+        compressed = compression_suffix(self.file_path) is not None
+        with self._open_source() as source:
+            if compressed:
+                sample = source.read(SCHEMA_PROBE_BYTES + 1)
+            else:
+                with open(source, "rb") as file:
+                    sample = file.read(SCHEMA_PROBE_BYTES + 1)
+        truncated = len(sample) > SCHEMA_PROBE_BYTES
+        if truncated:
+            sample = sample[:SCHEMA_PROBE_BYTES]
+            if b"\n" in sample:
+                sample = sample[: sample.rfind(b"\n") + 1]
+        dataframe = pd.read_csv(
+            io.BytesIO(sample), sep=self.separator, encoding=self.encoding
+        )
+        if self.schema_path is not None and self.schema_path.exists():
+            schema = pa.ipc.read_schema(pa.py_buffer(self.schema_path.read_bytes()))
+        else:
+            schema = pa.Schema.from_pandas(dataframe, preserve_index=False)
+
+        row_count = len(dataframe)
+        if truncated and compressed:
+            row_count = None
+        elif truncated and row_count > 0:
+            file_size = os.path.getsize(self.file_path)
+            header_size = sample.find(b"\n") + 1
+            row_size = (len(sample) - header_size) / row_count
+            row_count = round((file_size - header_size) / row_size)
+        return {
+            "columns": arrow_schema_columns(schema),
+            "row_count": row_count,
+            "row_count_is_estimate": truncated and row_count is not None,
+            "crs": crs_name(self._source_crs()),
+            "bounding_box": None,
+        }
+
+    def _source_crs(self) -> Any:
+        """Get the coordinate reference system the file is stored in."""
+        if isinstance(self.coordinate_reference_system, tuple):
+            return self.coordinate_reference_system[0]
+        return self.coordinate_reference_system
+
+    def _columns_to_read(self) -> Optional[List[str]]:
+        """Work out which columns to read from the `CSV` file.
+
+        User-specified `columns` always win. Otherwise, columns pushed down by the pipeline
+        are read, together with the loader's own coordinate or geometry columns.
+
+        Returns:
+            The list of columns to read, in file order, or `None` to read them all.
+        """
+        if self.columns is not None or self.required_columns is None:
+            return self.columns
+        needed = set(self.required_columns) | {
+            self.latitude_column,
+            self.longitude_column,
+            self.geometry_column,
+        }
+        with self._open_source() as source:
+            header = pd.read_csv(
+                source, sep=self.separator, encoding=self.encoding, nrows=0
+            ).columns
+        return [name for name in header if name in needed]
+
+    @contextmanager
+    def _open_source(self) -> Iterator[Union[Path, BinaryIO]]:
+        """Open the `CSV` file for parsing, decompressing it on the fly if need be.
+
+        Yields:
+            The path of an uncompressed file, for the parsers to read it themselves, or a
+            stream of the decompressed bytes of a compressed one.
+        """
+        if compression_suffix(self.file_path) is None:
+            yield self.file_path
+            return
+        with open_decompressed(self.file_path) as stream:
+            yield stream
+
+    def _arrow_read_options(self) -> pacsv.ReadOptions:
+        """Build the `pyarrow` read options, parsing on all cores."""
+        return pacsv.ReadOptions(use_threads=True, encoding=self.encoding)
+
+    def _arrow_convert_options(self) -> pacsv.ConvertOptions:
+        """Build the `pyarrow` convert options.
+
+        Column types come from the stored schema when there is one. The coordinate columns
+        are always read as `float64`, so that they never need to be inferred or converted.
+        """
+        column_types = {}
+        if self.schema_path is not None and self.schema_path.exists():
+            schema = pa.ipc.read_schema(pa.py_buffer(self.schema_path.read_bytes()))
+            column_types.update(zip(schema.names, schema.types))
+        for coordinate_column in (self.latitude_column, self.longitude_column):
+            if coordinate_column != "":
+                column_types[coordinate_column] = pa.float64()
+        return pacsv.ConvertOptions(
+            column_types=column_types,
+            include_columns=self._columns_to_read(),
         )
 
+    def _store_schema(self, schema: pa.Schema) -> None:
+        """Persist the inferred column types next to the file, if asked for and not done yet."""
+        if self.schema_path is None or self.schema_path.exists():
+            return
+        self.schema_path.write_bytes(schema.serialize().to_pybytes())
+        logger.log(
+            "DEBUG_LOW",
+            f"CSVLoader: stored the schema of {self.file_path} in {self.schema_path}",
+        )
+
+    def _load_data_in_parallel(self) -> gpd.GeoDataFrame:
+        """Parse the `CSV` file in `parallel` processes, one newline-aligned byte range each.
+
+        Each process parses its range, coerces the coordinates and drops the rows outside the
+        pushed down bounding box, or decodes the geometry column. Ranges are gathered in file
+        order. Point geometries are built once all ranges are back, as building them from
+        the coordinate arrays is cheaper than shipping them between processes.
+
+        !!! note "Quoted line breaks"
+            Ranges are split on line breaks, so values holding line breaks within quotes
+            are not supported in `parallel` mode.
+
+        Returns:
+            A `GeoDataFrame` in the source coordinate reference system.
+        """
+        header, byte_ranges = self._byte_ranges(self.parallel)
+        usecols = self._columns_to_read()
+        if not byte_ranges:
+            return self._build_geodataframe(
+                pd.read_csv(
+                    io.BytesIO(header),
+                    sep=self.separator,
+                    encoding=self.encoding,
+                    usecols=usecols,
+                )
+            )
+        column_names = list(
+            pd.read_csv(
+                io.BytesIO(header), sep=self.separator, encoding=self.encoding
+            ).columns
+        )
+        logger.log(
+            "DEBUG_LOW",
+            f"CSVLoader: parsing {self.file_path} in {len(byte_ranges)} processes",
+        )
+        with ProcessPoolExecutor(max_workers=len(byte_ranges)) as executor:
+            futures = [
+                executor.submit(
+                    self._parse_byte_range, start, end, column_names, usecols
+                )
+                for start, end in byte_ranges
+            ]
+            dataframe = pd.concat(
+                [future.result() for future in futures], ignore_index=True
+            )
+        if self.latitude_column == "" or self.longitude_column == "":
+            dataframe[self.geometry_column] = decode_geometries(
+                dataframe[self.geometry_column], encoding="wkb"
+            )
+        return self._to_geodataframe(dataframe)
+
+    def _byte_ranges(self, parts: int) -> Tuple[bytes, List[Tuple[int, int]]]:
+        """Split the rows of the `CSV` file into byte ranges of about the same size.
+
+        Range boundaries are moved forward to the next line break, so that every range
+        holds complete lines only.
+
+        Args:
+            parts: The number of ranges to aim for. Small files may get fewer.
+
+        Returns:
+            The header line, and the (`start`, `end`) byte offsets of each range.
+        """
+        file_size = os.path.getsize(self.file_path)
+        with open(self.file_path, "rb") as file:
+            header = file.readline()
+            offsets = [len(header)]
+            step = max((file_size - len(header)) // parts, 1)
+            for part in range(1, parts):
+                target = len(header) + part * step
+                if target <= offsets[-1]:
+                    continue
+                file.seek(target - 1)
+                file.readline()
+                if file.tell() >= file_size:
+                    break
+                offsets.append(file.tell())
+        offsets.append(file_size)
+        byte_ranges = [
+            (start, end) for start, end in zip(offsets, offsets[1:]) if start < end
+        ]
+        return header, byte_ranges
+
+    def _parse_byte_range(
+        self,
+        start: int,
+        end: int,
+        column_names: List[str],
+        usecols: Optional[List[str]],
+    ) -> pd.DataFrame:
+        """Parse one byte range of the `CSV` file, in a worker process.
+
+        Args:
+            start: Offset of the first byte of the range, at the start of a line.
+            end: Offset past the last byte of the range, at the start of a line or the end of the file.
+            column_names: The column names, read from the header line.
+            usecols: The columns to keep, or `None` to keep them all.
+
+        Returns:
+            The parsed rows, coordinates coerced and filtered, or geometries encoded as `WKB`
+            for the parent process to decode in bulk.
+        """
+        with open(self.file_path, "rb") as file:
+            file.seek(start)
+            data = file.read(end - start)
+        if self.engine == "pyarrow":
+            dataframe = pacsv.read_csv(
+                io.BytesIO(data),
+                read_options=pacsv.ReadOptions(
+                    column_names=column_names, encoding=self.encoding
+                ),
+                parse_options=pacsv.ParseOptions(delimiter=self.separator),
+                convert_options=self._arrow_convert_options(),
+            ).to_pandas(split_blocks=True, self_destruct=True)
+        else:
+            dataframe = pd.read_csv(
+                io.BytesIO(data),
+                sep=self.separator,
+                encoding=self.encoding,
+                header=None,
+                names=column_names,
+                usecols=usecols,
+            )
+        dataframe = self._prepare_dataframe(dataframe)
+        if self.latitude_column == "" or self.longitude_column == "":
+            dataframe[self.geometry_column] = shapely.to_wkb(
+                dataframe[self.geometry_column].to_numpy()
+            )
+        return dataframe
+
+    def _build_geodataframe(self, dataframe: pd.DataFrame) -> gpd.GeoDataFrame:
+        """Convert a freshly parsed `CSV` dataframe into a `GeoDataFrame`.
+
+        Rows whose coordinates fall outside the pushed down bounding box are dropped
+        before any point geometry is built, chunk by chunk when reading in chunks.
+
+        Args:
+            dataframe: The parsed rows of the `CSV` file.
+
+        Returns:
+            A `GeoDataFrame` in the target coordinate reference system for points, in the
+            source one for a geometry column.
+
+        Raises:
+            ValueError: If the specified columns are not found in the dataframe.
+        """
+        return self._to_geodataframe(self._prepare_dataframe(dataframe))
+
+    def _prepare_dataframe(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Coerce and filter the coordinates of parsed rows, or decode their geometries.
+
+        Rows outside the `time_range`, if any, are dropped first, chunk by chunk when
+        reading in chunks, so that they are never coerced nor turned into geometries.
+
+        Args:
+            dataframe: The parsed rows of the `CSV` file.
+
+        Returns:
+            The rows, ready for `_to_geodataframe()`.
+
+        Raises:
+            ValueError: If the specified columns are not found in the dataframe.
+        """
+        dataframe = self._filter_time_range(dataframe)
         if self.latitude_column != "" and self.longitude_column != "":
             if self.latitude_column not in dataframe.columns:
                 raise ValueError(
@@ -139,25 +654,40 @@ class CSVLoader(LoaderBase):
             dataframe[self.longitude_column] = pd.to_numeric(
                 dataframe[self.longitude_column], errors="coerce"
             )
-            geometry = gpd.points_from_xy(
-                dataframe[self.longitude_column],
-                dataframe[self.latitude_column],
+            within = self._bounding_box_mask(
+                dataframe[self.longitude_column], dataframe[self.latitude_column]
             )
+            if within is not None:
+                dataframe = dataframe[within]
         else:
             if self.geometry_column not in dataframe.columns:
                 raise ValueError(
                     f"Column '{self.geometry_column}' not found in the CSV file."
                 )
 
-            filter_not_na = dataframe[self.geometry_column].notna()
-            dataframe.loc[filter_not_na, self.geometry_column] = dataframe.loc[
-                filter_not_na, self.geometry_column
-            ].apply(wkt.loads)
-            geometry = self.geometry_column
+            dataframe[self.geometry_column] = decode_geometries(
+                dataframe[self.geometry_column], encoding=self.geometry_encoding
+            )
+        return dataframe
+
+    def _to_geodataframe(self, dataframe: pd.DataFrame) -> gpd.GeoDataFrame:
+        """Wrap prepared rows into a `GeoDataFrame`, building their point geometries if need be.
+
+        Point geometries are built directly in the target coordinate reference system.
+        """
+        if self.latitude_column != "" and self.longitude_column != "":
+            return gpd.GeoDataFrame(
+                dataframe,
+                geometry=points_from_coordinates(
+                    dataframe[self.longitude_column],
+                    dataframe[self.latitude_column],
+                    self.coordinate_reference_system,
+                ),
+            )
 
         geodataframe = gpd.GeoDataFrame(
             dataframe,
-            geometry=geometry,
+            geometry=self.geometry_column,
             crs=self.coordinate_reference_system[0]
             if isinstance(self.coordinate_reference_system, tuple)
             else self.coordinate_reference_system,
@@ -190,6 +720,12 @@ class CSVLoader(LoaderBase):
                 f"  Geometry Column: {self.geometry_column}\n"
                 f"  Separator: {self.separator}\n"
                 f"  Encoding: {self.encoding}\n"
+                f"  Geometry Encoding: {self.geometry_encoding}\n"
+                f"  Engine: {self.engine}\n"
+                f"  Columns: {self.columns or 'All columns'}\n"
+                f"  Schema Path: {self.schema_path}\n"
+                f"  Parallel: {self.parallel or 'No'}\n"
+                f"  Chunk Size: {self.chunksize or 'Whole file'}\n"
                 f"  CRS: {self.coordinate_reference_system}\n"
                 f"  Additional params: {self.additional_loader_parameters}\n"
             )
@@ -202,8 +738,31 @@ class CSVLoader(LoaderBase):
                 "geometry_column": self.geometry_column,
                 "separator": self.separator,
                 "encoding": self.encoding,
+                "geometry_encoding": self.geometry_encoding,
+                "engine": self.engine,
+                "columns": self.columns or "All columns",
+                "schema_path": self.schema_path,
+                "parallel": self.parallel,
+                "chunksize": self.chunksize,
                 "crs": self.coordinate_reference_system,
                 "additional_params": self.additional_loader_parameters,
             }
         else:
             raise ValueError(f"Unsupported format: {format}")
+
+
+def _rebatch(reader: pacsv.CSVStreamingReader, chunksize: int) -> Iterator[pa.Table]:
+    """Regroup the record batches of a streaming reader into tables of `chunksize` rows."""
+    pending: List[pa.RecordBatch] = []
+    pending_rows = 0
+    for batch in reader:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        while pending_rows >= chunksize:
+            table = pa.Table.from_batches(pending, schema=reader.schema)
+            yield table.slice(0, chunksize)
+            remainder = table.slice(chunksize)
+            pending = remainder.to_batches()
+            pending_rows = remainder.num_rows
+    if pending_rows > 0:
+        yield pa.Table.from_batches(pending, schema=reader.schema)
@@ -0,0 +1,493 @@
+import glob
+from pathlib import Path
+from typing import Union, Optional, Any, Tuple, Iterator, List, Dict
+
+import geopandas as gpd
+import pandas as pd
+import pyarrow as pa
+from beartype import beartype
+
+from urban_mapper import logger
+from urban_mapper.modules.loader.abc_loader import LoaderBase
+from urban_mapper.modules.loader.helpers import (
+    decode_geometries,
+    crs_name,
+    points_from_coordinates,
+)
+from urban_mapper.config import DEFAULT_CRS
+from urban_mapper.utils import import_duckdb, require_either_or_attributes
+
+DEFAULT_CHUNKSIZE = 100_000
+DUCKDB_READERS = {
+    ".csv": "read_csv",
+    ".tsv": "read_csv",
+    ".parquet": "read_parquet",
+    ".geoparquet": "read_parquet",
+    ".json": "read_json",
+    ".ndjson": "read_json",
+    ".jsonl": "read_json",
+}
+COMPRESSION_SUFFIXES = [".gz", ".zst"]
+DUCKDB_NAIVE_DATETIME_TYPES = [
+    "DATE",
+    "TIMESTAMP",
+    "TIMESTAMP_S",
+    "TIMESTAMP_MS",
+    "TIMESTAMP_NS",
+]
+
+
+@beartype
+class DuckDBLoader(LoaderBase):
+    """Loader running a `SQL` query in an in-process `DuckDB` database.
+
+    Filtering, projections, joins and even aggregations run in `DuckDB`'s vectorised,
+    multi-threaded engine, straight on the files, so that only the query's result ever
+    reaches pandas. `files` are registered as views named after their key, read with
+    `read_csv`, `read_parquet` or `read_json` depending on their extension, or with
+    `ST_Read` (any `GDAL` format) when `DuckDB`'s `spatial` extension is loaded.
+
+    !!! note "Optional dependency"
+        This loader requires `duckdb`, which is not installed with `UrbanMapper`.
+        Install it with `uv add duckdb`.
+
+    !!! note "Spatial extension"
+        With the `spatial` extension loaded, `GEOMETRY` columns of the result are handed
+        over as `WKB` and decoded in bulk, and `ST_*` functions can be used in the query.
+        By default, the extension is loaded if already installed, without any network access.
+
+    When used in an `UrbanPipeline` with pushdown enabled, the query's result is narrowed
+    to the columns the pipeline's steps need, and to the urban layer's bounding box, within
+    `DuckDB`, so that `Parquet` row groups outside of it are skipped by the engine itself.
+
+    Attributes:
+        query (str): The `SQL` query whose result is loaded.
+        files (Dict[str, str]): Mapping from view name to the file, or glob pattern, registered under it. Default: `{}`
+        latitude_column (str): Name of the result column containing latitude values.
+        longitude_column (str): Name of the result column containing longitude values.
+        geometry_column (str): Name of the result column containing geometries (`GEOMETRY`, `WKB`, `WKT` or `GeoJSON`).
+        coordinate_reference_system (Union[str, Tuple[str, str]]):
+            If a string, it specifies the coordinate reference system to use (default: 'EPSG:4326').
+            If a tuple (source_crs, target_crs), it defines a conversion from the source CRS to the target CRS (default target CRS: 'EPSG:4326').
+        database (str): The `DuckDB` database file to query, opened read-only, or `":memory:"`. Default: `":memory:"`
+        threads (Optional[int]): Number of threads `DuckDB` may use. Default: `None`, which uses every core.
+        spatial (Optional[bool]): Whether to load the `spatial` extension. `True` installs it if need be and fails
+            if it cannot be loaded, `False` never loads it. Default: `None`, which loads it if already installed.
+
+    Examples:
+        >>> from urban_mapper.modules.loader import DuckDBLoader
+        >>>
+        >>> # Filter and project a large Parquet file before it reaches pandas
+        >>> loader = DuckDBLoader(
+        ...     query="SELECT pickup_lat, pickup_lng, fare FROM trips WHERE fare > 50",
+        ...     files={"trips": "taxi_trips/*.parquet"},
+        ...     latitude_column="pickup_lat",
+        ...     longitude_column="pickup_lng"
+        ... )
+        >>> gdf = loader.load_data_from_file()
+        >>>
+        >>> # With the spatial extension
+        >>> loader = DuckDBLoader(
+        ...     query="SELECT name, ST_Centroid(geom) AS geom FROM parcels",
+        ...     files={"parcels": "parcels.gpkg"},
+        ...     geometry_column="geom",
+        ...     spatial=True
+        ... )
+        >>> gdf = loader.load_data_from_file()
+    """
+
+    def __init__(
+        self,
+        query: str,
+        files: Optional[Dict[str, Union[str, Path]]] = None,
+        latitude_column: Optional[str] = None,
+        longitude_column: Optional[str] = None,
+        geometry_column: Optional[str] = None,
+        coordinate_reference_system: Union[str, Tuple[str, str]] = DEFAULT_CRS,
+        database: str = ":memory:",
+        threads: Optional[int] = None,
+        spatial: Optional[bool] = None,
+        **additional_loader_parameters: Any,
+    ) -> None:
+        if not files and database == ":memory:":
+            raise ValueError(
+                "DuckDBLoader needs files to register as views, or a database file to query."
+            )
+        if threads is not None and threads <= 0:
+            raise ValueError(f"threads must be a positive integer, got {threads}.")
+        super().__init__(
+            file_path=database
+            if database != ":memory:"
+            else next(iter(files.values())),
+            latitude_column=latitude_column,
+            longitude_column=longitude_column,
+            geometry_column=geometry_column,
+            coordinate_reference_system=coordinate_reference_system,
+            **additional_loader_parameters,
+        )
+        self.query = query.strip().rstrip(";")
+        self.files: Dict[str, str] = {
+            name: str(path) for name, path in (files or {}).items()
+        }
+        self.database = database
+        self.threads = threads
+        self.spatial = spatial
+
+    @require_either_or_attributes(
+        [["latitude_column", "longitude_column"], ["geometry_column"]],
+        error_msg="Either both 'latitude_column' and 'longitude_column' must be set, or 'geometry_column' must be set.",
+    )
+    def _load_data_from_file(self) -> gpd.GeoDataFrame:
+        """Run the query in `DuckDB` and convert its result to a `GeoDataFrame`.
+
+        The result is fetched as an Arrow table, then converted to pandas at once.
+
+        Returns:
+            A `GeoDataFrame` holding the result of the query.
+
+        Raises:
+            ValueError: If the coordinate or geometry columns are not found in the result.
+            ImportError: If `duckdb` is not installed.
+        """
+        if self.chunksize is not None:
+            return pd.concat(
+                self._load_data_from_file_chunks(self.chunksize), ignore_index=True
+            )
+        connection, spatial_loaded = self._connect()
+        try:
+            table = self._relation(connection, spatial_loaded).fetch_arrow_table()
+        finally:
+            connection.close()
+        return self._build_geodataframe(table)
+
+    @require_either_or_attributes(
+        [["latitude_column", "longitude_column"], ["geometry_column"]],
+        error_msg="Either both 'latitude_column' and 'longitude_column' must be set, or 'geometry_column' must be set.",
+    )
+    def _load_data_from_file_chunks(
+        self, chunksize: Optional[int] = None
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Run the query in `DuckDB` and stream its result batch by batch.
+
+        Args:
+            chunksize: Number of rows per chunk. Default: `None`, which uses `DEFAULT_CHUNKSIZE`.
+
+        Yields:
+            `GeoDataFrame` chunks of the query's result.
+        """
+        connection, spatial_loaded = self._connect()
+        try:
+            reader = self._relation(connection, spatial_loaded).fetch_record_batch(
+                chunksize or DEFAULT_CHUNKSIZE
+            )
+            for batch in reader:
+                yield self._build_geodataframe(pa.Table.from_batches([batch]))
+        finally:
+            connection.close()
+
+    def _probe_schema(self) -> Dict[str, Any]:
+        """Probe the columns of the query's result, binding the query without running it.
+
+        Returns:
+            The `columns` of the result, with `DuckDB` type names, and its `crs`. The
+            `row_count` and `bounding_box` are always `None`, as only running the query
+            would tell them.
+        """
+        connection, _ = self._connect()
+        try:
+            relation = connection.sql(self.query)
+            columns = {
+                name: "geometry" if _is_geometry(dtype) else str(dtype).lower()
+                for name, dtype in zip(relation.columns, relation.types)
+            }
+        finally:
+            connection.close()
+        return {
+            "columns": columns,
+            "row_count": None,
+            "crs": crs_name(self._source_crs()),
+            "bounding_box": None,
+        }
+
+    def _source_files(self) -> List[Path]:
+        """List the registered files, glob patterns expanded, and the database file, if any."""
+        source_files = [
+            Path(file)
+            for pattern in self.files.values()
+            for file in sorted(glob.glob(pattern, recursive=True))
+        ]
+        if self.database != ":memory:":
+            source_files.append(Path(self.database))
+        return source_files
+
+    def _source_crs(self) -> Any:
+        """Get the coordinate reference system the query's result is expressed in."""
+        if isinstance(self.coordinate_reference_system, tuple):
+            return self.coordinate_reference_system[0]
+        return self.coordinate_reference_system
+
+    def _connect(self) -> Tuple[Any, bool]:
+        """Open a `DuckDB` connection, load the `spatial` extension and register the files.
+
+        Returns:
+            The connection, and whether the `spatial` extension was loaded.
+
+        Raises:
+            ImportError: If `duckdb` is not installed.
+            ValueError: If `spatial=True` and the extension cannot be loaded.
+        """
+        duckdb = import_duckdb()
+        connection = duckdb.connect(
+            self.database, read_only=self.database != ":memory:"
+        )
+        if self.threads is not None:
+            connection.execute(f"SET threads = {self.threads}")
+
+        spatial_loaded = False
+        if self.spatial is not False:
+            try:
+                if self.spatial:
+                    connection.install_extension("spatial")
+                connection.load_extension("spatial")
+                spatial_loaded = True
+            except duckdb.Error as error:
+                if self.spatial:
+                    connection.close()
+                    raise ValueError(
+                        f"Could not load DuckDB's spatial extension: {error}"
+                    ) from error
+                logger.log(
+                    "DEBUG_LOW",
+                    "DuckDBLoader: spatial extension not installed, querying without it",
+                )
+
+        for name, path in self.files.items():
+            connection.execute(
+                f"CREATE TEMPORARY VIEW {_quote_identifier(name)} AS "
+                f"SELECT * FROM {self._reader(path, spatial_loaded)}"
+            )
+        return connection, spatial_loaded
+
+    def _reader(self, path: str, spatial_loaded: bool) -> str:
+        """Build the `DuckDB` table function call reading a registered file.
+
+        Raises:
+            ValueError: If the file format can only be read through the `spatial` extension,
+                and it is not loaded.
+        """
+        suffixes = [suffix.lower() for suffix in Path(path).suffixes]
+        if len(suffixes) > 1 and suffixes[-1] in COMPRESSION_SUFFIXES:
+            suffixes.pop()
+        extension = suffixes[-1] if suffixes else ""
+        if extension in DUCKDB_READERS:
+            return f"{DUCKDB_READERS[extension]}({_quote_literal(path)})"
+        if not spatial_loaded:
+            raise ValueError(
+                f"Cannot register '{path}': DuckDB reads '{extension}' files through its spatial "
+                f"extension, which is not loaded. Use spatial=True, or one of: {', '.join(DUCKDB_READERS)}."
+            )
+        return f"ST_Read({_quote_literal(path)})"
+
+    def _relation(self, connection: Any, spatial_loaded: bool) -> Any:
+        """Wrap the query so that `DuckDB` applies the pushed down columns, bounding box and time range.
+
+        `GEOMETRY` columns are converted to `WKB`, for `decode_geometries()` to decode in bulk.
+
+        Args:
+            connection: The open `DuckDB` connection.
+            spatial_loaded: Whether the `spatial` extension is loaded.
+
+        Returns:
+            The `DuckDB` relation of the final query, not yet run.
+        """
+        relation = connection.sql(self.query)
+        geometry_columns = {
+            name
+            for name, dtype in zip(relation.columns, relation.types)
+            if _is_geometry(dtype)
+        }
+        selected = relation.columns
+        if self.required_columns is not None:
+            needed = set(self.required_columns) | {
+                self.latitude_column,
+                self.longitude_column,
+                self.geometry_column,
+            }
+            selected = [name for name in relation.columns if name in needed]
+        projections = [
+            f"ST_AsWKB({_quote_identifier(name)}) AS {_quote_identifier(name)}"
+            if name in geometry_columns
+            else _quote_identifier(name)
+            for name in selected
+        ]
+
+        conditions = []
+        bounding_box = self._source_bounding_box()
+        if bounding_box is not None:
+            minx, miny, maxx, maxy = bounding_box
+            if (
+                self.latitude_column in relation.columns
+                and self.longitude_column in relation.columns
+            ):
+                conditions = [
+                    f"TRY_CAST({_quote_identifier(self.longitude_column)} AS DOUBLE) BETWEEN {minx} AND {maxx}",
+                    f"TRY_CAST({_quote_identifier(self.latitude_column)} AS DOUBLE) BETWEEN {miny} AND {maxy}",
+                ]
+            elif spatial_loaded and self.geometry_column in geometry_columns:
+                conditions = [
+                    f"ST_Intersects({_quote_identifier(self.geometry_column)}, "
+                    f"ST_MakeEnvelope({minx}, {miny}, {maxx}, {maxy}))"
+                ]
+        conditions.extend(self._time_range_conditions(relation))
+
+        sql = f"SELECT {', '.join(projections)} FROM ({self.query}) AS result"
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        logger.log("DEBUG_LOW", f"DuckDBLoader: running {sql}")
+        return connection.sql(sql)
+
+    def _time_range_conditions(self, relation: Any) -> List[str]:
+        """Translate the `time_range` into `SQL` conditions on the query's result.
+
+        Only `DATE` and naive `TIMESTAMP` columns are filtered by `DuckDB`, with naive bounds. Other
+        columns, e.g. `TIMESTAMP WITH TIME ZONE` or dates stored as text, are filtered once
+        fetched instead.
+
+        Args:
+            relation: The `DuckDB` relation of the user's query.
+
+        Returns:
+            The conditions, empty if the range cannot be evaluated by `DuckDB`.
+        """
+        if self.time_range is None:
+            return []
+        column, start, end = self.time_range
+        column_types = {
+            name: str(dtype).upper()
+            for name, dtype in zip(relation.columns, relation.types)
+        }
+        column_type = column_types.get(column, "")
+        if column_type not in DUCKDB_NAIVE_DATETIME_TYPES or any(
+            bound is not None and bound.tzinfo is not None for bound in (start, end)
+        ):
+            return []
+        conditions = []
+        if start is not None:
+            conditions.append(
+                f"{_quote_identifier(column)} >= TIMESTAMP {_quote_literal(start.isoformat())}"
+            )
+        if end is not None:
+            conditions.append(
+                f"{_quote_identifier(column)} < TIMESTAMP {_quote_literal(end.isoformat())}"
+            )
+        return conditions
+
+    def _build_geodataframe(self, table: pa.Table) -> gpd.GeoDataFrame:
+        """Convert a result fetched from `DuckDB` into a `GeoDataFrame`.
+
+        Point geometries are built directly in the target coordinate reference system.
+
+        Args:
+            table: The rows of the query's result.
+
+        Returns:
+            A `GeoDataFrame` in the target coordinate reference system for points, in the
+            source one for a geometry column.
+
+        Raises:
+            ValueError: If the specified columns are not found in the result.
+        """
+        dataframe = table.to_pandas(split_blocks=True, self_destruct=True)
+        if self.latitude_column != "" and self.longitude_column != "":
+            for coordinate_column in (self.latitude_column, self.longitude_column):
+                if coordinate_column not in dataframe.columns:
+                    raise ValueError(
+                        f"Column '{coordinate_column}' not found in the query's result."
+                    )
+                dataframe[coordinate_column] = pd.to_numeric(
+                    dataframe[coordinate_column], errors="coerce"
+                )
+            return gpd.GeoDataFrame(
+                dataframe,
+                geometry=points_from_coordinates(
+                    dataframe[self.longitude_column],
+                    dataframe[self.latitude_column],
+                    self.coordinate_reference_system,
+                ),
+            )
+
+        if self.geometry_column not in dataframe.columns:
+            raise ValueError(
+                f"Column '{self.geometry_column}' not found in the query's result."
+            )
+        dataframe[self.geometry_column] = decode_geometries(
+            dataframe[self.geometry_column]
+        )
+        return gpd.GeoDataFrame(
+            dataframe, geometry=self.geometry_column, crs=self._source_crs()
+        )
+
+    def preview(self, format: str = "ascii") -> Any:
+        """Generate a preview of this `DuckDB` loader.
+
+        Creates a summary representation of the loader for quick inspection.
+
+        Args:
+            format: The output format for the preview. Options include:
+
+                - [x] "ascii": Text-based format for terminal display
+                - [x] "json": JSON-formatted data for programmatic use
+
+        Returns:
+            A string or dictionary representing the loader, depending on the format.
+
+        Raises:
+            ValueError: If an unsupported format is requested.
+        """
+        if format == "ascii":
+            return (
+                f"Loader: DuckDBLoader\n"
+                f"  Query: {self.query}\n"
+                f"  Files: {self.files or 'None'}\n"
+                f"  Database: {self.database}\n"
+                f"  Latitude Column: {self.latitude_column}\n"
+                f"  Longitude Column: {self.longitude_column}\n"
+                f"  Geometry Column: {self.geometry_column}\n"
+                f"  Threads: {self.threads or 'All cores'}\n"
+                f"  Spatial: {'If installed' if self.spatial is None else self.spatial}\n"
+                f"  Chunk Size: {self.chunksize or 'Whole result'}\n"
+                f"  CRS: {self.coordinate_reference_system}\n"
+                f"  Additional params: {self.additional_loader_parameters}\n"
+            )
+        elif format == "json":
+            return {
+                "loader": "DuckDBLoader",
+                "query": self.query,
+                "files": self.files,
+                "database": self.database,
+                "latitude_column": self.latitude_column,
+                "longitude_column": self.longitude_column,
+                "geometry_column": self.geometry_column,
+                "threads": self.threads,
+                "spatial": self.spatial,
+                "chunksize": self.chunksize,
+                "crs": self.coordinate_reference_system,
+                "additional_params": self.additional_loader_parameters,
+            }
+        else:
+            raise ValueError(f"Unsupported format: {format}")
+
+
+def _is_geometry(dtype: Any) -> bool:
+    """Tell whether a `DuckDB` column type is the `spatial` extension's `GEOMETRY`."""
+    return str(dtype).upper().startswith("GEOMETRY")
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a `SQL` identifier, e.g. a column or view name."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _quote_literal(value: str) -> str:
+    """Quote a `SQL` string literal, e.g. a file path."""
+    return "'" + value.replace("'", "''") + "'"
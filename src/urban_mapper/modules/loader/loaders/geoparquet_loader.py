@@ -0,0 +1,453 @@
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from beartype import beartype
+from pathlib import Path
+from typing import Union, Optional, Any, Tuple, Iterator, List, Dict
+
+from urban_mapper import logger
+from urban_mapper.modules.loader.abc_loader import LoaderBase
+from urban_mapper.modules.loader.helpers import (
+    decode_geometries,
+    read_geoparquet_metadata,
+    geoparquet_column_crs,
+    arrow_schema_columns,
+    crs_name,
+    read_parquet_rows_since,
+    parquet_row_groups_within,
+    parquet_row_groups_between,
+)
+from urban_mapper.config import DEFAULT_CRS
+
+
+@beartype
+class GeoParquetLoader(LoaderBase):
+    """Loader for `GeoParquet` files.
+
+    This loader reads `GeoParquet` files natively: geometries are decoded in bulk from their
+    `WKB` encoding, and the coordinate reference system is taken from the file's `geo` metadata.
+    Like `shapefiles`, `GeoParquet` files inherently contain geometry information, so explicit
+    latitude and longitude columns are not required. If not provided, `representative points`
+    are generated.
+
+    Attributes:
+        file_path (Union[str, Path]): Path to the `GeoParquet` file to load.
+        latitude_column (Optional[str]): Name of the column containing latitude values. If not provided or empty,
+            a temporary latitude column is generated from representative points. Default: `None`
+        longitude_column (Optional[str]): Name of the column containing longitude values. If not provided or empty,
+            a temporary longitude column is generated from representative points. Default: `None`
+        geometry_column (Optional[str]): Name of the geometry column to use. Default: `None`, which uses
+            the file's primary geometry column.
+        coordinate_reference_system (Union[str, Tuple[str, str]]):
+            If a string, it specifies the target coordinate reference system (default: 'EPSG:4326'), the source
+            one being read from the file. If a tuple (source_crs, target_crs), the source CRS overrides the file's one.
+        columns (Optional[list[str]]): List of columns to read from the file. Default: `None`, which reads all columns.
+        chunksize (Optional[int]): Number of rows read at a time. When set, the file is streamed batch by batch
+            instead of being read at once. Default: `None`
+
+    Examples:
+        >>> from urban_mapper.modules.loader import GeoParquetLoader
+        >>>
+        >>> # Basic usage
+        >>> loader = GeoParquetLoader(
+        ...     file_path="buildings.geoparquet"
+        ... )
+        >>> gdf = loader.load_data_from_file()
+        >>>
+        >>> # With a subset of columns
+        >>> loader = GeoParquetLoader(
+        ...     file_path="buildings.geoparquet",
+        ...     columns=["height", "geometry"]
+        ... )
+        >>> gdf = loader.load_data_from_file()
+    """
+
+    generates_coordinates = True
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        latitude_column: Optional[str] = None,
+        longitude_column: Optional[str] = None,
+        geometry_column: Optional[str] = None,
+        coordinate_reference_system: Union[str, Tuple[str, str]] = DEFAULT_CRS,
+        columns: Optional[list[str]] = None,
+        **additional_loader_parameters: Any,
+    ) -> None:
+        super().__init__(
+            file_path=file_path,
+            latitude_column=latitude_column,
+            longitude_column=longitude_column,
+            geometry_column=geometry_column,
+            coordinate_reference_system=coordinate_reference_system,
+            **additional_loader_parameters,
+        )
+        self.columns = columns
+
+    def _load_data_from_file(self) -> gpd.GeoDataFrame:
+        """Load data from a `GeoParquet` file and return a `GeoDataFrame`.
+
+        Returns:
+            A `GeoDataFrame` containing the loaded data with geometries and
+            latitude/longitude columns as specified or generated.
+
+        Raises:
+            ValueError: If the file holds no `GeoParquet` metadata or geometry column.
+            ValueError: If some geometries cannot be decoded.
+        """
+        if self.chunksize is not None:
+            return pd.concat(
+                self._load_data_from_file_chunks(self.chunksize), ignore_index=True
+            )
+
+        parquet_file = pq.ParquetFile(self.file_path)
+        table = parquet_file.read_row_groups(
+            self._row_groups_to_read(parquet_file),
+            columns=self._columns_to_read(parquet_file),
+            use_pandas_metadata=True,
+        )
+        table = self._filter_table(table, parquet_file)
+        return self._build_geodataframe(table.to_pandas(), parquet_file)
+
+    def _load_data_from_file_chunks(
+        self, chunksize: Optional[int] = None
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Load data from a `GeoParquet` file batch by batch.
+
+        Args:
+            chunksize: Number of rows per chunk. Default: `None`, which yields one chunk per
+                row group.
+
+        Yields:
+            `GeoDataFrame` chunks, each with its geometries decoded in bulk.
+        """
+        parquet_file = pq.ParquetFile(self.file_path)
+        row_groups = self._row_groups_to_read(parquet_file)
+        columns = self._columns_to_read(parquet_file)
+        if chunksize is None:
+            batches = (
+                parquet_file.read_row_group(
+                    row_group, columns=columns, use_pandas_metadata=True
+                )
+                for row_group in row_groups
+            )
+        else:
+            batches = (
+                pa.Table.from_batches([batch])
+                for batch in parquet_file.iter_batches(
+                    batch_size=chunksize, row_groups=row_groups, columns=columns
+                )
+            )
+        for batch in batches:
+            batch = self._filter_table(batch, parquet_file)
+            yield self._build_geodataframe(batch.to_pandas(), parquet_file)
+
+    def _load_data_since(
+        self, watermark: Dict[str, Any]
+    ) -> Tuple[gpd.GeoDataFrame, Dict[str, Any]]:
+        """Load the rows appended to the `GeoParquet` file since the row count of the previous load.
+
+        Args:
+            watermark: The `rows` read by the previous load, empty on the first load.
+
+        Returns:
+            The appended rows, and the new number of `rows` read.
+        """
+        parquet_file = pq.ParquetFile(self.file_path)
+        rows = watermark.get("rows", 0)
+        if rows > parquet_file.metadata.num_rows:
+            logger.log(
+                "DEBUG_MID",
+                f"GeoParquetLoader: {self.file_path} was rewritten, reading it from the start again",
+            )
+            rows = 0
+        table = read_parquet_rows_since(
+            parquet_file, rows, columns=self._columns_to_read(parquet_file)
+        )
+        return self._build_geodataframe(table.to_pandas(), parquet_file), {
+            "rows": parquet_file.metadata.num_rows
+        }
+
+    def _probe_schema(self) -> Dict[str, Any]:
+        """Probe the schema of the `GeoParquet` file from its footer and `geo` metadata.
+
+        Returns:
+            The `columns`, `row_count`, `crs` and `bounding_box` (from the `GeoParquet`
+            `bbox`, if any) of the file.
+
+        Raises:
+            ValueError: If the file holds no `GeoParquet` metadata.
+        """
+        parquet_file = pq.ParquetFile(self.file_path)
+        geometry_column = self._geometry_column_name(parquet_file)
+        geo_metadata = read_geoparquet_metadata(parquet_file.schema_arrow)
+        if isinstance(self.coordinate_reference_system, tuple):
+            source_crs = self.coordinate_reference_system[0]
+        else:
+            source_crs = geoparquet_column_crs(geo_metadata, geometry_column)
+        bbox = geo_metadata.get("columns", {}).get(geometry_column, {}).get("bbox")
+        return {
+            "columns": arrow_schema_columns(
+                parquet_file.schema_arrow, geo_metadata.get("columns", {}).keys()
+            ),
+            "row_count": parquet_file.metadata.num_rows,
+            "crs": crs_name(source_crs),
+            "bounding_box": tuple(bbox[:4]) if bbox else None,
+        }
+
+    def _geometry_column_name(self, parquet_file: pq.ParquetFile) -> str:
+        """Get the geometry column to use, defaulting to the file's primary one.
+
+        Raises:
+            ValueError: If the file holds no `GeoParquet` metadata.
+        """
+        geo_metadata = read_geoparquet_metadata(parquet_file.schema_arrow)
+        if geo_metadata is None:
+            raise ValueError(
+                f"No GeoParquet 'geo' metadata found in {self.file_path}. "
+                "Use ParquetLoader with a geometry_column or latitude/longitude columns instead."
+            )
+        return self.geometry_column or geo_metadata["primary_column"]
+
+    def _columns_to_read(self, parquet_file: pq.ParquetFile) -> Optional[List[str]]:
+        """Work out which columns to read, always including the geometry column.
+
+        The bounding box covering column is read as well when a bounding box was pushed
+        down, for `_filter_table()` to filter rows with it.
+        """
+        geometry_column = self._geometry_column_name(parquet_file)
+        if self.columns is not None:
+            needed = set(self.columns)
+        elif self.required_columns is not None:
+            needed = set(self.required_columns) | {
+                self.latitude_column,
+                self.longitude_column,
+            }
+        else:
+            return None
+        needed.add(geometry_column)
+        covering = self._bounding_box_covering(parquet_file)
+        if covering is not None and self.bounding_box is not None:
+            needed.add(covering["xmin"][0])
+        return [name for name in parquet_file.schema_arrow.names if name in needed]
+
+    def _bounding_box_covering(
+        self, parquet_file: pq.ParquetFile
+    ) -> Optional[Dict[str, List[str]]]:
+        """Get the bounding box covering of the geometry column, if the file has one.
+
+        `GeoParquet` 1.1 files may store the extent of each geometry in a struct column,
+        whose fields are named by the `covering` of the geometry column's metadata.
+
+        Returns:
+            The paths of the `xmin`, `ymin`, `xmax` and `ymax` fields, e.g.
+            `{"xmin": ["bbox", "xmin"], ...}`, or `None` without a usable covering.
+        """
+        geo_metadata = read_geoparquet_metadata(parquet_file.schema_arrow) or {}
+        covering = (
+            geo_metadata.get("columns", {})
+            .get(self._geometry_column_name(parquet_file), {})
+            .get("covering", {})
+            .get("bbox")
+        )
+        if covering is None or any(
+            len(covering.get(bound, [])) != 2
+            for bound in ("xmin", "ymin", "xmax", "ymax")
+        ):
+            return None
+        return covering
+
+    def _row_groups_to_read(self, parquet_file: pq.ParquetFile) -> List[int]:
+        """Select the row groups that may hold geometries within the pushed down bounding box and time range.
+
+        Row groups are skipped using the min/max statistics of the bounding box covering
+        column, and of the `time_range` column. Files without a covering are read whole,
+        unless a time range applies.
+
+        Args:
+            parquet_file: The opened `GeoParquet` file.
+
+        Returns:
+            The indices of the row groups to read.
+        """
+        row_groups = list(range(parquet_file.num_row_groups))
+        selected = row_groups
+        bounding_box = self._source_bounding_box()
+        covering = self._bounding_box_covering(parquet_file)
+        if bounding_box is not None and covering is not None:
+            selected = parquet_row_groups_within(
+                parquet_file,
+                bounding_box,
+                x_columns=(".".join(covering["xmin"]), ".".join(covering["xmax"])),
+                y_columns=(".".join(covering["ymin"]), ".".join(covering["ymax"])),
+            )
+        if self.time_range is not None:
+            in_time_range = set(
+                parquet_row_groups_between(parquet_file, *self.time_range)
+            )
+            selected = [
+                row_group for row_group in selected if row_group in in_time_range
+            ]
+        if len(selected) == len(row_groups):
+            return row_groups
+
+        logger.log(
+            "DEBUG_LOW",
+            f"GeoParquetLoader: skipping {len(row_groups) - len(selected)} out of "
+            f"{len(row_groups)} row groups from {self.file_path}",
+        )
+        return selected
+
+    def _filter_table(self, table: pa.Table, parquet_file: pq.ParquetFile) -> pa.Table:
+        """Drop the rows whose bounding box covering misses the pushed down bounding box.
+
+        Rows are filtered on the covering's plain numbers, before any geometry is decoded.
+        The covering column is dropped afterwards if only read for this purpose.
+
+        Args:
+            table: The rows read from the `GeoParquet` file.
+            parquet_file: The opened `GeoParquet` file.
+
+        Returns:
+            The rows whose geometries may intersect the bounding box, every row if no
+            bounding box was pushed down or the file has no covering.
+        """
+        bounding_box = self._source_bounding_box()
+        covering = self._bounding_box_covering(parquet_file)
+        if (
+            bounding_box is None
+            or covering is None
+            or covering["xmin"][0] not in table.column_names
+        ):
+            return table
+
+        minx, miny, maxx, maxy = bounding_box
+        extents = table.column(covering["xmin"][0]).combine_chunks()
+
+        def bound(name: str) -> np.ndarray:
+            return (
+                extents.field(covering[name][1])
+                .to_numpy(zero_copy_only=False)
+                .astype("float64")
+            )
+
+        within = (
+            (bound("xmax") >= minx)
+            & (bound("xmin") <= maxx)
+            & (bound("ymax") >= miny)
+            & (bound("ymin") <= maxy)
+        )
+        logger.log(
+            "DEBUG_LOW",
+            f"GeoParquetLoader: keeping {int(within.sum())} out of {len(within)} "
+            f"rows within the pushed down bounding box of {self.file_path}",
+        )
+        table = table.filter(pa.array(within))
+        requested = self.columns if self.columns is not None else self.required_columns
+        if requested is not None and covering["xmin"][0] not in requested:
+            table = table.drop_columns([covering["xmin"][0]])
+        return table
+
+    def _build_geodataframe(
+        self, dataframe: pd.DataFrame, parquet_file: pq.ParquetFile
+    ) -> gpd.GeoDataFrame:
+        """Decode the geometries of a freshly read dataframe and build a `GeoDataFrame`.
+
+        Rows outside the `time_range` are dropped before any geometry is decoded.
+
+        Args:
+            dataframe: The rows read from the `GeoParquet` file.
+            parquet_file: The opened `GeoParquet` file.
+
+        Returns:
+            A `GeoDataFrame` in the source coordinate reference system.
+        """
+        dataframe = self._filter_time_range(dataframe)
+        geometry_column = self._geometry_column_name(parquet_file)
+        if geometry_column not in dataframe.columns:
+            raise ValueError(
+                f"Column '{geometry_column}' not found in the GeoParquet file."
+            )
+        geo_metadata = read_geoparquet_metadata(parquet_file.schema_arrow)
+        column_metadata = geo_metadata.get("columns", {}).get(geometry_column, {})
+        if column_metadata.get("encoding", "WKB").upper() != "WKB":
+            raise ValueError(
+                f"Unsupported GeoParquet encoding '{column_metadata['encoding']}' for column "
+                f"'{geometry_column}'. Only WKB-encoded geometries are supported."
+            )
+        if isinstance(self.coordinate_reference_system, tuple):
+            source_crs = self.coordinate_reference_system[0]
+        else:
+            source_crs = geoparquet_column_crs(geo_metadata, geometry_column)
+
+        dataframe[geometry_column] = decode_geometries(
+            dataframe[geometry_column], encoding="wkb"
+        )
+        gdf = gpd.GeoDataFrame(dataframe, geometry=geometry_column, crs=source_crs)
+
+        if (
+            not self.latitude_column
+            or not self.longitude_column
+            or self.latitude_column not in gdf.columns
+            or self.longitude_column not in gdf.columns
+            or gdf[self.latitude_column].isna().all()
+            or gdf[self.longitude_column].isna().all()
+        ):
+            gdf["representative_points"] = gdf.geometry.representative_point()
+            gdf["temporary_longitude"] = gdf["representative_points"].x
+            gdf["temporary_latitude"] = gdf["representative_points"].y
+            self.latitude_column = "temporary_latitude"
+            self.longitude_column = "temporary_longitude"
+
+        return gdf
+
+    def preview(self, format: str = "ascii") -> Any:
+        """Generate a preview of this `GeoParquet` loader.
+
+        Creates a summary representation of the loader for quick inspection.
+
+        Args:
+            format: The output format for the preview. Options include:
+
+                - [x] "ascii": Text-based format for terminal display
+                - [x] "json": JSON-formatted data for programmatic use
+
+        Returns:
+            A string or dictionary representing the loader, depending on the format.
+
+        Raises:
+            ValueError: If an unsupported format is requested.
+        """
+        lat_col = self.latitude_column or "temporary_latitude (generated)"
+        lon_col = self.longitude_column or "temporary_longitude (generated)"
+        geometry_col = self.geometry_column or "Primary geometry column"
+        cols = self.columns if self.columns else "All columns"
+
+        if format == "ascii":
+            return (
+                f"Loader: GeoParquetLoader\n"
+                f"  File: {self.file_path}\n"
+                f"  Latitude Column: {lat_col}\n"
+                f"  Longitude Column: {lon_col}\n"
+                f"  Geometry Column: {geometry_col}\n"
+                f"  Columns: {cols}\n"
+                f"  Chunk Size: {self.chunksize or 'Whole file'}\n"
+                f"  CRS: {self.coordinate_reference_system}\n"
+                f"  Additional params: {self.additional_loader_parameters}\n"
+            )
+        elif format == "json":
+            return {
+                "loader": "GeoParquetLoader",
+                "file": self.file_path,
+                "latitude_column": lat_col,
+                "longitude_column": lon_col,
+                "geometry_column": geometry_col,
+                "columns": cols,
+                "chunksize": self.chunksize,
+                "crs": self.coordinate_reference_system,
+                "additional_params": self.additional_loader_parameters,
+            }
+        else:
+            raise ValueError(f"Unsupported format: {format}")
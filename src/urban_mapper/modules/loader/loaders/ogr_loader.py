@@ -0,0 +1,350 @@
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyogrio
+from beartype import beartype
+from pyproj import CRS
+from pathlib import Path
+from typing import Union, Optional, Any, Tuple, Iterator, List, Dict
+
+from urban_mapper.modules.loader.abc_loader import LoaderBase
+from urban_mapper.modules.loader.helpers import (
+    decode_geometries,
+    crs_name,
+    compression_suffix,
+    gdal_virtual_path,
+)
+from urban_mapper.config import DEFAULT_CRS
+from urban_mapper.utils import cached_transformer
+
+OGR_EXTENSIONS = [".shp", ".gpkg", ".geojson", ".json", ".fgb"]
+
+
+@beartype
+class OGRLoader(LoaderBase):
+    """Loader for vector formats read through `OGR`, such as `GeoPackage`, `GeoJSON`, `FlatGeobuf` and `shapefiles`.
+
+    This loader reads files with `pyogrio`, using its `Arrow` interface, so that features are
+    decoded in bulk. Filters are evaluated by `GDAL` while reading, so that only the features
+    and attributes needed are ever materialised: `bbox` and `mask` use the file's spatial index
+    when it has one (`GeoPackage`, `FlatGeobuf`, indexed `shapefiles`), and `where` is an
+    `OGR SQL` expression on the attributes.
+
+    Files inherently contain geometry information, so explicit latitude and longitude columns
+    are not required. If not provided, `representative points` are generated.
+
+    Compressed files are read in place through `GDAL`'s virtual file systems: `zip` archives
+    (e.g. a zipped `shapefile` bundle) through `/vsizip/`, and `gzip` files through `/vsigzip/`.
+
+    Attributes:
+        file_path (Union[str, Path]): Path to the file to load, possibly a `.zip` archive or a `.gz` file.
+        latitude_column (Optional[str]): Name of the column containing latitude values. If not provided or empty,
+            a temporary latitude column is generated from representative points. Default: `None`
+        longitude_column (Optional[str]): Name of the column containing longitude values. If not provided or empty,
+            a temporary longitude column is generated from representative points. Default: `None`
+        coordinate_reference_system (Union[str, Tuple[str, str]]):
+            If a string, it specifies the coordinate reference system to use (default: 'EPSG:4326').
+            If a tuple (source_crs, target_crs), it defines a conversion from the source CRS to the target CRS (default target CRS: 'EPSG:4326').
+        layer (Optional[Union[str, int]]): Layer to read, for multi-layer formats such as `GeoPackage`. Default: `None`, the first layer.
+        columns (Optional[list[str]]): List of attribute columns to read. Default: `None`, which reads all columns.
+        bbox (Optional[Tuple[float, float, float, float]]): Only read features intersecting this
+            (`minx`, `miny`, `maxx`, `maxy`) box, expressed in the file's coordinate reference system. Default: `None`
+        mask (Optional[Any]): Only read features intersecting this `shapely` geometry, expressed in the file's
+            coordinate reference system. Cannot be combined with `bbox`. Default: `None`
+        where (Optional[str]): `OGR SQL` `WHERE` clause to filter features on their attributes. Default: `None`
+
+    Examples:
+        >>> from urban_mapper.modules.loader import OGRLoader
+        >>>
+        >>> # Basic usage
+        >>> loader = OGRLoader(file_path="parcels.gpkg")
+        >>> gdf = loader.load_data_from_file()
+        >>>
+        >>> # Only the parcels and attributes of interest
+        >>> loader = OGRLoader(
+        ...     file_path="parcels.gpkg",
+        ...     layer="parcels",
+        ...     bbox=(-74.02, 40.70, -73.97, 40.75),
+        ...     where="land_use = 'residential'",
+        ...     columns=["parcel_id", "land_use"]
+        ... )
+        >>> gdf = loader.load_data_from_file()
+    """
+
+    generates_coordinates = True
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        latitude_column: Optional[str] = None,
+        longitude_column: Optional[str] = None,
+        geometry_column: Optional[str] = None,
+        coordinate_reference_system: Union[str, Tuple[str, str]] = DEFAULT_CRS,
+        layer: Optional[Union[str, int]] = None,
+        columns: Optional[list[str]] = None,
+        bbox: Optional[Tuple[Union[int, float], ...]] = None,
+        mask: Optional[Any] = None,
+        where: Optional[str] = None,
+        **additional_loader_parameters: Any,
+    ) -> None:
+        if bbox is not None and mask is not None:
+            raise ValueError("bbox and mask cannot be used together. Pick one.")
+        super().__init__(
+            file_path=file_path,
+            latitude_column=latitude_column,
+            longitude_column=longitude_column,
+            geometry_column=geometry_column,
+            coordinate_reference_system=coordinate_reference_system,
+            **additional_loader_parameters,
+        )
+        self.layer = layer
+        self.columns = columns
+        self.bbox = bbox
+        self.mask = mask
+        self.where = where
+
+    def _load_data_from_file(self) -> gpd.GeoDataFrame:
+        """Load data from an `OGR`-readable file and return a `GeoDataFrame`.
+
+        Returns:
+            A `GeoDataFrame` containing the loaded data with geometries and
+            latitude/longitude columns as specified or generated.
+
+        Raises:
+            ValueError: If the file cannot be read, or the filters are invalid.
+        """
+        if self.chunksize is not None:
+            return pd.concat(
+                self._load_data_from_file_chunks(self.chunksize), ignore_index=True
+            )
+
+        gdf = pyogrio.read_dataframe(
+            self._dataset_path(), use_arrow=True, **self._read_options()
+        )
+        return self._finalise_geodataframe(gdf)
+
+    def _load_data_from_file_chunks(
+        self, chunksize: Optional[int] = None
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Load data from an `OGR`-readable file batch by batch.
+
+        Args:
+            chunksize: Number of features per chunk. Default: `None`, which lets `GDAL`
+                pick its default batch size.
+
+        Yields:
+            `GeoDataFrame` chunks, with the same filters applied as a full load.
+        """
+        batch_options = {"batch_size": chunksize} if chunksize is not None else {}
+        with pyogrio.open_arrow(
+            self._dataset_path(),
+            use_pyarrow=True,
+            **self._read_options(),
+            **batch_options,
+        ) as (metadata, reader):
+            geometry_name = metadata["geometry_name"] or "wkb_geometry"
+            for batch in reader:
+                dataframe = batch.to_pandas(split_blocks=True)
+                dataframe[geometry_name] = decode_geometries(
+                    dataframe[geometry_name], encoding="wkb"
+                )
+                gdf = gpd.GeoDataFrame(
+                    dataframe, geometry=geometry_name, crs=metadata["crs"]
+                )
+                if geometry_name != "geometry":
+                    gdf = gdf.rename_geometry("geometry")
+                yield self._finalise_geodataframe(gdf)
+
+    def _probe_schema(self) -> Dict[str, Any]:
+        """Probe the schema of the layer from its `OGR` metadata.
+
+        The feature count and bounds are only reported when the driver knows them without
+        scanning the layer (e.g. `GeoPackage`, `FlatGeobuf`), and are `None` otherwise.
+
+        Returns:
+            The `columns`, `row_count`, `crs` and `bounding_box` of the layer, in the
+            layer's own coordinate reference system.
+        """
+        info = pyogrio.read_info(self._dataset_path(), layer=self.layer)
+        columns = {
+            field: _arrow_type_name(dtype)
+            for field, dtype in zip(info["fields"], info["dtypes"])
+        }
+        columns["geometry"] = "geometry"
+        if info["geometry_name"]:
+            columns[info["geometry_name"]] = "geometry"
+        total_bounds = info.get("total_bounds")
+        return {
+            "columns": columns,
+            "row_count": info["features"] if info["features"] >= 0 else None,
+            "crs": crs_name(info["crs"]),
+            "bounding_box": tuple(total_bounds) if total_bounds is not None else None,
+        }
+
+    def _read_options(self) -> dict:
+        """Gather the `pyogrio` read options, merging in what the pipeline pushed down."""
+        bbox = self.bbox
+        if bbox is None and self.mask is None and self.bounding_box is not None:
+            bbox = self._pushdown_bounding_box()
+        where = self.where
+        time_range_where = self._time_range_where()
+        if time_range_where is not None:
+            where = f"({where}) AND {time_range_where}" if where else time_range_where
+        return {
+            "layer": self.layer,
+            "columns": self._columns_to_read(),
+            "bbox": bbox,
+            "mask": self.mask,
+            "where": where,
+        }
+
+    def _time_range_where(self) -> Optional[str]:
+        """Translate the `time_range` into an `OGR SQL` `WHERE` clause.
+
+        Only date and datetime fields are filtered by `GDAL`, with naive bounds. Other
+        fields, e.g. dates stored as text, are filtered once read instead.
+
+        Returns:
+            The clause, or `None` if the range cannot be evaluated by `GDAL`.
+        """
+        if self.time_range is None:
+            return None
+        column, start, end = self.time_range
+        info = pyogrio.read_info(self._dataset_path(), layer=self.layer)
+        field_types = dict(zip(info["fields"], info["dtypes"]))
+        if not str(field_types.get(column, "")).startswith("datetime64") or any(
+            bound is not None and bound.tzinfo is not None for bound in (start, end)
+        ):
+            return None
+
+        def literal(bound: pd.Timestamp) -> str:
+            if bound == bound.normalize():
+                return bound.strftime("'%Y-%m-%d'")
+            return bound.strftime("'%Y-%m-%dT%H:%M:%S'")
+
+        conditions = []
+        if start is not None:
+            conditions.append(f'"{column}" >= {literal(start)}')
+        if end is not None:
+            conditions.append(f'"{column}" < {literal(end)}')
+        return " AND ".join(conditions)
+
+    def _dataset_path(self) -> Union[str, Path]:
+        """Get the path `GDAL` opens, a virtual one for compressed files."""
+        if compression_suffix(self.file_path) is None:
+            return self.file_path
+        return gdal_virtual_path(self.file_path, OGR_EXTENSIONS)
+
+    def _columns_to_read(self) -> Optional[List[str]]:
+        """Work out which attribute columns to read."""
+        if self.columns is not None or self.required_columns is None:
+            return self.columns
+        needed = set(self.required_columns) | {
+            self.latitude_column,
+            self.longitude_column,
+        }
+        fields = pyogrio.read_info(self._dataset_path(), layer=self.layer)["fields"]
+        return [name for name in fields if name in needed]
+
+    def _pushdown_bounding_box(self) -> Tuple[float, float, float, float]:
+        """Express the pushed down bounding box in the file's coordinate reference system."""
+        file_crs = pyogrio.read_info(self._dataset_path(), layer=self.layer)["crs"]
+        if file_crs is None:
+            return self._source_bounding_box()
+        if self.bounding_box_crs is None or CRS.from_user_input(
+            self.bounding_box_crs
+        ) == CRS.from_user_input(file_crs):
+            return self.bounding_box
+        transformer = cached_transformer(self.bounding_box_crs, file_crs)
+        return tuple(transformer.transform_bounds(*self.bounding_box))
+
+    def _finalise_geodataframe(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """Set the source `CRS` and generate representative points if needed."""
+        coord_system = (
+            self.coordinate_reference_system[0]
+            if isinstance(self.coordinate_reference_system, tuple)
+            else self.coordinate_reference_system
+        )
+        if gdf.crs is None:
+            gdf = gdf.set_crs(coord_system)
+        elif gdf.crs.to_string() != coord_system:
+            gdf = gdf.to_crs(coord_system)
+
+        if (
+            not self.latitude_column
+            or not self.longitude_column
+            or self.latitude_column not in gdf.columns
+            or self.longitude_column not in gdf.columns
+            or gdf[self.latitude_column].isna().all()
+            or gdf[self.longitude_column].isna().all()
+        ):
+            gdf["representative_points"] = gdf.geometry.representative_point()
+            gdf["temporary_longitude"] = gdf["representative_points"].x
+            gdf["temporary_latitude"] = gdf["representative_points"].y
+            self.latitude_column = "temporary_latitude"
+            self.longitude_column = "temporary_longitude"
+
+        return gdf
+
+    def preview(self, format: str = "ascii") -> Any:
+        """Generate a preview of this `OGR` loader.
+
+        Creates a summary representation of the loader for quick inspection.
+
+        Args:
+            format: The output format for the preview. Options include:
+
+                - [x] "ascii": Text-based format for terminal display
+                - [x] "json": JSON-formatted data for programmatic use
+
+        Returns:
+            A string or dictionary representing the loader, depending on the format.
+
+        Raises:
+            ValueError: If an unsupported format is requested.
+        """
+        lat_col = self.latitude_column or "temporary_latitude (generated)"
+        lon_col = self.longitude_column or "temporary_longitude (generated)"
+        cols = self.columns if self.columns else "All columns"
+
+        if format == "ascii":
+            return (
+                f"Loader: {type(self).__name__}\n"
+                f"  File: {self.file_path}\n"
+                f"  Layer: {self.layer if self.layer is not None else 'First layer'}\n"
+                f"  Latitude Column: {lat_col}\n"
+                f"  Longitude Column: {lon_col}\n"
+                f"  Columns: {cols}\n"
+                f"  Bounding Box: {self.bbox}\n"
+                f"  Mask: {self.mask}\n"
+                f"  Where: {self.where}\n"
+                f"  CRS: {self.coordinate_reference_system}\n"
+                f"  Additional params: {self.additional_loader_parameters}\n"
+            )
+        elif format == "json":
+            return {
+                "loader": type(self).__name__,
+                "file": self.file_path,
+                "layer": self.layer,
+                "latitude_column": lat_col,
+                "longitude_column": lon_col,
+                "columns": cols,
+                "bbox": self.bbox,
+                "mask": self.mask,
+                "where": self.where,
+                "crs": self.coordinate_reference_system,
+                "additional_params": self.additional_loader_parameters,
+            }
+        else:
+            raise ValueError(f"Unsupported format: {format}")
+
+
+def _arrow_type_name(dtype: str) -> str:
+    """Name the Arrow type of an `OGR` field from its `numpy` dtype."""
+    if dtype == "object":
+        return "string"
+    try:
+        return str(pa.from_numpy_dtype(np.dtype(dtype)))
+    except (TypeError, pa.ArrowNotImplementedError):
+        return dtype
@@ -1,11 +1,25 @@
 import pandas as pd
 import geopandas as gpd
-from shapely import wkt
+import pyarrow as pa
+import pyarrow.parquet as pq
 from beartype import beartype
 from pathlib import Path
-from typing import Union, Optional, Any, Tuple
+from typing import Union, Optional, Any, Tuple, Iterator, List, Dict
 
+from urban_mapper import logger
 from urban_mapper.modules.loader.abc_loader import LoaderBase
+from urban_mapper.modules.loader.helpers import (
+    decode_geometries,
+    read_geoparquet_metadata,
+    geoparquet_column_crs,
+    arrow_schema_columns,
+    crs_name,
+    parquet_coordinate_bounds,
+    read_parquet_rows_since,
+    parquet_row_groups_within,
+    parquet_row_groups_between,
+    points_from_coordinates,
+)
 from urban_mapper.config import DEFAULT_CRS
 from urban_mapper.utils import require_attributes, require_either_or_attributes
 
@@ -25,8 +39,24 @@ class ParquetLoader(LoaderBase):
         coordinate_reference_system (Union[str, Tuple[str, str]]):
             If a string, it specifies the coordinate reference system to use (default: 'EPSG:4326').
             If a tuple (source_crs, target_crs), it defines a conversion from the source CRS to the target CRS (default target CRS: 'EPSG:4326').
+        geometry_column (Optional[str]): Name of the column containing encoded geometries (`WKB`, `WKT`, hex `WKB`
+            or `GeoJSON`). Default: `None`
         engine (str): The engine to use for reading Parquet files. Default: `"pyarrow"`
         columns (Optional[list[str]]): List of columns to read from the Parquet file. Default: `None`, which reads all columns.
+        geometry_encoding (str): How geometries in `geometry_column` are encoded, one of `"auto"`, `"wkt"`, `"wkb"`,
+            `"hex"` or `"geojson"`. Default: `"auto"`, which detects the encoding of each value.
+        chunksize (Optional[int]): Number of rows read at a time. When set, the file is streamed batch by batch
+            instead of being read at once. Default: `None`
+
+    !!! tip "GeoParquet"
+        When `geometry_column` is described by `GeoParquet` `geo` metadata, its `CRS` is used as the
+        source `CRS`, unless a `(source, target)` tuple is given. For plain `GeoParquet` files,
+        prefer `GeoParquetLoader`, which does not need any column to be specified.
+
+    !!! tip "Pushdown"
+        When used in an `UrbanPipeline` with pushdown enabled, and `columns` is left to `None`, only the
+        columns needed by the pipeline's steps are read. Row groups whose latitude / longitude
+        min/max statistics fall outside of the pushed down bounding box are skipped altogether.
 
     Examples:
         >>> from urban_mapper.modules.loader import ParquetLoader
@@ -66,6 +96,15 @@ class ParquetLoader(LoaderBase):
         ...     coordinate_reference_system=("EPSG:4326", "EPSG:3857")
         ... )
         >>> gdf = loader.load_data_from_file()
+        >>>
+        >>> # Streaming the file one row group at a time
+        >>> loader = ParquetLoader(
+        ...     file_path="data.parquet",
+        ...     latitude_column="latitude",
+        ...     longitude_column="longitude"
+        ... )
+        >>> for chunk in loader.load_data_from_file_chunks():
+        ...     print(len(chunk))
     """
 
     def __init__(
@@ -77,6 +116,7 @@ class ParquetLoader(LoaderBase):
         coordinate_reference_system: Union[str, Tuple[str, str]] = DEFAULT_CRS,
         engine: str = "pyarrow",
         columns: Optional[list[str]] = None,
+        geometry_encoding: str = "auto",
         **additional_loader_parameters: Any,
     ) -> None:
         super().__init__(
@@ -89,6 +129,7 @@ class ParquetLoader(LoaderBase):
         )
         self.engine = engine
         self.columns = columns
+        self.geometry_encoding = geometry_encoding
 
     @require_either_or_attributes(
         [["latitude_column", "longitude_column"], ["geometry_column"]],
@@ -111,12 +152,258 @@ class ParquetLoader(LoaderBase):
             ValueError: If the specified latitude or longitude columns are not found in the Parquet file.
             IOError: If the Parquet file cannot be read.
         """
-        dataframe = pd.read_parquet(
-            self.file_path,
-            engine=self.engine,
-            columns=self.columns,
+        if self.chunksize is not None:
+            return pd.concat(
+                self._load_data_from_file_chunks(self.chunksize), ignore_index=True
+            )
+
+        if (
+            self.required_columns is None
+            and self.bounding_box is None
+            and self.time_range is None
+        ):
+            dataframe = pd.read_parquet(
+                self.file_path,
+                engine=self.engine,
+                columns=self.columns,
+            )
+        else:
+            parquet_file = pq.ParquetFile(self.file_path)
+            dataframe = parquet_file.read_row_groups(
+                self._row_groups_to_read(parquet_file),
+                columns=self._columns_to_read(parquet_file),
+                use_pandas_metadata=True,
+            ).to_pandas()
+        return self._build_geodataframe(dataframe, self._source_crs())
+
+    @require_either_or_attributes(
+        [["latitude_column", "longitude_column"], ["geometry_column"]],
+        error_msg="Either both 'latitude_column' and 'longitude_column' must be set, or 'geometry_column' must be set.",
+    )
+    def _load_data_from_file_chunks(
+        self, chunksize: Optional[int] = None
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Load data from a `Parquet` file batch by batch.
+
+        Streams the file with `pyarrow`, so that only one batch of rows is decoded and
+        held in memory at any time, each batch being converted to a `GeoDataFrame` on its own.
+
+        !!! note "Engine"
+            Streaming always relies on `pyarrow`, whatever the configured `engine`.
+
+        Args:
+            chunksize: Number of rows per chunk. Default: `None`, which yields one chunk per
+                `Parquet` row group.
+
+        Yields:
+            `GeoDataFrame` chunks with point geometries created from the latitude and
+            longitude columns, or geometries parsed from the geometry column.
+
+        Raises:
+            ValueError: If the specified columns are not found in the Parquet file.
+            IOError: If the Parquet file cannot be read.
+        """
+        parquet_file = pq.ParquetFile(self.file_path)
+        row_groups = self._row_groups_to_read(parquet_file)
+        columns = self._columns_to_read(parquet_file)
+        source_crs = self._source_crs(parquet_file.schema_arrow)
+        if chunksize is None:
+            batches = (
+                parquet_file.read_row_group(
+                    row_group, columns=columns, use_pandas_metadata=True
+                )
+                for row_group in row_groups
+            )
+        else:
+            batches = parquet_file.iter_batches(
+                batch_size=chunksize, row_groups=row_groups, columns=columns
+            )
+        for batch in batches:
+            yield self._build_geodataframe(batch.to_pandas(), source_crs)
+
+    @require_either_or_attributes(
+        [["latitude_column", "longitude_column"], ["geometry_column"]],
+        error_msg="Either both 'latitude_column' and 'longitude_column' must be set, or 'geometry_column' must be set.",
+    )
+    def _load_data_since(
+        self, watermark: Dict[str, Any]
+    ) -> Tuple[gpd.GeoDataFrame, Dict[str, Any]]:
+        """Load the rows appended to the `Parquet` file since the row count of the previous load.
+
+        Row groups holding only rows read by the previous load are skipped. A file holding
+        fewer rows than the previous load is read again from the start.
+
+        Args:
+            watermark: The `rows` read by the previous load, empty on the first load.
+
+        Returns:
+            The appended rows, and the new number of `rows` read.
+        """
+        parquet_file = pq.ParquetFile(self.file_path)
+        rows = watermark.get("rows", 0)
+        if rows > parquet_file.metadata.num_rows:
+            logger.log(
+                "DEBUG_MID",
+                f"ParquetLoader: {self.file_path} was rewritten, reading it from the start again",
+            )
+            rows = 0
+        table = read_parquet_rows_since(
+            parquet_file, rows, columns=self._columns_to_read(parquet_file)
         )
+        return self._build_geodataframe(
+            table.to_pandas(), self._source_crs(parquet_file.schema_arrow)
+        ), {"rows": parquet_file.metadata.num_rows}
+
+    def _probe_schema(self) -> Dict[str, Any]:
+        """Probe the schema of the `Parquet` file from its footer.
+
+        The row count comes from the file metadata. The bounding box comes from the
+        `GeoParquet` `bbox` of `geometry_column`, or from the min/max statistics of the
+        latitude and longitude columns.
 
+        Returns:
+            The `columns`, `row_count`, `crs` and `bounding_box` of the file.
+        """
+        parquet_file = pq.ParquetFile(self.file_path)
+        schema = parquet_file.schema_arrow
+        geo_metadata = read_geoparquet_metadata(schema) or {}
+        bounding_box = None
+        if self.geometry_column != "":
+            bbox = (
+                geo_metadata.get("columns", {})
+                .get(self.geometry_column, {})
+                .get("bbox")
+            )
+            bounding_box = tuple(bbox[:4]) if bbox else None
+        elif self.latitude_column != "" and self.longitude_column != "":
+            bounding_box = parquet_coordinate_bounds(
+                parquet_file, self.longitude_column, self.latitude_column
+            )
+        return {
+            "columns": arrow_schema_columns(
+                schema, geo_metadata.get("columns", {}).keys()
+            ),
+            "row_count": parquet_file.metadata.num_rows,
+            "crs": crs_name(self._source_crs(schema)),
+            "bounding_box": bounding_box,
+        }
+
+    def _source_crs(self, schema: Optional[pa.Schema] = None) -> Any:
+        """Work out the coordinate reference system the file is stored in.
+
+        An explicit `(source, target)` tuple always wins. Otherwise, when the geometry
+        column is described by `GeoParquet` `geo` metadata, its `CRS` is used.
+
+        Args:
+            schema: The Arrow schema of the file, read from the file if not given.
+
+        Returns:
+            The source coordinate reference system.
+        """
+        if isinstance(self.coordinate_reference_system, tuple):
+            return self.coordinate_reference_system[0]
+        if self.geometry_column != "":
+            geo_metadata = read_geoparquet_metadata(
+                schema if schema is not None else pq.read_schema(self.file_path)
+            )
+            if geo_metadata is not None:
+                column_crs = geoparquet_column_crs(geo_metadata, self.geometry_column)
+                if column_crs is not None:
+                    return column_crs
+        return self.coordinate_reference_system
+
+    def _columns_to_read(self, parquet_file: pq.ParquetFile) -> Optional[List[str]]:
+        """Work out which columns to read from the `Parquet` file.
+
+        User-specified `columns` always win. Otherwise, columns pushed down by the pipeline
+        are read, together with the loader's own coordinate or geometry columns.
+
+        Args:
+            parquet_file: The opened `Parquet` file.
+
+        Returns:
+            The list of columns to read, in file order, or `None` to read them all.
+        """
+        if self.columns is not None or self.required_columns is None:
+            return self.columns
+        needed = set(self.required_columns) | {
+            self.latitude_column,
+            self.longitude_column,
+            self.geometry_column,
+        }
+        columns = [name for name in parquet_file.schema_arrow.names if name in needed]
+        logger.log(
+            "DEBUG_LOW",
+            f"ParquetLoader: reading {len(columns)} out of "
+            f"{len(parquet_file.schema_arrow.names)} columns from {self.file_path}",
+        )
+        return columns
+
+    def _row_groups_to_read(self, parquet_file: pq.ParquetFile) -> List[int]:
+        """Select the row groups that may hold rows within the pushed down bounding box and time range.
+
+        Row groups are skipped using the min/max statistics of the latitude and longitude
+        columns, and of the `time_range` column. Row groups lacking statistics, or with
+        statistics of another type (e.g. dates stored as strings), are kept.
+
+        Args:
+            parquet_file: The opened `Parquet` file.
+
+        Returns:
+            The indices of the row groups to read.
+        """
+        row_groups = list(range(parquet_file.num_row_groups))
+        selected = row_groups
+        bounding_box = self._source_bounding_box()
+        if (
+            bounding_box is not None
+            and self.latitude_column != ""
+            and self.longitude_column != ""
+        ):
+            selected = parquet_row_groups_within(
+                parquet_file,
+                bounding_box,
+                x_columns=(self.longitude_column, self.longitude_column),
+                y_columns=(self.latitude_column, self.latitude_column),
+            )
+        if self.time_range is not None:
+            in_time_range = set(
+                parquet_row_groups_between(parquet_file, *self.time_range)
+            )
+            selected = [
+                row_group for row_group in selected if row_group in in_time_range
+            ]
+        if len(selected) == len(row_groups):
+            return row_groups
+
+        logger.log(
+            "DEBUG_LOW",
+            f"ParquetLoader: skipping {len(row_groups) - len(selected)} out of "
+            f"{len(row_groups)} row groups from {self.file_path}",
+        )
+        return selected
+
+    def _build_geodataframe(
+        self, dataframe: pd.DataFrame, source_crs: Any
+    ) -> gpd.GeoDataFrame:
+        """Convert a freshly read `Parquet` dataframe into a `GeoDataFrame`.
+
+        Rows outside the `time_range`, or whose coordinates fall outside the pushed down
+        bounding box, are dropped before any point geometry is built. Point geometries are built directly in the
+        target coordinate reference system.
+
+        Args:
+            dataframe: The rows read from the `Parquet` file.
+            source_crs: The coordinate reference system the file is stored in.
+
+        Returns:
+            A `GeoDataFrame` in the target coordinate reference system for points, in the
+            source one for a geometry column.
+
+        Raises:
+            ValueError: If the specified columns are not found in the dataframe.
+        """
+        dataframe = self._filter_time_range(dataframe)
         if self.latitude_column != "" and self.longitude_column != "":
             if self.latitude_column not in dataframe.columns:
                 raise ValueError(
@@ -133,9 +420,18 @@ class ParquetLoader(LoaderBase):
             dataframe[self.longitude_column] = pd.to_numeric(
                 dataframe[self.longitude_column], errors="coerce"
             )
-            geometry = gpd.points_from_xy(
-                dataframe[self.longitude_column],
-                dataframe[self.latitude_column],
+            within = self._bounding_box_mask(
+                dataframe[self.longitude_column], dataframe[self.latitude_column]
+            )
+            if within is not None:
+                dataframe = dataframe[within]
+            return gpd.GeoDataFrame(
+                dataframe,
+                geometry=points_from_coordinates(
+                    dataframe[self.longitude_column],
+                    dataframe[self.latitude_column],
+                    (source_crs, self._target_crs()),
+                ),
             )
         else:
             if self.geometry_column not in dataframe.columns:
@@ -143,18 +439,15 @@ class ParquetLoader(LoaderBase):
                     f"Column '{self.geometry_column}' not found in the Parquet file."
                 )
 
-            filter_not_na = dataframe[self.geometry_column].notna()
-            dataframe.loc[filter_not_na, self.geometry_column] = dataframe.loc[
-                filter_not_na, self.geometry_column
-            ].apply(wkt.loads)
+            dataframe[self.geometry_column] = decode_geometries(
+                dataframe[self.geometry_column], encoding=self.geometry_encoding
+            )
             geometry = self.geometry_column
 
         geodataframe = gpd.GeoDataFrame(
             dataframe,
             geometry=geometry,
-            crs=self.coordinate_reference_system[0]
-            if isinstance(self.coordinate_reference_system, tuple)
-            else self.coordinate_reference_system,
+            crs=source_crs,
         )
         return geodataframe
 
@@ -176,6 +469,8 @@ class ParquetLoader(LoaderBase):
             ValueError: If an unsupported format is requested.
         """
         cols = self.columns if self.columns else "All columns"
+        if self.columns is None and self.required_columns is not None:
+            cols = f"Pushed down: {self.required_columns}"
 
         if format == "ascii":
             return (
@@ -185,7 +480,9 @@ class ParquetLoader(LoaderBase):
                 f"  Longitude Column: {self.longitude_column}\n"
                 f"  Geometry Column: {self.geometry_column}\n"
                 f"  Engine: {self.engine}\n"
+                f"  Geometry Encoding: {self.geometry_encoding}\n"
                 f"  Columns: {cols}\n"
+                f"  Chunk Size: {self.chunksize or 'Whole file'}\n"
                 f"  CRS: {self.coordinate_reference_system}\n"
                 f"  Additional params: {self.additional_loader_parameters}\n"
             )
@@ -197,7 +494,9 @@ class ParquetLoader(LoaderBase):
                 "longitude_column": self.longitude_column,
                 "geometry_column": self.geometry_column,
                 "engine": self.engine,
+                "geometry_encoding": self.geometry_encoding,
                 "columns": cols,
+                "chunksize": self.chunksize,
                 "coordinate_reference_system": self.coordinate_reference_system,
                 "additional_params": self.additional_loader_parameters,
             }
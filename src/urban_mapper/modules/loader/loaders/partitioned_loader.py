@@ -0,0 +1,378 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Union, Optional, Any, Tuple, Iterator, List, Dict, Type
+
+import geopandas as gpd
+import pandas as pd
+from beartype import beartype
+
+from urban_mapper import logger
+from urban_mapper.modules.loader.abc_loader import LoaderBase
+from urban_mapper.modules.loader.helpers import (
+    discover_files,
+    parse_partition_values,
+    normalise_coordinate_reference_system,
+    partition_base_directory,
+)
+from urban_mapper.config import DEFAULT_CRS
+
+
+@beartype
+class PartitionedLoader(LoaderBase):
+    """Loader for datasets split across several files: glob patterns and partitioned directories.
+
+    This loader reads every file matched by a glob pattern (e.g. `trips/2024-*.parquet`), or
+    found under a directory, with the loader of their file format (e.g. `ParquetLoader`), and
+    concatenates them. Files are read concurrently in a thread pool, which pays off since the
+    underlying readers (`pyarrow`, `GDAL`) release the `GIL` while parsing.
+
+    Directories laid out `hive`-style (`year=2024/month=05/day=01/part-0.parquet`) have their
+    partition keys added as `categorical` columns. A `partition_filter` skips whole
+    directories without even listing them.
+
+    !!! note "Streaming"
+        With a `chunksize`, files are streamed one after the other, rather than concurrently,
+        so that memory stays bounded by a single chunk.
+
+    Attributes:
+        file_path (Union[str, Path]): Glob pattern, or directory, of the files to load.
+        loader_class (Type[LoaderBase]): Loader used to read each file, e.g. `ParquetLoader`.
+        latitude_column (Optional[str]): Name of the column containing latitude values. Default: `None`
+        longitude_column (Optional[str]): Name of the column containing longitude values. Default: `None`
+        geometry_column (Optional[str]): Name of the column containing geometries. Default: `None`
+        coordinate_reference_system (Union[str, Tuple[str, str]]):
+            If a string, it specifies the coordinate reference system to use (default: 'EPSG:4326').
+            If a tuple (source_crs, target_crs), it defines a conversion from the source CRS to the target CRS (default target CRS: 'EPSG:4326').
+        extensions (Optional[List[str]]): File extensions to read when `file_path` is a directory, e.g. `[".parquet"]`.
+            Default: `None`, which reads every file.
+        partition_filter (Optional[Dict[str, Any]]): Mapping from partition key to the accepted value, or list of
+            accepted values. Default: `None`, which reads every partition.
+        max_workers (Optional[int]): Number of files read concurrently. Default: `None`, which lets
+            `concurrent.futures` pick.
+        loader_options (Optional[Dict[str, Any]]): Keyword arguments for `loader_class`, e.g. `columns`. Default: `None`
+
+    Examples:
+        >>> from urban_mapper.modules.loader import PartitionedLoader, ParquetLoader
+        >>>
+        >>> # One file per day
+        >>> loader = PartitionedLoader(
+        ...     file_path="trips/2024-*.parquet",
+        ...     loader_class=ParquetLoader,
+        ...     latitude_column="pickup_lat",
+        ...     longitude_column="pickup_lng"
+        ... )
+        >>> gdf = loader.load_data_from_file()
+        >>>
+        >>> # Hive-partitioned directory, May and June only
+        >>> loader = PartitionedLoader(
+        ...     file_path="trips/",
+        ...     loader_class=ParquetLoader,
+        ...     latitude_column="pickup_lat",
+        ...     longitude_column="pickup_lng",
+        ...     extensions=[".parquet"],
+        ...     partition_filter={"year": "2024", "month": ["05", "06"]}
+        ... )
+        >>> gdf = loader.load_data_from_file()
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        loader_class: Type[LoaderBase],
+        latitude_column: Optional[str] = None,
+        longitude_column: Optional[str] = None,
+        geometry_column: Optional[str] = None,
+        coordinate_reference_system: Union[str, Tuple[str, str]] = DEFAULT_CRS,
+        extensions: Optional[List[str]] = None,
+        partition_filter: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None,
+        loader_options: Optional[Dict[str, Any]] = None,
+        **additional_loader_parameters: Any,
+    ) -> None:
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(
+                f"max_workers must be a positive integer, got {max_workers}."
+            )
+        super().__init__(
+            file_path=file_path,
+            latitude_column=latitude_column,
+            longitude_column=longitude_column,
+            geometry_column=geometry_column,
+            coordinate_reference_system=coordinate_reference_system,
+            **additional_loader_parameters,
+        )
+        self.loader_class = loader_class
+        self.generates_coordinates = loader_class.generates_coordinates
+        self.extensions = extensions
+        self.partition_filter = partition_filter
+        self.max_workers = max_workers
+        self.loader_options: Dict[str, Any] = dict(loader_options or {})
+
+    def _source_files(self) -> List[Path]:
+        """List the files to read, once the partition filter is applied."""
+        return discover_files(
+            self.file_path,
+            extensions=self.extensions,
+            partition_filter=self.partition_filter,
+        )
+
+    def _probe_schema(self) -> Dict[str, Any]:
+        """Probe the schema of every file from its metadata, and merge them.
+
+        Each file is probed, and checked, by `loader_class`. Columns are those of the first
+        file, followed by the partition keys, reported as `category`. Row counts are summed
+        and bounding boxes merged, when every file reports them.
+
+        Returns:
+            The `columns`, `row_count`, `crs`, `bounding_box` and `number_of_files` of the dataset.
+
+        Raises:
+            ValueError: If no file matches `file_path` and the partition filter.
+            NotImplementedError: If `loader_class` cannot probe its file format.
+        """
+        files = self._matching_files()
+        schemas = [self._file_loader(file).probe_schema() for file in files]
+        schema = dict(schemas[0])
+        schema["columns"] = dict(schema["columns"])
+        schema["columns"].update(
+            (key, "category") for key in self._partition_categories(files)
+        )
+        row_counts = [file_schema["row_count"] for file_schema in schemas]
+        schema["row_count"] = None if None in row_counts else sum(row_counts)
+        if "row_count_is_estimate" in schema:
+            schema["row_count_is_estimate"] = any(
+                file_schema["row_count_is_estimate"] for file_schema in schemas
+            )
+        bounding_boxes = [file_schema["bounding_box"] for file_schema in schemas]
+        if None in bounding_boxes or any(
+            file_schema["crs"] != schema["crs"] for file_schema in schemas
+        ):
+            schema["bounding_box"] = None
+        else:
+            minxs, minys, maxxs, maxys = zip(*bounding_boxes)
+            schema["bounding_box"] = (min(minxs), min(minys), max(maxxs), max(maxys))
+        schema["number_of_files"] = len(files)
+        return schema
+
+    def _load_data_from_file(self) -> gpd.GeoDataFrame:
+        """Read every file concurrently and concatenate them into a single `GeoDataFrame`.
+
+        Returns:
+            A `GeoDataFrame` holding the rows of every file, with partition columns as categoricals.
+
+        Raises:
+            ValueError: If no file matches `file_path` and the partition filter.
+        """
+        if self.chunksize is not None:
+            return pd.concat(
+                self._load_data_from_file_chunks(self.chunksize), ignore_index=True
+            )
+
+        files = self._matching_files()
+        categories = self._partition_categories(files)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            loaded_files = list(
+                executor.map(lambda file: self._load_partition(file, categories), files)
+            )
+        return pd.concat(loaded_files, ignore_index=True)
+
+    def _load_data_since(
+        self, watermark: Dict[str, Any]
+    ) -> Tuple[gpd.GeoDataFrame, Dict[str, Any]]:
+        """Read the files that appeared since the previous load, concurrently.
+
+        Files are expected to be immutable once written, as with daily partitions: files
+        read by a previous load are never read again, even if modified since.
+
+        Args:
+            watermark: The `files` read by previous loads, empty on the first load.
+
+        Returns:
+            The rows of the new files, and the new list of `files` read.
+        """
+        files = self._matching_files()
+        read_files = set(watermark.get("files", []))
+        new_files = [file for file in files if str(file.resolve()) not in read_files]
+        logger.log(
+            "DEBUG_LOW",
+            f"PartitionedLoader: {len(new_files)} new files out of {len(files)} in {self.file_path}",
+        )
+        new_watermark = {
+            "files": sorted(read_files | {str(file.resolve()) for file in new_files})
+        }
+        if not new_files:
+            schema = self.probe_schema()
+            source_crs = (
+                self.coordinate_reference_system[0]
+                if isinstance(self.coordinate_reference_system, tuple)
+                else self.coordinate_reference_system
+            )
+            empty = gpd.GeoDataFrame(
+                pd.DataFrame(
+                    columns=[
+                        column
+                        for column, column_type in schema["columns"].items()
+                        if column_type != "geometry"
+                    ]
+                ),
+                geometry=gpd.GeoSeries([], crs=schema["crs"] or source_crs),
+            )
+            return empty, new_watermark
+
+        categories = self._partition_categories(files)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            loaded_files = list(
+                executor.map(
+                    lambda file: self._load_partition(file, categories), new_files
+                )
+            )
+        return pd.concat(loaded_files, ignore_index=True), new_watermark
+
+    def _load_data_from_file_chunks(
+        self, chunksize: Optional[int] = None
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Stream every file, one after the other, chunk by chunk.
+
+        Args:
+            chunksize: Number of rows per chunk, passed on to `loader_class`.
+
+        Yields:
+            `GeoDataFrame` chunks, with partition columns as categoricals.
+        """
+        files = self._matching_files()
+        categories = self._partition_categories(files)
+        for file in files:
+            file_loader = self._file_loader(file)
+            for chunk in file_loader._load_data_from_file_chunks(chunksize):
+                yield self._add_partition_columns(
+                    normalise_coordinate_reference_system(
+                        chunk, self.coordinate_reference_system
+                    ),
+                    file,
+                    categories,
+                )
+            self._adopt_coordinate_columns(file_loader)
+
+    def _matching_files(self) -> List[Path]:
+        files = self._source_files()
+        if not files:
+            raise ValueError(
+                f"No file found for '{self.file_path}'"
+                + (
+                    f" with partition filter {self.partition_filter}."
+                    if self.partition_filter
+                    else "."
+                )
+            )
+        logger.log(
+            "DEBUG_LOW",
+            f"PartitionedLoader: reading {len(files)} files from {self.file_path}",
+        )
+        return files
+
+    def _file_loader(self, file: Path) -> LoaderBase:
+        """Build the loader of a single file, sharing this loader's settings and pushdown."""
+        file_loader = self.loader_class(
+            file,
+            latitude_column=self.latitude_column or None,
+            longitude_column=self.longitude_column or None,
+            geometry_column=self.geometry_column or None,
+            coordinate_reference_system=self.coordinate_reference_system,
+            time_range=self.time_range,
+            **self.loader_options,
+        )
+        return file_loader.with_pushdown(
+            required_columns=self.required_columns,
+            bounding_box=self.bounding_box,
+            bounding_box_crs=self.bounding_box_crs,
+        )
+
+    def _load_partition(
+        self, file: Path, categories: Dict[str, List[str]]
+    ) -> gpd.GeoDataFrame:
+        file_loader = self._file_loader(file)
+        loaded_file = normalise_coordinate_reference_system(
+            file_loader._load_data_from_file(), self.coordinate_reference_system
+        )
+        self._adopt_coordinate_columns(file_loader)
+        return self._add_partition_columns(loaded_file, file, categories)
+
+    def _adopt_coordinate_columns(self, file_loader: LoaderBase) -> None:
+        """Pick up the representative point columns a file loader may have generated."""
+        self.latitude_column = file_loader.latitude_column
+        self.longitude_column = file_loader.longitude_column
+
+    def _partition_categories(self, files: List[Path]) -> Dict[str, List[str]]:
+        """Collect the values of every partition key, so that all files share the same categories."""
+        base_directory = partition_base_directory(self.file_path)
+        categories: Dict[str, set] = {}
+        for file in files:
+            for key, value in parse_partition_values(file, base_directory).items():
+                categories.setdefault(key, set()).add(value)
+        return {key: sorted(values) for key, values in categories.items()}
+
+    def _add_partition_columns(
+        self,
+        loaded_file: gpd.GeoDataFrame,
+        file: Path,
+        categories: Dict[str, List[str]],
+    ) -> gpd.GeoDataFrame:
+        partition_values = parse_partition_values(
+            file, partition_base_directory(self.file_path)
+        )
+        for key, values in categories.items():
+            loaded_file[key] = pd.Categorical(
+                [partition_values.get(key)] * len(loaded_file), categories=values
+            )
+        return loaded_file
+
+    def preview(self, format: str = "ascii") -> Any:
+        """Generate a preview of this partitioned loader.
+
+        Creates a summary representation of the loader for quick inspection.
+
+        Args:
+            format: The output format for the preview. Options include:
+
+                - [x] "ascii": Text-based format for terminal display
+                - [x] "json": JSON-formatted data for programmatic use
+
+        Returns:
+            A string or dictionary representing the loader, depending on the format.
+
+        Raises:
+            ValueError: If an unsupported format is requested.
+        """
+        number_of_files = len(self._source_files())
+
+        if format == "ascii":
+            return (
+                f"Loader: PartitionedLoader\n"
+                f"  Files: {self.file_path} ({number_of_files} files)\n"
+                f"  File Loader: {self.loader_class.__name__}\n"
+                f"  Latitude Column: {self.latitude_column}\n"
+                f"  Longitude Column: {self.longitude_column}\n"
+                f"  Geometry Column: {self.geometry_column}\n"
+                f"  Partition Filter: {self.partition_filter or 'All partitions'}\n"
+                f"  Max Workers: {self.max_workers or 'Default'}\n"
+                f"  CRS: {self.coordinate_reference_system}\n"
+                f"  Loader Options: {self.loader_options}\n"
+                f"  Additional params: {self.additional_loader_parameters}\n"
+            )
+        elif format == "json":
+            return {
+                "loader": "PartitionedLoader",
+                "file": self.file_path,
+                "number_of_files": number_of_files,
+                "file_loader": self.loader_class.__name__,
+                "latitude_column": self.latitude_column,
+                "longitude_column": self.longitude_column,
+                "geometry_column": self.geometry_column,
+                "partition_filter": self.partition_filter,
+                "max_workers": self.max_workers,
+                "crs": self.coordinate_reference_system,
+                "loader_options": self.loader_options,
+                "additional_params": self.additional_loader_parameters,
+            }
+        else:
+            raise ValueError(f"Unsupported format: {format}")
@@ -0,0 +1,453 @@
+import os
+from pathlib import Path
+from typing import Union, Optional, Any, Tuple, Iterator, List, Dict
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import rasterio
+from beartype import beartype
+from pyproj import CRS
+from rasterio.windows import Window
+
+from urban_mapper import logger
+from urban_mapper.modules.loader.abc_loader import LoaderBase
+from urban_mapper.modules.loader.helpers import (
+    crs_name,
+    points_from_coordinates,
+)
+from urban_mapper.config import DEFAULT_CRS
+from urban_mapper.utils import (
+    block_window_pixels,
+    block_windows,
+    map_block_windows,
+    open_raster,
+    overview_level,
+    cached_transformer,
+    raster_window,
+    valid_pixel_mask,
+    pixel_centres,
+)
+
+DEFAULT_CHUNKSIZE = 1_000_000
+# Working memory of a loaded pixel besides its bands: coordinates, point geometry and masks.
+PIXEL_BYTES_OVERHEAD = 160
+
+
+@beartype
+class RasterLoader(LoaderBase):
+    """Loader for `GeoTIFF` rasters, including Cloud Optimised `GeoTIFFs` (`COGs`), read with `rasterio`.
+
+    This loader turns the valid pixels of a raster into points, one row per pixel, located
+    at the pixel centre and holding one column per band. Only the window of the raster
+    intersecting the area of interest is read: the caller's `bbox`, or else the bounding box
+    of the urban layer pushed down by the `UrbanPipeline`. `nodata` pixels are masked out in
+    bulk with `NumPy`, and point coordinates are computed from the raster's affine transform
+    for all pixels at once, so that memory and time grow with the size of the window rather
+    than with the size of the raster.
+
+    !!! note "Memory"
+        Every valid pixel becomes a point geometry, about a hundred bytes each. Narrow the
+        window with `bbox`, or stream it with `chunksize`, for rasters with hundreds of
+        millions of pixels. With `max_memory`, the window is streamed in groups of whole
+        internal blocks sized so that the blocks being read, in a pool of `max_workers`
+        threads, stay within `max_memory`, whatever the size of the raster.
+
+    !!! note "Overviews"
+        With `target_resolution`, pixels are read from the coarsest internal overview of the
+        raster that is still at least as fine as the target, e.g. the 1/16 overview of a 2 m
+        raster for a 40 m target, i.e. 256 times fewer points. Rasters without overviews are
+        read at full resolution, see `urban_mapper.utils.build_overviews()` to build them.
+
+    Rasters inherently locate their pixels, so no column needs to be specified. The pixel
+    centres are exposed as `temporary_longitude` / `temporary_latitude` columns unless
+    `longitude_column` / `latitude_column` name them.
+
+    !!! note "Coordinate reference system"
+        The raster's own `CRS` is used as the source `CRS`. The `coordinate_reference_system`
+        only gives the target `CRS` (or, as a tuple, the source `CRS` for rasters lacking one).
+
+    Attributes:
+        file_path (Union[str, Path]): Path to the `.tif` / `.tiff` file to load.
+        latitude_column (Optional[str]): Name of the column to store the pixel centres' latitude in.
+            Default: `None`, which uses `temporary_latitude`.
+        longitude_column (Optional[str]): Name of the column to store the pixel centres' longitude in.
+            Default: `None`, which uses `temporary_longitude`.
+        coordinate_reference_system (Union[str, Tuple[str, str]]):
+            If a string, it specifies the coordinate reference system to use (default: 'EPSG:4326').
+            If a tuple (source_crs, target_crs), it defines a conversion from the source CRS to the target CRS (default target CRS: 'EPSG:4326').
+        bands (Optional[List[int]]): Indexes of the bands to read, starting at 1. Default: `None`, which reads
+            every band, or only the bands the pipeline needs when columns are pushed down.
+        band_names (Optional[List[str]]): Column name of each band read. Default: `None`, which uses the bands'
+            descriptions, or `band_<index>` for bands without one.
+        bbox (Optional[Tuple[float, float, float, float]]): Only read the pixels within this
+            (`minx`, `miny`, `maxx`, `maxy`) box, expressed in the raster's coordinate reference system. Default: `None`
+        chunksize (Optional[int]): Number of pixels read at a time when streaming, rounded to whole blocks.
+            Default: `None`
+        max_memory (Optional[Union[int, str]]): Peak working memory of the blocks being read, in bytes or as a
+            size such as `"2GB"`, which sets the number of pixels read at a time when `chunksize` does not.
+            Default: `None`
+        max_workers (Optional[int]): Number of groups of blocks read concurrently. Default: `None`, which
+            uses the number of CPUs.
+        target_resolution (Optional[Union[int, float]]): Resolution the pixels are needed at, in the raster's
+            units, which reads the closest internal overview no coarser than it. Default: `None`, which reads
+            the full resolution.
+
+    Examples:
+        >>> from urban_mapper.modules.loader import RasterLoader
+        >>>
+        >>> # Land surface temperature of a neighbourhood, out of a citywide raster
+        >>> loader = RasterLoader(
+        ...     file_path="land_surface_temperature.tif",
+        ...     band_names=["temperature"],
+        ...     bbox=(583000, 4506000, 587000, 4510000)
+        ... )
+        >>> gdf = loader.load_data_from_file()
+    """
+
+    generates_coordinates = True
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        latitude_column: Optional[str] = None,
+        longitude_column: Optional[str] = None,
+        geometry_column: Optional[str] = None,
+        coordinate_reference_system: Union[str, Tuple[str, str]] = DEFAULT_CRS,
+        bands: Optional[List[int]] = None,
+        band_names: Optional[List[str]] = None,
+        bbox: Optional[Tuple[Union[int, float], ...]] = None,
+        max_memory: Optional[Union[int, str]] = None,
+        max_workers: Optional[int] = None,
+        target_resolution: Optional[Union[int, float]] = None,
+        **additional_loader_parameters: Any,
+    ) -> None:
+        if (
+            bands is not None
+            and band_names is not None
+            and len(bands) != len(band_names)
+        ):
+            raise ValueError(
+                f"band_names must name every band read, got {len(band_names)} names for {len(bands)} bands."
+            )
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(
+                f"max_workers must be a positive integer, got {max_workers}."
+            )
+        if target_resolution is not None and target_resolution <= 0:
+            raise ValueError(
+                f"target_resolution must be positive, got {target_resolution}."
+            )
+        super().__init__(
+            file_path=file_path,
+            latitude_column=latitude_column,
+            longitude_column=longitude_column,
+            geometry_column=geometry_column,
+            coordinate_reference_system=coordinate_reference_system,
+            **additional_loader_parameters,
+        )
+        self.latitude_column = self.latitude_column or "temporary_latitude"
+        self.longitude_column = self.longitude_column or "temporary_longitude"
+        self.bands = bands
+        self.band_names = band_names
+        self.bbox = bbox
+        self.max_memory = max_memory
+        self.max_workers = max_workers
+        self.target_resolution = target_resolution
+        # Band descriptions of the full resolution, which overviews do not carry.
+        self._band_descriptions: Optional[Tuple[Optional[str], ...]] = None
+
+    def _load_data_from_file(self) -> gpd.GeoDataFrame:
+        """Load the valid pixels of the raster's window of interest as points.
+
+        Returns:
+            A `GeoDataFrame` with one point per valid pixel, in the target coordinate reference system.
+
+        Raises:
+            ValueError: If `band_names` does not name every band read.
+            rasterio.errors.RasterioIOError: If the file cannot be read.
+        """
+        if self.chunksize is not None or self.max_memory is not None:
+            return pd.concat(
+                self._load_data_from_file_chunks(self.chunksize), ignore_index=True
+            )
+        with open_raster(self.file_path, self._overview_level()) as dataset:
+            window = self._window(dataset)
+            band_indexes = self._band_indexes(dataset)
+            if window is None:
+                return self._empty_geodataframe(dataset, band_indexes)
+            logger.log(
+                "DEBUG_LOW",
+                f"RasterLoader: reading a {window.width}x{window.height} window of "
+                f"the {dataset.width}x{dataset.height} pixels of {self.file_path}",
+            )
+            return self._pixels_to_geodataframe(dataset, band_indexes, window)
+
+    def _load_data_from_file_chunks(
+        self, chunksize: Optional[int] = None
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Load the valid pixels of the raster's window of interest, group of blocks by group of blocks.
+
+        The window is split into groups of whole internal blocks holding about `chunksize`
+        pixels, so that each read maps onto the raster's tiling, and the groups are read in a
+        pool of `max_workers` threads. Chunks are yielded in the order of the window's rows.
+
+        Args:
+            chunksize: Number of pixels per chunk. Default: `None`, which derives it from
+                `max_memory` if set, or uses `DEFAULT_CHUNKSIZE`.
+
+        Yields:
+            `GeoDataFrame` chunks, one point per valid pixel of the group of blocks.
+        """
+        level = self._overview_level()
+        with open_raster(self.file_path, level) as dataset:
+            window = self._window(dataset)
+            band_indexes = self._band_indexes(dataset)
+            if window is None:
+                yield self._empty_geodataframe(dataset, band_indexes)
+                return
+            if chunksize is None and self.max_memory is not None:
+                chunksize = block_window_pixels(
+                    self.max_memory,
+                    sum(
+                        np.dtype(dataset.dtypes[index - 1]).itemsize
+                        for index in band_indexes
+                    )
+                    + PIXEL_BYTES_OVERHEAD,
+                    self.max_workers or os.cpu_count() or 1,
+                )
+            windows = block_windows(dataset, window, chunksize or DEFAULT_CHUNKSIZE)
+        logger.log(
+            "DEBUG_LOW",
+            f"RasterLoader: reading {len(windows)} groups of blocks of {self.file_path}",
+        )
+        yield from map_block_windows(
+            self.file_path,
+            windows,
+            lambda dataset, block_window: self._pixels_to_geodataframe(
+                dataset, band_indexes, block_window
+            ),
+            self.max_workers,
+            level,
+        )
+
+    def _probe_schema(self) -> Dict[str, Any]:
+        """Probe the bands, size and extent of the raster from its header.
+
+        Returns:
+            The `columns` (one per band, plus the generated coordinates and `geometry`), the
+            `row_count` (the number of pixels of the window of interest, flagged by
+            `row_count_is_estimate` as `nodata` pixels are only known once read), the `crs`,
+            and the `bounding_box`, in the raster's own coordinate reference system.
+        """
+        with open_raster(self.file_path, self._overview_level()) as dataset:
+            band_indexes = self._band_indexes(dataset)
+            columns = {
+                name: str(dataset.dtypes[index - 1])
+                for index, name in zip(
+                    band_indexes, self._column_names(dataset, band_indexes)
+                )
+            }
+            columns.update(
+                {
+                    self.longitude_column: "double",
+                    self.latitude_column: "double",
+                    "geometry": "geometry",
+                }
+            )
+            window = self._window(dataset)
+            return {
+                "columns": columns,
+                "row_count": window.width * window.height if window is not None else 0,
+                "row_count_is_estimate": True,
+                "crs": crs_name(self._raster_crs(dataset)),
+                "bounding_box": tuple(dataset.bounds),
+            }
+
+    def _overview_level(self) -> Optional[int]:
+        """Pick the internal overview matching `target_resolution`.
+
+        Returns:
+            The index of the overview to read, or `None` for the full resolution.
+        """
+        if self.target_resolution is None:
+            return None
+        with rasterio.open(self.file_path) as dataset:
+            self._band_descriptions = dataset.descriptions
+            level = overview_level(
+                dataset, self.target_resolution, self._band_indexes(dataset)[0]
+            )
+        logger.log(
+            "DEBUG_LOW",
+            f"RasterLoader: reading overview {level} of {self.file_path} "
+            f"for a {self.target_resolution} resolution",
+        )
+        return level
+
+    def _window(self, dataset: Any) -> Optional[Window]:
+        """Work out the window of pixels covering the area of interest.
+
+        Args:
+            dataset: The open `rasterio` dataset.
+
+        Returns:
+            The window, snapped outwards to whole pixels and clipped to the raster, the whole
+            raster if there is no area of interest, or `None` if they do not intersect.
+        """
+        bounding_box = self.bbox
+        if bounding_box is None and self.bounding_box is not None:
+            bounding_box = self._pushdown_bounding_box(dataset)
+        return raster_window(dataset, bounding_box)
+
+    def _pushdown_bounding_box(self, dataset: Any) -> Tuple[float, float, float, float]:
+        """Express the pushed down bounding box in the raster's coordinate reference system."""
+        raster_crs = self._raster_crs(dataset)
+        if self.bounding_box_crs is None or CRS.from_user_input(
+            self.bounding_box_crs
+        ) == CRS.from_user_input(raster_crs):
+            return self.bounding_box
+        transformer = cached_transformer(self.bounding_box_crs, raster_crs)
+        return tuple(transformer.transform_bounds(*self.bounding_box))
+
+    def _raster_crs(self, dataset: Any) -> Any:
+        """Get the raster's own coordinate reference system, or the source one if it has none."""
+        if dataset.crs is not None:
+            return dataset.crs.to_string()
+        if isinstance(self.coordinate_reference_system, tuple):
+            return self.coordinate_reference_system[0]
+        return self.coordinate_reference_system
+
+    def _band_indexes(self, dataset: Any) -> List[int]:
+        """List the bands to read, only keeping the pushed down ones if any is named."""
+        band_indexes = self.bands or list(dataset.indexes)
+        if self.required_columns is None:
+            return band_indexes
+        required_indexes = [
+            index
+            for index, name in zip(
+                band_indexes, self._column_names(dataset, band_indexes)
+            )
+            if name in self.required_columns
+        ]
+        return required_indexes or band_indexes
+
+    def _column_names(self, dataset: Any, band_indexes: List[int]) -> List[str]:
+        """Name the column of each band read."""
+        all_indexes = self.bands or list(dataset.indexes)
+        if self.band_names is not None:
+            if len(self.band_names) != len(all_indexes):
+                raise ValueError(
+                    f"band_names must name every band read, got {len(self.band_names)} names "
+                    f"for {len(all_indexes)} bands."
+                )
+            names = dict(zip(all_indexes, self.band_names))
+            return [names[index] for index in band_indexes]
+        descriptions = self._band_descriptions or dataset.descriptions
+        return [descriptions[index - 1] or f"band_{index}" for index in band_indexes]
+
+    def _pixels_to_geodataframe(
+        self, dataset: Any, band_indexes: List[int], window: Window
+    ) -> gpd.GeoDataFrame:
+        """Read a window and turn its valid pixels into points, in bulk.
+
+        Args:
+            dataset: The open `rasterio` dataset.
+            band_indexes: The bands to read.
+            window: The window of pixels to read.
+
+        Returns:
+            A `GeoDataFrame` with one point per valid pixel, in the target coordinate reference system.
+        """
+        data = dataset.read(band_indexes, window=window)
+        valid = valid_pixel_mask(
+            data, [dataset.nodatavals[index - 1] for index in band_indexes]
+        )
+        rows, columns = np.nonzero(valid)
+        x, y = pixel_centres(dataset.window_transform(window), rows, columns)
+        del rows, columns
+        raster_crs, target_crs = self._raster_crs(dataset), self._target_crs()
+        if CRS.from_user_input(raster_crs) != CRS.from_user_input(target_crs):
+            x, y = cached_transformer(raster_crs, target_crs).transform(x, y)
+        dataframe = pd.DataFrame(
+            {
+                name: band[valid]
+                for name, band in zip(self._column_names(dataset, band_indexes), data)
+            }
+        )
+        del data, valid
+        dataframe[self.longitude_column] = x
+        dataframe[self.latitude_column] = y
+        return gpd.GeoDataFrame(
+            dataframe, geometry=points_from_coordinates(x, y, target_crs), copy=False
+        )
+
+    def _empty_geodataframe(
+        self, dataset: Any, band_indexes: List[int]
+    ) -> gpd.GeoDataFrame:
+        """Build the empty result of a window not intersecting the raster."""
+        dataframe = pd.DataFrame(
+            {
+                name: np.array([], dtype=dataset.dtypes[index - 1])
+                for index, name in zip(
+                    band_indexes, self._column_names(dataset, band_indexes)
+                )
+            }
+        )
+        dataframe[self.longitude_column] = np.array([], dtype=float)
+        dataframe[self.latitude_column] = np.array([], dtype=float)
+        return gpd.GeoDataFrame(
+            dataframe, geometry=gpd.GeoSeries([], crs=self._target_crs())
+        )
+
+    def preview(self, format: str = "ascii") -> Any:
+        """Generate a preview of this raster loader.
+
+        Creates a summary representation of the loader for quick inspection.
+
+        Args:
+            format: The output format for the preview. Options include:
+
+                - [x] "ascii": Text-based format for terminal display
+                - [x] "json": JSON-formatted data for programmatic use
+
+        Returns:
+            A string or dictionary representing the loader, depending on the format.
+
+        Raises:
+            ValueError: If an unsupported format is requested.
+        """
+        bands = self.bands if self.bands else "All bands"
+        if format == "ascii":
+            return (
+                f"Loader: RasterLoader\n"
+                f"  File: {self.file_path}\n"
+                f"  Bands: {bands}\n"
+                f"  Band Names: {self.band_names or 'From the band descriptions'}\n"
+                f"  Latitude Column: {self.latitude_column}\n"
+                f"  Longitude Column: {self.longitude_column}\n"
+                f"  Bounding Box: {self.bbox}\n"
+                f"  Chunk Size: {self.chunksize or 'Whole window'}\n"
+                f"  Max Memory: {self.max_memory or 'Unbounded'}\n"
+                f"  Max Workers: {self.max_workers or 'Default'}\n"
+                f"  Target Resolution: {self.target_resolution or 'Full resolution'}\n"
+                f"  CRS: {self.coordinate_reference_system}\n"
+                f"  Additional params: {self.additional_loader_parameters}\n"
+            )
+        elif format == "json":
+            return {
+                "loader": "RasterLoader",
+                "file": self.file_path,
+                "bands": bands,
+                "band_names": self.band_names,
+                "latitude_column": self.latitude_column,
+                "longitude_column": self.longitude_column,
+                "bbox": self.bbox,
+                "chunksize": self.chunksize,
+                "max_memory": self.max_memory,
+                "max_workers": self.max_workers,
+                "target_resolution": self.target_resolution,
+                "crs": self.coordinate_reference_system,
+                "additional_params": self.additional_loader_parameters,
+            }
+        else:
+            raise ValueError(f"Unsupported format: {format}")
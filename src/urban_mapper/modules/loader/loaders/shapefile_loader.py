@@ -1,12 +1,11 @@
 from typing import Any
 
-import geopandas as gpd
 from beartype import beartype
-from urban_mapper.modules.loader.abc_loader import LoaderBase
+from urban_mapper.modules.loader.loaders.ogr_loader import OGRLoader
 
 
 @beartype
-class ShapefileLoader(LoaderBase):
+class ShapefileLoader(OGRLoader):
     """Loader for `shapefiles` containing spatial data.
 
     This loader reads data from `shapefiles` and returns a `GeoDataFrame`. Shapefiles
@@ -19,6 +18,11 @@ class ShapefileLoader(LoaderBase):
     automatically create temporary columns for latitude and longitude if they are not
     provided or if the specified columns contain only `NaN` values.
 
+    `Shapefiles` are read through `OGRLoader`, so the `bbox`, `mask`, `where` and `columns`
+    filters are available as well.
+    Zipped `shapefile` bundles, as handed out by open-data portals, are read in place
+    without being extracted.
+
     Attributes:
         file_path (Union[str, Path]): Path to the `shapefile` to load.
         latitude_column (Optional[str]): Name of the column containing latitude values. If not provided or empty,
@@ -47,53 +51,6 @@ class ShapefileLoader(LoaderBase):
         >>> gdf = loader.load_data_from_file()
     """
 
-    def _load_data_from_file(self) -> gpd.GeoDataFrame:
-        """Load data from a shapefile and return a `GeoDataFrame`.
-
-        This method reads a `shapefile` using geopandas, ensures it has a geometry column,
-        reprojects it to the specified `CRS` if necessary, and handles latitude and
-        longitude columns. If latitude and longitude columns are not provided or are
-        empty, it generates temporary columns using `representative points` of the geometries.
-
-        Returns:
-            A `GeoDataFrame` containing the loaded data with geometries and
-            latitude/longitude columns as specified or generated.
-
-        Raises:
-            ValueError: If no geometry column is found in the shapefile.
-            Exception: If the shapefile cannot be read (e.g., file not found or invalid format).
-        """
-        gdf = gpd.read_file(self.file_path)
-
-        if "geometry" not in gdf.columns:
-            raise ValueError(
-                "No geometry column found in shapefile. "
-                "Standard shapefile format requires a geometry column."
-            )
-
-        coord_system = (
-            self.coordinate_reference_system[0]
-            if isinstance(self.coordinate_reference_system, tuple)
-            else self.coordinate_reference_system
-        )
-
-        if gdf.crs.to_string() != coord_system:
-            gdf = gdf.to_crs(coord_system)
-
-        if (
-            not self.latitude_column
-            or not self.longitude_column
-            or gdf[self.latitude_column].isna().all()
-            or gdf[self.longitude_column].isna().all()
-        ):
-            gdf["representative_points"] = gdf.geometry.representative_point()
-            gdf["temporary_longitude"] = gdf["representative_points"].x
-            gdf["temporary_latitude"] = gdf["representative_points"].y
-            self.latitude_column = "temporary_latitude"
-            self.longitude_column = "temporary_longitude"
-
-        return gdf
-
     def preview(self, format: str = "ascii") -> Any:
         """Generate a preview of this `CSV` loader.
 
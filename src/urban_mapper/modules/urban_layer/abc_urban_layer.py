@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
 from typing import Tuple, List, Dict, Any, Union, Optional
 import geopandas as gpd
+import pandas as pd
 from beartype import beartype
 from pathlib import Path
 from urban_mapper.config import DEFAULT_CRS
-from urban_mapper.utils import require_attributes_not_none
+from urban_mapper.utils import require_attributes_not_none, defensive_copy
 from urban_mapper import logger
 
 
@@ -287,7 +288,7 @@ class UrbanLayerBase(ABC):
             mapping_kwargs.update(kwargs)
 
             if isinstance(data, gpd.GeoDataFrame):
-                result = self._map_nearest_layer(
+                result = self._map_nearest_layer_unless_empty(
                     data=data,
                     longitude_column=longitude_column,
                     latitude_column=latitude_column,
@@ -303,7 +304,7 @@ class UrbanLayerBase(ABC):
                     result[key] = gdf
 
                     if self.data_id is None or self.data_id == key:
-                        self.layer, mapped_data = self._map_nearest_layer(
+                        self.layer, mapped_data = self._map_nearest_layer_unless_empty(
                             data=gdf,
                             longitude_column=longitude_column,
                             latitude_column=latitude_column,
@@ -324,7 +325,17 @@ class UrbanLayerBase(ABC):
                 "No mappings defined. Use with_mapping() during layer creation."
             )
 
-        mapped_data = data.copy()
+        if isinstance(data, gpd.GeoDataFrame):
+            mapped_data = defensive_copy(data)
+        else:
+            mapped_data = {
+                key: (
+                    defensive_copy(gdf)
+                    if self.data_id is None or self.data_id == key
+                    else gdf
+                )
+                for key, gdf in data.items()
+            }
         for mapping in self.mappings:
             lon_col = mapping.get("longitude_column", None)
             lat_col = mapping.get("latitude_column", None)
@@ -351,7 +362,7 @@ class UrbanLayerBase(ABC):
                     "INFO: Last mapping, resetting urban layer's index.",
                 )
             if isinstance(mapped_data, gpd.GeoDataFrame):
-                self.layer, temp_mapped = self._map_nearest_layer(
+                self.layer, temp_mapped = self._map_nearest_layer_unless_empty(
                     data=mapped_data,
                     longitude_column=lon_col,
                     latitude_column=lat_col,
@@ -369,11 +380,12 @@ class UrbanLayerBase(ABC):
                     temp_mapped_data[key] = gdf
 
                     if self.data_id is None or self.data_id == key:
-                        self.layer, temp_mapped = self._map_nearest_layer(
-                            gdf,
-                            lon_col,
-                            lat_col,
-                            out_col,
+                        self.layer, temp_mapped = self._map_nearest_layer_unless_empty(
+                            data=gdf,
+                            longitude_column=lon_col,
+                            latitude_column=lat_col,
+                            geometry_column=geo_col,
+                            output_column=out_col,
                             _reset_layer_index=(
                                 mapping == self.mappings[-1] and key == last_key
                             ),
@@ -387,6 +399,39 @@ class UrbanLayerBase(ABC):
         self.has_mapped = True
         return self.layer, mapped_data
 
+    def _map_nearest_layer_unless_empty(
+        self,
+        data: gpd.GeoDataFrame,
+        output_column: Optional[str] = "nearest_element",
+        **kwargs,
+    ) -> Tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]:
+        """Map points with `_map_nearest_layer`, unless there is none to map.
+
+        Empty data, e.g. an incremental load with nothing appended since the previous run, is
+        given an empty `output_column` and the layer is left unchanged, so that the enrichers,
+        e.g. merging ones, still run. Some mapping steps, such as estimating a `UTM` zone from
+        the data, cannot run on empty data.
+
+        Args:
+            data: `GeoDataFrame` with points to map.
+            output_column: Column name for mapping results.
+            **kwargs: Parameters passed on to `_map_nearest_layer`.
+
+        Returns:
+            Tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]: Updated urban layer and mapped data.
+        """
+        if data.empty:
+            logger.log(
+                "DEBUG_LOW",
+                f"No records to map to '{output_column}', leaving the layer unchanged.",
+            )
+            mapped_data = defensive_copy(data)
+            mapped_data[output_column] = pd.Series(
+                index=mapped_data.index, dtype="float64"
+            )
+            return self.layer, mapped_data
+        return self._map_nearest_layer(data=data, output_column=output_column, **kwargs)
+
     @abstractmethod
     def preview(self, format: str = "ascii") -> Any:
         """Generate a preview of this urban layer.
@@ -5,7 +5,7 @@ from beartype import beartype
 
 from urban_mapper.config import DEFAULT_CRS
 from ..abc_urban_layer import UrbanLayerBase
-from urban_mapper.utils import require_attributes_not_none
+from urban_mapper.utils import require_attributes_not_none, defensive_copy
 
 
 @beartype
@@ -197,7 +197,7 @@ class CustomUrbanLayer(UrbanLayerBase):
               calculations.
             - [x] Any duplicate indices in the result are removed to ensure a clean result.
         """
-        dataframe = data.copy()
+        dataframe = defensive_copy(data)
 
         if dataframe.active_geometry_name is None:
             if geometry_column is None:
@@ -215,31 +215,35 @@ class CustomUrbanLayer(UrbanLayerBase):
                     crs=self.coordinate_reference_system,
                 )
 
+        # Only the geometry is projected and joined; the other columns are
+        # never duplicated, keeping the peak memory close to the data size.
         if not dataframe.crs.is_projected:
             utm_crs = dataframe.estimate_utm_crs()
-            dataframe = dataframe.to_crs(utm_crs)
+            dataframe[dataframe.active_geometry_name] = dataframe.geometry.to_crs(
+                utm_crs
+            )
             layer_projected = self.layer.to_crs(utm_crs)
         else:
             layer_projected = self.layer
 
-        mapped_data = gpd.sjoin_nearest(
-            dataframe,
+        nearest = gpd.sjoin_nearest(
+            gpd.GeoDataFrame(geometry=dataframe.geometry),
             layer_projected[["geometry"]],
             how="left",
             max_distance=threshold_distance,
-            distance_col="distance_to_feature",
-        )
-        mapped_data[output_column] = mapped_data.index_right
+        )["index_right"]
 
-        if mapped_data.index.duplicated().any():
-            mapped_data = mapped_data.reset_index(drop=True)
+        if nearest.index.duplicated().any():
+            mapped_data = dataframe.loc[nearest.index].reset_index(drop=True)
+            mapped_data[output_column] = nearest.to_numpy()
+        else:
+            mapped_data = dataframe
+            mapped_data[output_column] = nearest
 
         if _reset_layer_index:
             self.layer = self.layer.reset_index()
 
-        return self.layer, mapped_data.drop(
-            columns=["distance_to_feature", "index_right"], errors="ignore"
-        )
+        return self.layer, mapped_data
 
     @require_attributes_not_none(
         "layer",
@@ -3,7 +3,7 @@ import geopandas as gpd
 from pathlib import Path
 from beartype import beartype
 
-from urban_mapper.utils import require_attributes_not_none
+from urban_mapper.utils import require_attributes_not_none, defensive_copy
 
 from .admin_features_ import AdminFeatures
 from ..abc_urban_layer import UrbanLayerBase
@@ -346,7 +346,7 @@ class OSMFeatures(UrbanLayerBase):
               falls back to `DataFrame indices`.
             - [x] The method converts to a projected `CRS` for accurate distance calculations.
         """
-        dataframe = data.copy()
+        dataframe = defensive_copy(data)
 
         if dataframe.active_geometry_name is None:
             if geometry_column is None:
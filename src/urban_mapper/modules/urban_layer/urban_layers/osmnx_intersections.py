@@ -6,7 +6,7 @@ from pathlib import Path
 from shapely.geometry import Polygon, MultiPolygon
 import numpy as np
 
-from urban_mapper.utils import require_attributes_not_none
+from urban_mapper.utils import require_attributes_not_none, defensive_copy
 from .osmnx_streets import StreetNetwork
 from ..abc_urban_layer import UrbanLayerBase
 from ..helpers import extract_point_coord
@@ -319,7 +319,7 @@ class OSMNXIntersections(UrbanLayerBase):
             this method uses OSMnx's optimised nearest_nodes function which
             is specifically designed for network analysis.
         """
-        dataframe = data.copy()
+        dataframe = defensive_copy(data)
 
         if geometry_column is None:
             X = dataframe[longitude_column].values
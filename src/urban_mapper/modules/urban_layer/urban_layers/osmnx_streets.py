@@ -6,7 +6,7 @@ from pathlib import Path
 import numpy as np
 from shapely.geometry import Polygon, MultiPolygon
 from beartype import beartype
-from urban_mapper.utils import require_attributes_not_none
+from urban_mapper.utils import require_attributes_not_none, defensive_copy
 from ..abc_urban_layer import UrbanLayerBase
 from ..helpers import extract_point_coord
 
@@ -390,7 +390,7 @@ class OSMNXStreets(UrbanLayerBase):
                 - The street network `GeoDataFrame` (possibly with reset index)
                 - The input `GeoDataFrame` with the new output_column (filtered if threshold_distance is set)
         """
-        dataframe = data.copy()
+        dataframe = defensive_copy(data)
 
         if geometry_column is None:
             X = dataframe[longitude_column].values
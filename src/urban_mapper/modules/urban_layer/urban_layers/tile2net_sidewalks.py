@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Tuple, Any, Optional
 from beartype import beartype
 
-from urban_mapper.utils import require_attributes_not_none
+from urban_mapper.utils import require_attributes_not_none, defensive_copy
 from ..abc_urban_layer import UrbanLayerBase
 
 
@@ -137,7 +137,7 @@ class Tile2NetSidewalks(UrbanLayerBase):
             The method automatically converts the input data to a projected CRS if it’s not
             already projected, ensuring accurate distance calculations.
         """
-        dataframe = data.copy()
+        dataframe = defensive_copy(data)
 
         if dataframe.active_geometry_name is None:
             if longitude_column is not None and latitude_column is not None:
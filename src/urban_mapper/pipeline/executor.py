@@ -1,12 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Tuple, Optional, Any, List, Union, Dict
 import geopandas as gpd
 from beartype import beartype
 from urban_mapper.modules.loader import LoaderBase
 from urban_mapper.modules.imputer import GeoImputerBase
-from urban_mapper.modules.filter import GeoFilterBase
+from urban_mapper.modules.filter import GeoFilterBase, BoundingBoxFilter
 from urban_mapper.modules.enricher import EnricherBase
 from urban_mapper.modules.urban_layer.abc_urban_layer import UrbanLayerBase
 from urban_mapper.modules.visualiser import VisualiserBase
+from urban_mapper.utils import copy_on_write
 from alive_progress import alive_bar
 
 
@@ -22,6 +24,15 @@ class PipelineExecutor:
             List of (name, component) tuples representing the pipeline steps.
         data (Optional[gpd.GeoDataFrame]): Processed GeoDataFrame, populated after execution.
         urban_layer (Optional[UrbanLayerBase]): Enriched urban layer instance, set after execution.
+        pushdown (bool): Whether to push the columns and area needed by the steps down to the loaders,
+            so that they avoid reading what the pipeline would not use. Default: `False`
+        pushdown_buffer (Union[int, float]): Margin added around the urban layer's bounding box before it is
+            pushed down, in the units of the urban layer's coordinate reference system. Default: `0`
+        max_workers (Optional[int]): Number of loaders run concurrently. Loaders are independent and mostly
+            waiting on disk, so they are dispatched to a thread pool. Default: `None`, which lets
+            `concurrent.futures` pick; `1` loads the datasets one after the other.
+        copy_on_write (bool): Whether to run the steps under pandas' `Copy-on-Write` semantics, which turns the
+            defensive copies made by loaders, imputers and urban layers into shallow copies. Default: `False`
         _composed (bool): Indicates if the pipeline has been composed.
 
     Examples:
@@ -54,10 +65,26 @@ class PipelineExecutor:
                 ],
             ]
         ],
+        pushdown: bool = False,
+        pushdown_buffer: Union[int, float] = 0,
+        max_workers: Optional[int] = None,
+        copy_on_write: bool = False,
     ) -> None:
+        if pushdown_buffer < 0:
+            raise ValueError(
+                f"pushdown_buffer must be zero or positive, got {pushdown_buffer}."
+            )
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(
+                f"max_workers must be a positive integer, got {max_workers}."
+            )
         self.steps = steps
         self.data: Optional[Dict[str, gpd.GeoDataFrame]] = None
         self.urban_layer: Optional[UrbanLayerBase] = None
+        self.pushdown = pushdown
+        self.pushdown_buffer = pushdown_buffer
+        self.max_workers = max_workers
+        self.copy_on_write = copy_on_write
         self._composed: bool = False
 
     def compose(
@@ -103,23 +130,25 @@ class PipelineExecutor:
         if num_loaders == 0:
             raise ValueError("Pipeline must include exactly one LoaderBase step.")
 
-        with alive_bar(
-            total_steps,
-            title="Pipeline Progress",
-            force_tty=True,
-            dual_line=False,
-        ) as bar:
+        with (
+            copy_on_write(self.copy_on_write),
+            alive_bar(
+                total_steps,
+                title="Pipeline Progress",
+                force_tty=True,
+                dual_line=False,
+            ) as bar,
+        ):
             self.data = None if num_loaders == 1 else {}
 
-            for name, step in self.steps:
-                if isinstance(step, LoaderBase):
-                    bar()
-                    bar.title = f"~> Loading: {name}..."
+            if self.pushdown:
+                self._push_down_to_loaders(urban_layer_instance, num_loaders == 1)
 
-                    if num_loaders == 1:
-                        self.data = step.load_data_from_file()
-                    else:
-                        self.data[name] = step.load_data_from_file()
+            loaded_data = self._load_datasets(bar)
+            if num_loaders == 1:
+                self.data = next(iter(loaded_data.values()))
+            else:
+                self.data = loaded_data
 
             for name, step in self.steps:
                 if isinstance(step, GeoImputerBase):
@@ -151,6 +180,130 @@ class PipelineExecutor:
             bar()
             bar.title = f"🗺️ Successfully composed pipeline with {total_steps} steps!"
 
+    def _load_datasets(self, bar: Any) -> Dict[str, gpd.GeoDataFrame]:
+        """Run every loader step, concurrently, in a pool of `max_workers` threads.
+
+        Results are gathered in the order of the steps, whatever order loaders finish in.
+        If a loader fails, loaders not yet started are cancelled, and the error of the
+        first failing loader, in step order, is raised.
+
+        Args:
+            bar: The progress bar of the pipeline, ticked as each loader completes.
+
+        Returns:
+            The loaded datasets, keyed by loader step name, in step order.
+        """
+        loaders = [
+            (name, step) for name, step in self.steps if isinstance(step, LoaderBase)
+        ]
+        bar.title = f"~> Loading: {', '.join(name for name, _ in loaders)}..."
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                name: executor.submit(step.load_data_from_file)
+                for name, step in loaders
+            }
+            names = {future: name for name, future in futures.items()}
+            for future in as_completed(futures.values()):
+                if future.exception() is not None:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    break
+                bar()
+                bar.title = f"~> Loaded: {names[future]}"
+        for future in futures.values():
+            if not future.cancelled() and future.exception() is not None:
+                raise future.exception()
+        return {name: future.result() for name, future in futures.items()}
+
+    def _push_down_to_loaders(
+        self, urban_layer_instance: UrbanLayerBase, single_loader: bool
+    ) -> None:
+        """Tell each loader which columns and which area the pipeline steps need.
+
+        Columns are gathered from the imputers (coordinate, geometry and address columns),
+        the urban layer mappings and the enrichers (`group_by` / `values_from`), honouring
+        their `data_id`. The urban layer's bounding box, widened by `pushdown_buffer`, is
+        only pushed down to loaders a `BoundingBoxFilter` applies to and no imputer applies
+        to, so that no row the pipeline would have kept is skipped. Loaders then drop the
+        rows outside of it before building their geometries.
+
+        Args:
+            urban_layer_instance: The urban layer of the pipeline.
+            single_loader: Whether the pipeline holds a single loader, in which case
+                `data_id` restrictions do not apply.
+        """
+
+        def applies_to(data_id: Optional[str], loader_name: str) -> bool:
+            return single_loader or data_id is None or data_id == loader_name
+
+        for loader_name, loader in self.steps:
+            if not isinstance(loader, LoaderBase):
+                continue
+
+            required_columns = set()
+            has_imputer = False
+            has_bounding_box_filter = False
+            for _, step in self.steps:
+                if isinstance(step, GeoImputerBase) and applies_to(
+                    step.data_id, loader_name
+                ):
+                    has_imputer = True
+                    required_columns.update(
+                        [
+                            step.latitude_column,
+                            step.longitude_column,
+                            step.geometry_column,
+                            getattr(step, "address_column", None),
+                        ]
+                    )
+                elif isinstance(step, BoundingBoxFilter) and applies_to(
+                    step.data_id, loader_name
+                ):
+                    has_bounding_box_filter = True
+                elif isinstance(step, EnricherBase) and applies_to(
+                    step.config.data_id, loader_name
+                ):
+                    required_columns.update(step.config.group_by or [])
+                    required_columns.update(step.config.values_from or [])
+
+            if applies_to(urban_layer_instance.data_id, loader_name):
+                for mapping in urban_layer_instance.mappings:
+                    required_columns.update(
+                        [
+                            mapping.get("longitude_column"),
+                            mapping.get("latitude_column"),
+                            mapping.get("geometry_column"),
+                        ]
+                    )
+            required_columns.discard(None)
+
+            map_columns = loader.additional_loader_parameters.get("map_columns") or {}
+            source_names = {target: source for source, target in map_columns.items()}
+            bounding_box = None
+            if (
+                has_bounding_box_filter
+                and not has_imputer
+                and hasattr(urban_layer_instance, "get_layer_bounding_box")
+            ):
+                minx, miny, maxx, maxy = (
+                    float(value)
+                    for value in urban_layer_instance.get_layer_bounding_box()
+                )
+                bounding_box = (
+                    minx - self.pushdown_buffer,
+                    miny - self.pushdown_buffer,
+                    maxx + self.pushdown_buffer,
+                    maxy + self.pushdown_buffer,
+                )
+            loader.with_pushdown(
+                required_columns=sorted(
+                    source_names.get(column, column) for column in required_columns
+                ),
+                bounding_box=bounding_box,
+                bounding_box_crs=urban_layer_instance.layer.crs
+                if bounding_box is not None
+                else None,
+            )
+
     def transform(
         self,
     ) -> Tuple[
@@ -83,6 +83,15 @@ class UrbanPipeline:
             List of (name, component) tuples defining pipeline steps.
         validator (PipelineValidator): Validates step compatibility.
         executor (PipelineExecutor): Executes the pipeline steps.
+        pushdown (bool): Whether loaders should only read the columns, and the area, the pipeline's steps
+            need. Loaders not supporting it read everything, as usual. Default: `False`
+        pushdown_buffer (Union[int, float]): Margin added around the urban layer's bounding box pushed down to
+            the loaders, in the units of the urban layer's coordinate reference system. Rows within the margin
+            are read, then left to the `BoundingBoxFilter`. Default: `0`
+        max_workers (Optional[int]): Number of loaders run concurrently when the pipeline holds several datasets.
+            Default: `None`, which lets `concurrent.futures` pick; `1` loads them one after the other.
+        copy_on_write (bool): Whether to run the pipeline under pandas' `Copy-on-Write` semantics, so that
+            datasets are no longer copied defensively at every step, while the inputs stay unmodified. Default: `False`
 
     Examples:
         >>> import urban_mapper as um
@@ -97,6 +106,18 @@ class UrbanPipeline:
         >>> pipeline = UrbanPipeline(steps)
         >>> data, layer = pipeline.compose_transform()
         >>> pipeline.visualise(["pickup_count"])
+        >>>
+        >>> # Only read what the steps need from wide Parquet files
+        >>> pipeline = UrbanPipeline(steps, pushdown=True)
+        >>>
+        >>> # Also read rows up to 0.01 degrees around the urban layer
+        >>> pipeline = UrbanPipeline(steps, pushdown=True, pushdown_buffer=0.01)
+        >>>
+        >>> # Load at most four datasets at the same time
+        >>> pipeline = UrbanPipeline(steps, max_workers=4)
+        >>>
+        >>> # Production mode: no defensive copies of the datasets
+        >>> pipeline = UrbanPipeline(steps, copy_on_write=True)
 
     """
 
@@ -119,11 +140,25 @@ class UrbanPipeline:
                 ]
             ],
         ] = None,
+        pushdown: bool = False,
+        pushdown_buffer: Union[int, float] = 0,
+        max_workers: Optional[int] = None,
+        copy_on_write: bool = False,
     ) -> None:
         self.steps = steps
+        self.pushdown = pushdown
+        self.pushdown_buffer = pushdown_buffer
+        self.max_workers = max_workers
+        self.copy_on_write = copy_on_write
         if steps:
             self.validator = PipelineValidator(steps)
-            self.executor = PipelineExecutor(steps)
+            self.executor = PipelineExecutor(
+                steps,
+                pushdown=pushdown,
+                pushdown_buffer=pushdown_buffer,
+                max_workers=max_workers,
+                copy_on_write=copy_on_write,
+            )
 
     @require_attributes_not_none("steps")
     @property
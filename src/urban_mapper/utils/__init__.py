@@ -8,6 +8,24 @@ from .helpers import (
     require_attribute_none,
     file_exists,
     require_either_or_attributes,
+    parse_byte_size,
+    copy_on_write,
+    copy_on_write_enabled,
+    defensive_copy,
+    import_duckdb,
+    cached_transformer,
+    raster_window,
+    bounds_window,
+    valid_pixel_mask,
+    pixel_centres,
+    read_pixels,
+    block_window_pixels,
+    block_windows,
+    map_block_windows,
+    open_raster,
+    overview_level,
+    feature_resolution,
+    build_overviews,
 )
 from .lazy_mixin import LazyMixin
 
@@ -22,4 +40,22 @@ __all__ = [
     "file_exists",
     "LazyMixin",
     "require_either_or_attributes",
+    "parse_byte_size",
+    "copy_on_write",
+    "copy_on_write_enabled",
+    "defensive_copy",
+    "import_duckdb",
+    "cached_transformer",
+    "raster_window",
+    "bounds_window",
+    "valid_pixel_mask",
+    "pixel_centres",
+    "read_pixels",
+    "block_window_pixels",
+    "block_windows",
+    "map_block_windows",
+    "open_raster",
+    "overview_level",
+    "feature_resolution",
+    "build_overviews",
 ]
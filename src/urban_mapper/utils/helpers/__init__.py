@@ -7,6 +7,24 @@ from .require_single_attribute_value import require_single_attribute_value
 from .require_attribute_none import require_attribute_none
 from .file_exists import file_exists
 from .require_either_or_attributes import require_either_or_attributes
+from .parse_byte_size import parse_byte_size
+from .copy_on_write import copy_on_write, copy_on_write_enabled, defensive_copy
+from .import_duckdb import import_duckdb
+from .cached_transformer import cached_transformer
+from .raster_overviews import (
+    open_raster,
+    overview_level,
+    feature_resolution,
+    build_overviews,
+)
+from .raster_blocks import block_window_pixels, block_windows, map_block_windows
+from .raster_pixels import (
+    raster_window,
+    bounds_window,
+    valid_pixel_mask,
+    pixel_centres,
+    read_pixels,
+)
 
 __all__ = [
     "require_attributes",
@@ -18,4 +36,22 @@ __all__ = [
     "require_attribute_none",
     "file_exists",
     "require_either_or_attributes",
+    "parse_byte_size",
+    "copy_on_write",
+    "copy_on_write_enabled",
+    "defensive_copy",
+    "import_duckdb",
+    "cached_transformer",
+    "raster_window",
+    "bounds_window",
+    "valid_pixel_mask",
+    "pixel_centres",
+    "read_pixels",
+    "block_window_pixels",
+    "block_windows",
+    "map_block_windows",
+    "open_raster",
+    "overview_level",
+    "feature_resolution",
+    "build_overviews",
 ]
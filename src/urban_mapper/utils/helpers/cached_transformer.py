@@ -0,0 +1,35 @@
+from functools import lru_cache
+from typing import Any
+
+from pyproj import Transformer
+
+TRANSFORMER_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=TRANSFORMER_CACHE_SIZE)
+def cached_transformer(source_crs: Any, target_crs: Any) -> Transformer:
+    """Get a `pyproj` `Transformer` between two coordinate reference systems, built once.
+
+    Building a `Transformer` means looking the operation up in `PROJ`'s database, which
+    costs far more than transforming a few thousand coordinates. Transformers are thus
+    kept per (`source_crs`, `target_crs`) pair, and shared by every loader, imputer and
+    pushed-down bounding box of the process. They use the traditional `x`, `y` (longitude, latitude) order.
+
+    !!! note "Threads"
+        `pyproj` transformers are thread-safe, so that a cached one can be shared by
+        the loaders of a `PartitionedLoader`.
+
+    Args:
+        source_crs: Coordinate reference system of the input coordinates, in any form
+            `pyproj` accepts (e.g. `"EPSG:4326"`). Must be hashable.
+        target_crs: Coordinate reference system to transform the coordinates to.
+
+    Returns:
+        The `Transformer`, with `always_xy=True`.
+
+    Examples:
+        >>> from urban_mapper.utils import cached_transformer
+        >>> transformer = cached_transformer("EPSG:4326", "EPSG:3857")
+        >>> x, y = transformer.transform(longitudes, latitudes)
+    """
+    return Transformer.from_crs(source_crs, target_crs, always_xy=True)
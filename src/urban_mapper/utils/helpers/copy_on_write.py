@@ -0,0 +1,61 @@
+from contextlib import contextmanager
+from typing import Iterator, TypeVar
+
+import pandas as pd
+from beartype import beartype
+
+DataFrameType = TypeVar("DataFrameType", bound=pd.DataFrame)
+
+PANDAS_ALWAYS_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3
+
+
+@beartype
+def copy_on_write_enabled() -> bool:
+    """Tell whether pandas' `Copy-on-Write` semantics are active.
+
+    Returns:
+        `True` with pandas 3 and later, or when enabled through `copy_on_write()` or
+        `pd.set_option("mode.copy_on_write", True)`.
+    """
+    return PANDAS_ALWAYS_COPY_ON_WRITE or pd.get_option("mode.copy_on_write") is True
+
+
+@contextmanager
+def copy_on_write(enabled: bool = True) -> Iterator[None]:
+    """Enable pandas' `Copy-on-Write` semantics for the duration of the block.
+
+    Under `Copy-on-Write`, a copy shares its data with the original until either of them is
+    modified, and only the modified columns are then copied. Defensive copies, made to keep
+    inputs unmodified, thus become (almost) free. See `defensive_copy()`.
+
+    Args:
+        enabled: Whether to enable `Copy-on-Write`. `False` leaves pandas' mode untouched. Default: `True`
+
+    Examples:
+        >>> from urban_mapper.utils import copy_on_write
+        >>> with copy_on_write():
+        ...     gdf = mapper.loader.from_dataframe(df).with_columns("lon", "lat").load()
+    """
+    if not enabled or PANDAS_ALWAYS_COPY_ON_WRITE:
+        yield
+        return
+    with pd.option_context("mode.copy_on_write", True):
+        yield
+
+
+@beartype
+def defensive_copy(data: DataFrameType) -> DataFrameType:
+    """Copy a dataframe about to be modified, so that the caller's one stays untouched.
+
+    With `Copy-on-Write` active, the copy is shallow, and pandas only copies the columns
+    actually modified later on. Otherwise, the whole dataframe is copied.
+
+    Args:
+        data: The dataframe, or `GeoDataFrame`, to copy.
+
+    Returns:
+        A copy of `data`, safe to modify.
+    """
+    if copy_on_write_enabled():
+        return data.copy(deep=False)
+    return data.copy()
@@ -1,3 +1,4 @@
+import glob
 from functools import wraps
 from pathlib import Path
 
@@ -10,7 +11,7 @@ def file_exists(attr_name: str):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
             path = getattr(self, attr_name)
-            if not Path(path).exists():
+            if not Path(path).exists() and not glob.glob(str(path), recursive=True):
                 raise FileNotFoundError(f"File '{path}' does not exist.")
             return func(self, *args, **kwargs)
 
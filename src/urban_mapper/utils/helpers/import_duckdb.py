@@ -0,0 +1,19 @@
+from types import ModuleType
+
+
+def import_duckdb() -> ModuleType:
+    """Import `duckdb`, an optional dependency, when a feature first needs it.
+
+    Returns:
+        The `duckdb` module.
+
+    Raises:
+        ImportError: If `duckdb` is not installed.
+    """
+    try:
+        import duckdb
+    except ImportError as error:
+        raise ImportError(
+            "duckdb is required for this functionality. Install it with `uv add duckdb`."
+        ) from error
+    return duckdb
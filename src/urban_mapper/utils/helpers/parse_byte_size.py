@@ -0,0 +1,48 @@
+import re
+from typing import Union
+
+from beartype import beartype
+
+BYTE_SIZE_UNITS = {
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024**2,
+    "GB": 1024**3,
+    "TB": 1024**4,
+}
+
+
+@beartype
+def parse_byte_size(size: Union[int, str]) -> int:
+    """Parse a human-readable size such as `"512MB"` or `"2 GB"` into a number of bytes.
+
+    Units are binary (`1KB` is `1024` bytes) and case-insensitive. Integers are taken as bytes.
+
+    Args:
+        size: The size to parse.
+
+    Returns:
+        The size in bytes.
+
+    Raises:
+        ValueError: If the size is negative or cannot be parsed.
+
+    Examples:
+        >>> parse_byte_size("2GB")
+        2147483648
+    """
+    if isinstance(size, int):
+        number_of_bytes = size
+    else:
+        match = re.fullmatch(
+            r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?B)?\s*", size, flags=re.IGNORECASE
+        )
+        if match is None:
+            raise ValueError(
+                f"Invalid size '{size}'. Expected a number of bytes or a size such as '512MB' or '2GB'."
+            )
+        unit = (match.group(2) or "B").upper()
+        number_of_bytes = int(float(match.group(1)) * BYTE_SIZE_UNITS[unit])
+    if number_of_bytes < 0:
+        raise ValueError(f"Size must be positive, got {size}.")
+    return number_of_bytes
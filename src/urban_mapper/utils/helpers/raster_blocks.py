@@ -0,0 +1,144 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, TypeVar, Union
+
+from beartype import beartype
+from rasterio.windows import Window
+
+from .parse_byte_size import parse_byte_size
+from .raster_overviews import open_raster
+
+Result = TypeVar("Result")
+
+
+@beartype
+def block_window_pixels(
+    max_memory: Union[int, str], bytes_per_pixel: int, max_workers: int
+) -> int:
+    """Work out how many pixels each block window may hold to stay within a memory budget.
+
+    The budget is shared by the windows processed at the same time, i.e. two per worker:
+    the one being processed, and the one whose result awaits its consumer.
+
+    Args:
+        max_memory: The peak memory allowed, in bytes or as a size such as `"2GB"`.
+        bytes_per_pixel: Bytes of working memory each pixel of a window takes while processed.
+        max_workers: Number of windows processed concurrently.
+
+    Returns:
+        The number of pixels per window, at least one.
+    """
+    return max(
+        1, parse_byte_size(max_memory) // (bytes_per_pixel * 2 * max(max_workers, 1))
+    )
+
+
+@beartype
+def block_windows(dataset: Any, window: Window, max_pixels: int) -> List[Window]:
+    """Split a window of a raster into windows made of whole internal blocks.
+
+    Windows are aligned on the raster's block (tile or strip) grid, so that every block is
+    read by a single window, and hold at most `max_pixels` pixels, or a single block if
+    blocks are larger. Full-width strips of block rows are preferred, and rows of blocks are
+    split only when a single one exceeds `max_pixels`.
+
+    Args:
+        dataset: The open `rasterio` dataset.
+        window: The window to split, e.g. the raster's window of interest.
+        max_pixels: The largest number of pixels of a window.
+
+    Returns:
+        The windows, row by row of blocks, covering `window` exactly.
+    """
+    block_height, block_width = dataset.block_shapes[0]
+    row_start, column_start = int(window.row_off), int(window.col_off)
+    row_stop, column_stop = (
+        row_start + int(window.height),
+        column_start + int(window.width),
+    )
+    first_block_row = row_start // block_height
+    first_block_column = column_start // block_width
+    block_rows = -(-row_stop // block_height) - first_block_row
+    block_columns = -(-column_stop // block_width) - first_block_column
+    rows_per_window = max(1, max_pixels // (int(window.width) * block_height))
+    if rows_per_window > 1 or int(window.width) * block_height <= max_pixels:
+        columns_per_window = block_columns
+    else:
+        columns_per_window = max(1, max_pixels // (block_width * block_height))
+
+    windows = []
+    for block_row in range(0, block_rows, rows_per_window):
+        top = max(row_start, (first_block_row + block_row) * block_height)
+        bottom = min(
+            row_stop, (first_block_row + block_row + rows_per_window) * block_height
+        )
+        for block_column in range(0, block_columns, columns_per_window):
+            left = max(column_start, (first_block_column + block_column) * block_width)
+            right = min(
+                column_stop,
+                (first_block_column + block_column + columns_per_window) * block_width,
+            )
+            windows.append(Window(left, top, right - left, bottom - top))
+    return windows
+
+
+@beartype
+def map_block_windows(
+    file_path: Union[str, Path],
+    windows: List[Window],
+    function: Callable[[Any, Window], Result],
+    max_workers: Optional[int] = None,
+    overview_level: Optional[int] = None,
+) -> Iterator[Result]:
+    """Process windows of a raster in a pool of threads, yielding their results in order.
+
+    Each window is processed by `function(dataset, window)`, with a dataset opened by the
+    thread processing it, as `rasterio` datasets cannot be shared across threads. `GDAL`
+    releases the `GIL` while reading and decompressing blocks, and so does `NumPy` for most
+    array operations, so threads do run concurrently.
+
+    At most `max_workers` windows are processed at once, and the next window only starts
+    once the oldest result has been consumed, so that memory is bounded by about
+    `2 * max_workers` windows, whatever the size of the raster.
+
+    Args:
+        file_path: Path to the raster.
+        windows: The windows to process, e.g. from `block_windows()`.
+        function: The function processing a window, given the open dataset and the window.
+        max_workers: Number of windows processed concurrently. Default: `None`, which uses
+            the number of CPUs.
+        overview_level: Index of the internal overview the windows refer to, see
+            `open_raster()`. Default: `None`, for the full resolution.
+
+    Yields:
+        The result of `function` for each window, in the order of `windows`.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+
+    def process(window: Window) -> Result:
+        with open_raster(file_path, overview_level) as dataset:
+            return function(dataset, window)
+
+    if max_workers == 1:
+        for window in windows:
+            yield process(window)
+        return
+
+    remaining = iter(windows)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(
+            executor.submit(process, window)
+            for _, window in zip(range(max_workers), remaining)
+        )
+        try:
+            while pending:
+                result = pending.popleft().result()
+                for window in remaining:
+                    pending.append(executor.submit(process, window))
+                    break
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,133 @@
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+import numpy as np
+import rasterio
+import shapely
+from beartype import beartype
+from rasterio.enums import Resampling
+
+# Pixels across the typical feature when the resolution is derived from an urban layer.
+PIXELS_ACROSS_FEATURE = 10
+# Smallest side, in pixels, of the coarsest overview built by default.
+SMALLEST_OVERVIEW_SIZE = 256
+
+
+@beartype
+def open_raster(
+    file_path: Union[str, Path], overview_level: Optional[int] = None
+) -> Any:
+    """Open a raster, or one of its internal overviews, as a `rasterio` dataset.
+
+    An overview opens as a raster of its own: its size, affine transform and blocks are
+    those of the overview, so that windows, reads and pixel coordinates work unchanged.
+
+    Args:
+        file_path: Path to the raster.
+        overview_level: Index of the overview to open, `0` being the finest one, e.g. as
+            picked by `overview_level()`. Default: `None`, which opens the full resolution.
+
+    Returns:
+        The open dataset, to be closed by the caller, e.g. in a `with` block.
+    """
+    if overview_level is None:
+        return rasterio.open(file_path)
+    return rasterio.open(file_path, overview_level=overview_level)
+
+
+@beartype
+def overview_level(
+    dataset: Any, target_resolution: Union[int, float], band: int = 1
+) -> Optional[int]:
+    """Pick the coarsest internal overview that is still at least as fine as a target resolution.
+
+    Args:
+        dataset: The open `rasterio` dataset, at full resolution.
+        target_resolution: The resolution the analysis needs, in the raster's units, e.g. `100`
+            for a 100 m grid over a metric raster.
+        band: The band whose overviews are considered, starting at 1 (default: 1).
+
+    Returns:
+        The index of the overview to open with `open_raster()`, or `None` if the full resolution
+        is the closest, e.g. when the raster has no overview.
+    """
+    native_resolution = max(abs(dataset.res[0]), abs(dataset.res[1]))
+    level = None
+    for index, factor in enumerate(dataset.overviews(band)):
+        if native_resolution * factor <= target_resolution:
+            level = index
+    return level
+
+
+@beartype
+def feature_resolution(geometries: np.ndarray) -> Optional[float]:
+    """Derive an analysis resolution from the typical size of an urban layer's features.
+
+    The typical size is the median of the square root of the polygons' areas, or of the
+    lines' lengths for layers without polygons, and is covered by `PIXELS_ACROSS_FEATURE` pixels.
+
+    Args:
+        geometries: The features, in the raster's coordinate reference system.
+
+    Returns:
+        The resolution, in the raster's units, or `None` if no feature has a size.
+    """
+    areas = shapely.area(geometries)
+    sizes = np.sqrt(areas[areas > 0])
+    if not len(sizes):
+        lengths = shapely.length(geometries)
+        sizes = lengths[lengths > 0]
+    if not len(sizes):
+        return None
+    return float(np.median(sizes)) / PIXELS_ACROSS_FEATURE
+
+
+@beartype
+def build_overviews(
+    file_path: Union[str, Path],
+    factors: Optional[List[int]] = None,
+    resampling: str = "average",
+) -> List[int]:
+    """Build the internal overviews a raster lacks, in place.
+
+    Overviews are decimated copies of the raster, e.g. at 1/2, 1/4 and 1/8 of its resolution,
+    which let coarse analyses read orders of magnitude fewer pixels. `average` resampling keeps
+    every overview pixel the mean of the pixels it covers, `nodata` pixels left out, so that
+    means and area-weighted sums are preserved.
+
+    Args:
+        file_path: Path to the raster, which must be writable.
+        factors: Decimation factors to build, those the raster already has being skipped.
+            Default: `None`, which uses powers of two until the raster's smaller side falls
+            under `SMALLEST_OVERVIEW_SIZE` pixels.
+        resampling: Name of the `rasterio` resampling method (default: "average").
+
+    Returns:
+        The factors of the overviews the raster has afterwards.
+
+    Raises:
+        ValueError: If the resampling method is unknown.
+
+    Examples:
+        >>> from urban_mapper.utils import build_overviews
+        >>> build_overviews("land_surface_temperature.tif")
+        [2, 4, 8, 16, 32]
+    """
+    if resampling not in Resampling.__members__:
+        raise ValueError(
+            f"Unknown resampling '{resampling}'. Available: {', '.join(Resampling.__members__)}."
+        )
+    with rasterio.open(file_path, "r+") as dataset:
+        if factors is None:
+            factors = []
+            factor = 2
+            while (
+                min(dataset.width, dataset.height) // factor >= SMALLEST_OVERVIEW_SIZE
+            ):
+                factors.append(factor)
+                factor *= 2
+        factors = [factor for factor in factors if factor not in dataset.overviews(1)]
+        if factors:
+            dataset.build_overviews(factors, Resampling[resampling])
+            dataset.update_tags(ns="rio_overview", resampling=resampling)
+        return dataset.overviews(1)
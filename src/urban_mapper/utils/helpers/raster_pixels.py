@@ -0,0 +1,149 @@
+import math
+from typing import Any, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from affine import Affine
+from beartype import beartype
+from rasterio.windows import Window, from_bounds
+
+
+@beartype
+def raster_window(
+    dataset: Any, bounds: Optional[Sequence[Union[int, float]]] = None
+) -> Optional[Window]:
+    """Work out the window of a raster's pixels covering an area.
+
+    Args:
+        dataset: The open `rasterio` dataset.
+        bounds: The area as (`minx`, `miny`, `maxx`, `maxy`), in the raster's coordinate
+            reference system. Default: `None`, which covers the whole raster.
+
+    Returns:
+        The window, snapped outwards to whole pixels and clipped to the raster, or `None`
+        if the area does not intersect the raster.
+    """
+    if bounds is None:
+        return Window(0, 0, dataset.width, dataset.height)
+    return bounds_window(bounds, dataset.transform, dataset.width, dataset.height)
+
+
+@beartype
+def bounds_window(
+    bounds: Sequence[Union[int, float]], transform: Affine, width: int, height: int
+) -> Optional[Window]:
+    """Work out the window of a grid of pixels covering an area.
+
+    Args:
+        bounds: The area as (`minx`, `miny`, `maxx`, `maxy`), in the grid's coordinate
+            reference system.
+        transform: The affine transform of the grid, e.g. of a raster or of a window read.
+        width: Number of columns of the grid.
+        height: Number of rows of the grid.
+
+    Returns:
+        The window, snapped outwards to whole pixels and clipped to the grid, or `None`
+        if the area does not intersect the grid.
+    """
+    window = from_bounds(*bounds, transform=transform)
+    column_start = max(0, math.floor(window.col_off))
+    row_start = max(0, math.floor(window.row_off))
+    column_stop = min(width, math.ceil(window.col_off + window.width))
+    row_stop = min(height, math.ceil(window.row_off + window.height))
+    if column_stop <= column_start or row_stop <= row_start:
+        return None
+    return Window(
+        column_start, row_start, column_stop - column_start, row_stop - row_start
+    )
+
+
+@beartype
+def valid_pixel_mask(
+    data: np.ndarray, nodata_values: Sequence[Optional[float]]
+) -> np.ndarray:
+    """Mask the pixels holding a value in every band of a raster read.
+
+    Pixels equal to their band's `nodata` value are masked out, as are `NaN` pixels of
+    floating point bands, whether or not `NaN` is their declared `nodata` value.
+
+    Args:
+        data: The pixels, as read by `rasterio`, shaped (`bands`, `rows`, `columns`).
+        nodata_values: The `nodata` value of each band read, `None` for bands without one.
+
+    Returns:
+        A boolean array shaped (`rows`, `columns`), `True` for the valid pixels.
+    """
+    valid = np.ones(data.shape[1:], dtype=bool)
+    for band, nodata in zip(data, nodata_values):
+        if np.issubdtype(band.dtype, np.floating):
+            valid &= ~np.isnan(band)
+        if nodata is not None and not np.isnan(nodata):
+            valid &= band != nodata
+    return valid
+
+
+@beartype
+def pixel_centres(
+    transform: Affine, rows: np.ndarray, columns: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the coordinates of pixel centres from a raster's affine transform.
+
+    The transform is applied to whole arrays at once, never pixel by pixel.
+
+    Args:
+        transform: The affine transform of the raster, or of the window read.
+        rows: Row indices of the pixels, relative to the transform's origin.
+        columns: Column indices of the pixels, relative to the transform's origin.
+
+    Returns:
+        The `x` and `y` coordinates of the pixel centres, in the raster's coordinate reference system.
+    """
+    column_centres = columns + 0.5
+    row_centres = rows + 0.5
+    x = transform.a * column_centres + transform.b * row_centres + transform.c
+    y = transform.d * column_centres + transform.e * row_centres + transform.f
+    return x, y
+
+
+@beartype
+def read_pixels(
+    dataset: Any, band: int, rows: np.ndarray, columns: np.ndarray
+) -> np.ndarray:
+    """Read the values of scattered pixels of a raster band, reading each block once.
+
+    Pixels are grouped by the internal block (tile or strip) holding them, and each block
+    holding at least one of them is read a single time, however many pixels it holds.
+
+    Args:
+        dataset: The open `rasterio` dataset.
+        band: Index of the band to read, starting at 1.
+        rows: Row indices of the pixels, within the raster.
+        columns: Column indices of the pixels, within the raster.
+
+    Returns:
+        The values of the pixels, in the band's data type, in the order of `rows` and `columns`.
+    """
+    values = np.empty(len(rows), dtype=dataset.dtypes[band - 1])
+    if not len(rows):
+        return values
+    block_height, block_width = dataset.block_shapes[band - 1]
+    block_columns = -(-dataset.width // block_width)
+    blocks = rows // block_height * block_columns + columns // block_width
+    order = np.argsort(blocks, kind="stable")
+    block_ids, starts = np.unique(blocks[order], return_index=True)
+    for block, start, stop in zip(
+        block_ids.tolist(), starts.tolist(), [*starts[1:].tolist(), len(order)]
+    ):
+        row_off = block // block_columns * block_height
+        col_off = block % block_columns * block_width
+        data = dataset.read(
+            band,
+            window=Window(
+                col_off,
+                row_off,
+                min(block_width, dataset.width - col_off),
+                min(block_height, dataset.height - row_off),
+            ),
+        )
+        pixels = order[start:stop]
+        values[pixels] = data[rows[pixels] - row_off, columns[pixels] - col_off]
+    return values
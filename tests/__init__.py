@@ -0,0 +1 @@
+"""Tests suite for `urban_mapper`."""
@@ -0,0 +1,84 @@
+"""Memory accounting of the loading and mapping steps under copy-on-write."""
+
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+import shapely
+
+from urban_mapper.modules.loader import LoaderFactory
+from urban_mapper.modules.urban_layer.urban_layers import CustomUrbanLayer
+from urban_mapper.utils import copy_on_write
+
+ROWS = 200_000
+VALUE_COLUMNS = 8
+MAX_PEAK_RATIO = 2.0
+
+
+@pytest.fixture
+def dataframe() -> pd.DataFrame:
+    """A frame of known size with coordinates around Manhattan."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "lon": rng.uniform(-74.0, -73.9, ROWS),
+            "lat": rng.uniform(40.7, 40.8, ROWS),
+            **{f"value_{i}": rng.random(ROWS) for i in range(VALUE_COLUMNS)},
+        }
+    )
+
+
+@pytest.fixture
+def layer_path(tmp_path: Path) -> Path:
+    """A small layer of boxes covering the coordinates of `dataframe`."""
+    path = tmp_path / "layer.geojson"
+    boxes = [
+        shapely.box(-74.0 + i * 0.02, 40.7, -73.98 + i * 0.02, 40.8) for i in range(5)
+    ]
+    gpd.GeoDataFrame(geometry=boxes, crs="EPSG:4326").to_file(path)
+    return path
+
+
+def _traced_peak(func: Callable[[], Any]) -> tuple[Any, int]:
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def test_load_and_map_stay_within_twice_the_data_size(
+    dataframe: pd.DataFrame, layer_path: Path
+) -> None:
+    """Loading and mapping allocate at most about twice the input frame."""
+    size = dataframe.memory_usage(deep=True).sum()
+    original = dataframe.copy(deep=True)
+
+    with copy_on_write():
+        loaded, load_peak = _traced_peak(
+            lambda: LoaderFactory()
+            .from_dataframe(dataframe)
+            .with_columns(longitude_column="lon", latitude_column="lat")
+            .load()
+        )
+        layer = CustomUrbanLayer().from_file(layer_path)
+        (_, mapped), map_peak = _traced_peak(
+            lambda: layer.map_nearest_layer(
+                loaded,
+                longitude_column="lon",
+                latitude_column="lat",
+                output_column="nearest_feature",
+            )
+        )
+
+    assert load_peak < MAX_PEAK_RATIO * size
+    assert map_peak < MAX_PEAK_RATIO * size
+    assert len(mapped) == ROWS
+    assert mapped["nearest_feature"].notna().all()
+    pd.testing.assert_frame_equal(dataframe, original)